@@ -0,0 +1,345 @@
+"""Client-overhead benchmarks for the Decor8 AI SDK.
+
+Measures the CPU and memory the SDK itself spends per call: payload building,
+data-URL and multipart encoding, and decoding (large base64) responses. Every
+endpoint method runs against an in-memory transport that reads the whole
+request body and answers with a canned response shaped like the real API's
+(built by decor8ai.testing.MockAPIServer), so no network or server time is
+included. Image inputs and results are benchmarked at a small and a large size.
+
+For each case the runner reports operations per second, the mean time per
+call, the peak memory traced by tracemalloc during one call and the memory
+still held after the calls (which should stay near zero).
+
+Usage (from this directory, with the SDK importable):
+    python bench_client.py                                # run everything
+    python bench_client.py -k upscale                      # cases whose name contains "upscale"
+    python bench_client.py --save baseline.json            # record a baseline
+    python bench_client.py --compare baseline.json         # exit 1 on regressions
+
+Baselines are machine-specific: record one on the machine that compares
+against it. baseline.json in this directory records the Python version and
+platform it was taken on.
+"""
+
+import argparse
+import asyncio
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Set a dummy API key; nothing leaves the process.
+os.environ.setdefault('DECOR8AI_API_KEY', 'benchmark-key')
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from decor8ai import AsyncDecor8AI, Decor8AI
+from decor8ai.client import _load_image_bytes
+from decor8ai.constants import ENDPOINTS
+from decor8ai.dataurl import DataURLEncoder
+from decor8ai.multipart import MultipartEncoder
+from decor8ai.testing import MockAPIServer, fake_jpeg
+
+
+SIZES = {'small': 64 * 1024, 'large': 4 * 1024 * 1024}
+URL = 'https://example.com/rooms/living.jpg'
+READ_SIZE = 64 * 1024
+DEFAULT_DURATION = 1.0
+DEFAULT_TOLERANCE = 0.3
+MEMORY_CALLS = 5
+
+# Keyword arguments for each URL-based endpoint method.
+JSON_CALLS: Dict[str, Dict[str, Any]] = {
+    'generate_designs_for_room': {'input_image_url': URL, 'room_type': 'livingroom', 'design_style': 'modern', 'num_images': 4},
+    'generate_inspirational_designs': {'room_type': 'livingroom', 'design_style': 'modern', 'num_images': 4},
+    'prime_walls_for_room': {'input_image_url': URL},
+    'change_wall_color': {'input_image_url': URL, 'wall_color_hex_code': '#5A7D9A'},
+    'change_kitchen_cabinets_color': {'input_image_url': URL, 'cabinet_color_hex_code': '#5A7D9A'},
+    'remodel_kitchen': {'input_image_url': URL, 'design_style': 'modern', 'num_images': 4},
+    'remodel_bathroom': {'input_image_url': URL, 'design_style': 'modern', 'num_images': 4},
+    'replace_sky_behind_house': {'input_image_url': URL, 'sky_type': 'dusk'},
+    'generate_landscaping_designs': {'input_image_url': URL, 'yard_type': 'backyard', 'garden_style': 'japanese_zen', 'num_images': 4},
+    'remove_objects_from_room': {'input_image_url': URL},
+    'sketch_to_3d_render': {'input_image_url': URL, 'design_style': 'modern', 'num_images': 4},
+}
+
+# Keyword arguments for each upload endpoint method.
+UPLOAD_CALLS: Dict[str, Dict[str, Any]] = {
+    'generate_designs': {'room_type': 'livingroom', 'design_style': 'modern', 'num_images': 1},
+    'prime_the_room_walls': {},
+    'upscale_image': {'scale_factor': 2},
+}
+
+
+# -----------------------------------------------------------------------------
+# In-memory transports
+# -----------------------------------------------------------------------------
+
+def canned_responses(image_bytes: int) -> Dict[str, bytes]:
+    """Return a successful response body per endpoint path, with images of image_bytes."""
+    server = MockAPIServer(image_bytes=image_bytes)
+    calls = dict(JSON_CALLS, **UPLOAD_CALLS)
+    return {
+        path: json.dumps(server._respond(name, calls.get(name, {}))).encode('utf-8')
+        for name, path in ENDPOINTS.items()
+    }
+
+
+class InMemoryAdapter(BaseAdapter):
+    """requests transport adapter that consumes the request body and returns a canned response."""
+
+    def __init__(self, responses: Dict[str, bytes]):
+        super().__init__()
+        self.responses = responses
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = request.body
+        if hasattr(body, 'read'):
+            while body.read(READ_SIZE):
+                pass
+        elif body is not None and not isinstance(body, (bytes, str)):
+            for _ in body:
+                pass
+        payload = self.responses[urlparse(request.url).path]
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict({
+            'Content-Type': 'application/json',
+            'Content-Length': str(len(payload)),
+        })
+        response.raw = io.BytesIO(payload)
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        response.elapsed = datetime.timedelta(0)
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+def sync_client(responses: Dict[str, bytes], **options: Any) -> Decor8AI:
+    client = Decor8AI(**options)
+    adapter = InMemoryAdapter(responses)
+    client._session.mount('https://', adapter)
+    client._session.mount('http://', adapter)
+    return client
+
+
+def async_client(responses: Dict[str, bytes], **options: Any) -> AsyncDecor8AI:
+    async def handle(request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        return httpx.Response(200, content=responses[request.url.path], headers={'Content-Type': 'application/json'})
+
+    client = AsyncDecor8AI(**options)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    return client
+
+
+# -----------------------------------------------------------------------------
+# Cases
+# -----------------------------------------------------------------------------
+
+Case = Tuple[str, Callable[[], Callable[[], Any]]]
+
+
+def build_cases(workdir: str) -> List[Case]:
+    """Return (name, setup) pairs; setup() prepares state and returns the callable to time."""
+    cases: List[Case] = []
+    images = {size: fake_jpeg(nbytes, seed=1) for size, nbytes in SIZES.items()}
+    paths = {}
+    for size, data in images.items():
+        paths[size] = os.path.join(workdir, f'{size}.jpg')
+        with open(paths[size], 'wb') as f:
+            f.write(data)
+
+    # SDK internals on their own.
+    client = Decor8AI()
+    required = {'input_image_url': URL, 'room_type': 'livingroom', 'design_style': 'modern'}
+    optional = {'num_images': 4, 'scale_factor': None, 'color_scheme': 'COLOR_SCHEME_3', 'seed': None, 'prompt': None}
+    cases.append(('build_payload', lambda: lambda: client._build_payload(required, optional)))
+    for size in SIZES:
+        cases.append((f'load_image_bytes[path-{size}]', lambda size=size: lambda: _load_image_bytes(paths[size])))
+        cases.append((f'multipart_encode[{size}]', lambda size=size: lambda: _drain(
+            MultipartEncoder({'scale_factor': 2}, {'input_image': ('input_image.jpg', images[size])}))))
+        cases.append((f'data_url_encode[{size}]', lambda size=size: _encode_call(images[size])))
+        payload = canned_responses(SIZES[size])[ENDPOINTS['upscale_image']]
+        cases.append((f'json_decode[upscale-{size}]', lambda payload=payload: lambda: json.loads(payload)))
+
+    # Every endpoint method through the sync client.
+    small = canned_responses(SIZES['small'])
+    for endpoint, kwargs in JSON_CALLS.items():
+        cases.append((f'sync.{endpoint}[url]', lambda endpoint=endpoint, kwargs=kwargs: _endpoint_call(
+            sync_client(small), endpoint, kwargs)))
+    for size in SIZES:
+        responses = canned_responses(SIZES[size])
+        # Local images sent to a URL parameter are encoded as data URLs; memoization off so each call encodes.
+        cases.append((f'sync.generate_designs_for_room[data-url-{size}]', lambda size=size: _endpoint_call(
+            sync_client(small, data_urls=DataURLEncoder(max_bytes=0)), 'generate_designs_for_room',
+            dict(JSON_CALLS['generate_designs_for_room'], input_image_url=images[size]))))
+        for endpoint, kwargs in UPLOAD_CALLS.items():
+            cases.append((f'sync.{endpoint}[bytes-{size}]', lambda endpoint=endpoint, kwargs=kwargs, size=size, responses=responses: _endpoint_call(
+                sync_client(responses), endpoint, dict(kwargs, input_image=images[size]))))
+            cases.append((f'sync.{endpoint}[path-{size}]', lambda endpoint=endpoint, kwargs=kwargs, size=size, responses=responses: _endpoint_call(
+                sync_client(responses), endpoint, dict(kwargs, input_image=paths[size]))))
+        cases.append((f'sync.upscale_image[output-{size}]', lambda size=size, responses=responses: _output_call(
+            sync_client(responses), images[size])))
+        cases.append((f'sync.generate_designs_for_room[typed-{size}]', lambda responses=responses: _endpoint_call(
+            sync_client(responses, typed_results=True), 'generate_designs_for_room',
+            JSON_CALLS['generate_designs_for_room'])))
+
+    # The async client's request path.
+    for size in SIZES:
+        responses = canned_responses(SIZES[size])
+        cases.append((f'async.upscale_image[bytes-{size}]', lambda size=size, responses=responses: _async_call(
+            async_client(responses), 'upscale_image', dict(UPLOAD_CALLS['upscale_image'], input_image=images[size]))))
+    cases.append(('async.generate_designs_for_room[url]', lambda: _async_call(
+        async_client(small), 'generate_designs_for_room', JSON_CALLS['generate_designs_for_room'])))
+    return cases
+
+
+def _drain(encoder: MultipartEncoder) -> None:
+    while encoder.read(READ_SIZE):
+        pass
+
+
+def _encode_call(image: bytes) -> Callable[[], Any]:
+    encoder = DataURLEncoder(max_bytes=0)
+    return lambda: encoder.encode(image)
+
+
+def _endpoint_call(client: Any, endpoint: str, kwargs: Dict[str, Any]) -> Callable[[], Any]:
+    method = getattr(client, endpoint)
+    return lambda: method(**kwargs)
+
+
+def _output_call(client: Decor8AI, image: bytes) -> Callable[[], Any]:
+    return lambda: client.upscale_image(image, scale_factor=2, output=io.BytesIO())
+
+
+def _async_call(client: AsyncDecor8AI, endpoint: str, kwargs: Dict[str, Any]) -> Callable[[], Any]:
+    loop = asyncio.new_event_loop()
+    method = getattr(client, endpoint)
+    return lambda: loop.run_until_complete(method(**kwargs))
+
+
+# -----------------------------------------------------------------------------
+# Runner
+# -----------------------------------------------------------------------------
+
+def measure(call: Callable[[], Any], duration: float) -> Dict[str, float]:
+    """Time call for about duration seconds, then trace the memory of a few more calls."""
+    for _ in range(3):
+        call()
+    iterations = 0
+    gc.collect()
+    start = time.perf_counter()
+    deadline = start + duration
+    while True:
+        call()
+        iterations += 1
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+    elapsed = now - start
+
+    tracemalloc.start()
+    try:
+        call()  # let caches and pools settle under tracing
+        gc.collect()
+        base, _ = tracemalloc.get_traced_memory()
+        peak = 0
+        for _ in range(MEMORY_CALLS):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            call()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+    return {
+        'ops_per_sec': iterations / elapsed,
+        'mean_us': elapsed / iterations * 1e6,
+        'peak_kib': peak / 1024,
+        'retained_kib_per_call': retained / 1024 / MEMORY_CALLS,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Return a description of every case that got slower or uses more memory than tolerance allows."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            continue
+        if current['ops_per_sec'] < previous['ops_per_sec'] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {current['ops_per_sec']:.0f} ops/s, baseline {previous['ops_per_sec']:.0f} ops/s"
+            )
+        # Small absolute peaks are noise; only flag growth beyond 64 KiB.
+        if current['peak_kib'] > max(previous['peak_kib'] * (1 + tolerance), previous['peak_kib'] + 64):
+            regressions.append(
+                f"{name}: peak {current['peak_kib']:.0f} KiB, baseline {previous['peak_kib']:.0f} KiB"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the SDK\'s per-call overhead.')
+    parser.add_argument('-k', '--filter', default='', help='only run cases whose name contains this')
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION, help='seconds to time each case')
+    parser.add_argument('--save', metavar='PATH', help='write the results as a baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare against a saved baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='allowed slowdown / memory growth as a fraction (default 0.3)')
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        cases = [(name, setup) for name, setup in build_cases(workdir) if args.filter in name]
+        width = max((len(name) for name, _ in cases), default=0)
+        print(f"{'case':<{width}}  {'ops/s':>10}  {'mean':>10}  {'peak':>10}  {'retained':>12}")
+        for name, setup in cases:
+            result = results[name] = measure(setup(), args.duration)
+            print(
+                f"{name:<{width}}  {result['ops_per_sec']:>10.0f}  {result['mean_us']:>8.0f}us"
+                f"  {result['peak_kib']:>7.0f}KiB  {result['retained_kib_per_call']:>7.1f}KiB/op",
+                flush=True,
+            )
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+            f.write('\n')
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions against {args.compare}.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
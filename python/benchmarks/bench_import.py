@@ -0,0 +1,122 @@
+"""Import-time benchmarks for the Decor8 AI SDK.
+
+Each case runs in a fresh interpreter, so it measures a cold start as a
+serverless function sees it (with warm OS file caches). The package loads
+its submodules on first attribute access and the client imports requests
+when the first client is created, so the cases show what each step costs.
+
+Usage (from this directory, with the SDK importable):
+    python bench_import.py                          # median of 20 runs per case
+    python bench_import.py --detail "import decor8ai"   # slowest modules (python -X importtime)
+    python bench_import.py --save import_baseline.json
+    python bench_import.py --compare import_baseline.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+
+CASES = {
+    'import decor8ai': 'import decor8ai',
+    'from decor8ai import Decor8AI': 'from decor8ai import Decor8AI',
+    'Decor8AI()': "from decor8ai import Decor8AI; Decor8AI(api_key='benchmark-key')",
+    'from decor8ai import AsyncDecor8AI': 'from decor8ai import AsyncDecor8AI',
+    'from decor8ai import *': 'from decor8ai import *',
+}
+DEFAULT_RUNS = 20
+DEFAULT_TOLERANCE = 0.3
+# Regressions smaller than this are noise at interpreter start-up scale.
+MIN_REGRESSION_MS = 5.0
+
+_TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def time_statement(statement: str, runs: int) -> List[float]:
+    """Return the milliseconds statement took in each of runs fresh interpreters."""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', _TIMER.format(statement=statement)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]) * 1000)
+    return samples
+
+
+def import_detail(statement: str, limit: int = 15) -> List[str]:
+    """Return the slowest modules imported by statement, by cumulative time."""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement], check=True, capture_output=True, text=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line.split('|')
+        rows.append((int(cumulative), module.rstrip()))
+    rows.sort(reverse=True)
+    return [f"{micros / 1000:8.1f} ms  {module}" for micros, module in rows[:limit]]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the import time of the SDK.')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='fresh interpreters per case')
+    parser.add_argument('--detail', metavar='STATEMENT', help='show the slowest imports of a statement and exit')
+    parser.add_argument('--save', metavar='PATH', help='write the results as a baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare against a saved baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='allowed slowdown as a fraction (default 0.3)')
+    args = parser.parse_args(argv)
+
+    if args.detail:
+        print('\n'.join(import_detail(args.detail)))
+        return 0
+
+    results: Dict[str, Dict[str, float]] = {}
+    width = max(len(name) for name in CASES)
+    print(f"{'case':<{width}}  {'median':>10}  {'min':>10}")
+    for name, statement in CASES.items():
+        samples = time_statement(statement, args.runs)
+        result = results[name] = {'median_ms': statistics.median(samples), 'min_ms': min(samples)}
+        print(f"{name:<{width}}  {result['median_ms']:>8.1f}ms  {result['min_ms']:>8.1f}ms", flush=True)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+            f.write('\n')
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = []
+        for name, current in results.items():
+            previous = baseline.get(name)
+            if previous is None:
+                continue
+            allowed = max(previous['median_ms'] * (1 + args.tolerance), previous['median_ms'] + MIN_REGRESSION_MS)
+            if current['median_ms'] > allowed:
+                regressions.append(f"{name}: {current['median_ms']:.1f} ms, baseline {previous['median_ms']:.1f} ms")
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions against {args.compare}.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
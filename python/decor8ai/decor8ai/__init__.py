@@ -6,48 +6,179 @@ Example usage:
     client = Decor8AI(api_key="your-key")  # or use DECOR8AI_API_KEY env var
     result = client.generate_designs_for_room(...)
 
+    # Asyncio client (requires: pip install decor8ai[async])
+    from decor8ai import AsyncDecor8AI
+    async with AsyncDecor8AI() as client:
+        result = await client.generate_designs_for_room(...)
+
     # Module-level functions (backward compatible)
     from decor8ai import generate_designs_for_room
     result = generate_designs_for_room(...)
 """
 
-from .client import (
-    # Main client class
-    Decor8AI,
-    # Module-level functions for backward compatibility
-    prime_the_room_walls,
-    prime_walls_for_room,
-    generate_designs,
-    generate_designs_for_room,
-    generate_inspirational_designs,
-    generate_image_captions,
-    upscale_image,
-    remove_objects_from_room,
-    replace_sky_behind_house,
-    # New functions
-    change_wall_color,
-    change_kitchen_cabinets_color,
-    generate_landscaping_designs,
-    remodel_kitchen,
-    remodel_bathroom,
-    sketch_to_3d_render,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public names are imported from their submodules on first access (PEP 562), so
+# `import decor8ai` stays cheap: requests, httpx, Pillow and the client modules
+# load only when something that needs them is used.
+_LAZY_ATTRIBUTES = {
+    # Main client class and module-level functions
+    'Decor8AI': 'client',
+    'prime_the_room_walls': 'client',
+    'prime_walls_for_room': 'client',
+    'generate_designs': 'client',
+    'generate_designs_for_room': 'client',
+    'generate_inspirational_designs': 'client',
+    'generate_image_captions': 'client',
+    'upscale_image': 'client',
+    'remove_objects_from_room': 'client',
+    'replace_sky_behind_house': 'client',
+    'change_wall_color': 'client',
+    'change_kitchen_cabinets_color': 'client',
+    'generate_landscaping_designs': 'client',
+    'remodel_kitchen': 'client',
+    'remodel_bathroom': 'client',
+    'sketch_to_3d_render': 'client',
+    'close_default_client': 'client',
+    'AsyncDecor8AI': 'async_client',
+    'BatchResult': 'batch',
+    'ImageCache': 'cache',
+    'ResponseCache': 'cache',
+    'CircuitBreaker': 'circuit',
+    'DataURLEncoder': 'dataurl',
+    'Decor8AIError': 'exceptions',
+    'APIError': 'exceptions',
+    'CircuitOpenError': 'exceptions',
+    'DownloadError': 'exceptions',
+    'StageError': 'exceptions',
+    'HedgingPolicy': 'hedging',
+    'Hooks': 'hooks',
+    'RequestTrace': 'hooks',
+    'JobJournal': 'jobs',
+    'JobRunner': 'jobs',
+    'Metrics': 'metrics',
+    'Pipeline': 'pipeline',
+    'PipelineResult': 'pipeline',
+    'Stage': 'pipeline',
+    'ImagePreprocessor': 'preprocess',
+    'RateLimiter': 'ratelimit',
+    'DesignResult': 'results',
+    'ResultImage': 'results',
+    'RetryPolicy': 'retry',
+    'SingleFlight': 'singleflight',
+    'SavedImage': 'streaming',
+    'AsyncWebhookReceiver': 'webhooks',
+    'WebhookReceiver': 'webhooks',
+    # Constants
+    'ROOM_TYPES': 'constants',
+    'DESIGN_STYLES': 'constants',
+    'COLOR_SCHEMES': 'constants',
+    'SPECIALITY_DECORS': 'constants',
+    'SKY_TYPES': 'constants',
+    'YARD_TYPES': 'constants',
+    'GARDEN_STYLES': 'constants',
+    'RENDER_TYPES': 'constants',
+}
+
+if TYPE_CHECKING:  # pragma: no cover - static imports for type checkers and IDEs
+    from .client import (
+        Decor8AI,
+        prime_the_room_walls,
+        prime_walls_for_room,
+        generate_designs,
+        generate_designs_for_room,
+        generate_inspirational_designs,
+        generate_image_captions,
+        upscale_image,
+        remove_objects_from_room,
+        replace_sky_behind_house,
+        change_wall_color,
+        change_kitchen_cabinets_color,
+        generate_landscaping_designs,
+        remodel_kitchen,
+        remodel_bathroom,
+        sketch_to_3d_render,
+        close_default_client,
+    )
+    from .async_client import AsyncDecor8AI
+    from .batch import BatchResult
+    from .cache import ImageCache, ResponseCache
+    from .circuit import CircuitBreaker
+    from .dataurl import DataURLEncoder
+    from .exceptions import Decor8AIError, APIError, CircuitOpenError, DownloadError, StageError
+    from .hedging import HedgingPolicy
+    from .hooks import Hooks, RequestTrace
+    from .jobs import JobJournal, JobRunner
+    from .metrics import Metrics
+    from .pipeline import Pipeline, PipelineResult, Stage
+    from .preprocess import ImagePreprocessor
+    from .ratelimit import RateLimiter
+    from .results import DesignResult, ResultImage
+    from .retry import RetryPolicy
+    from .singleflight import SingleFlight
+    from .streaming import SavedImage
+    from .webhooks import AsyncWebhookReceiver, WebhookReceiver
+    from .constants import (
+        ROOM_TYPES,
+        DESIGN_STYLES,
+        COLOR_SCHEMES,
+        SPECIALITY_DECORS,
+        SKY_TYPES,
+        YARD_TYPES,
+        GARDEN_STYLES,
+        RENDER_TYPES,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    # Cache it so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from .constants import (
-    ROOM_TYPES,
-    DESIGN_STYLES,
-    COLOR_SCHEMES,
-    SPECIALITY_DECORS,
-    SKY_TYPES,
-    YARD_TYPES,
-    GARDEN_STYLES,
-    RENDER_TYPES,
-)
 
 __version__ = "0.3.1"
 __all__ = [
-    # Client class
+    # Client classes
     "Decor8AI",
+    "AsyncDecor8AI",
+    "BatchResult",
+    "RetryPolicy",
+    "RateLimiter",
+    "HedgingPolicy",
+    "CircuitBreaker",
+    "SingleFlight",
+    "Hooks",
+    "RequestTrace",
+    "Metrics",
+    "WebhookReceiver",
+    "AsyncWebhookReceiver",
+    "ResponseCache",
+    "ImageCache",
+    "ImagePreprocessor",
+    "DataURLEncoder",
+    "SavedImage",
+    "DesignResult",
+    "ResultImage",
+    "JobRunner",
+    "JobJournal",
+    "Pipeline",
+    "PipelineResult",
+    "Stage",
+    # Exceptions
+    "Decor8AIError",
+    "APIError",
+    "DownloadError",
+    "CircuitOpenError",
+    "StageError",
     # Functions
     "prime_the_room_walls",
     "prime_walls_for_room",
@@ -64,6 +195,7 @@ __all__ = [
     "remodel_kitchen",
     "remodel_bathroom",
     "sketch_to_3d_render",
+    "close_default_client",
     # Constants
     "ROOM_TYPES",
     "DESIGN_STYLES",
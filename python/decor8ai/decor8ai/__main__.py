@@ -0,0 +1,8 @@
+"""Allows ``python -m decor8ai``, equivalent to the ``decor8ai`` console script."""
+
+import sys
+
+from .cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,358 @@
+"""Asyncio client for the Decor8 AI API.
+
+Requires the optional httpx dependency (``pip install decor8ai[async]``).
+
+Example:
+    >>> import asyncio
+    >>> from decor8ai import AsyncDecor8AI
+    >>> async def main():
+    ...     async with AsyncDecor8AI() as client:
+    ...         return await client.generate_designs_for_room(
+    ...             input_image_url="https://example.com/room.jpg",
+    ...             room_type="livingroom",
+    ...             design_style="modern",
+    ...         )
+    >>> result = asyncio.run(main())
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    httpx = None
+
+from .client import (
+    DEFAULT_BASE_URL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    STREAM_CHUNK_SIZE,
+    ImageInput,
+    _Decor8AIBase,
+    _endpoint_name,
+    _is_url,
+    _load_image_bytes,
+)
+from .cache import ImageCache, ResponseCache
+from .circuit import CircuitBreaker
+from .dataurl import DataURLEncoder
+from .exceptions import APIError
+from .hooks import Hooks, request_size
+from .metrics import Metrics
+from .multipart import MultipartEncoder
+from .preprocess import ImagePreprocessor
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .streaming import ImageOutput, ImageResponseDecoder
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .webhooks import AsyncWebhookReceiver
+
+
+def _retryable_exceptions(policy: RetryPolicy) -> Tuple[type, ...]:
+    """Transport errors retried when the RetryPolicy does not name its own."""
+    if policy.retry_read_timeouts:
+        return (httpx.ConnectError, httpx.TimeoutException)
+    return (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class AsyncDecor8AI(_Decor8AIBase):
+    """Asyncio client for Decor8 AI API.
+
+    Provides the same endpoint methods as Decor8AI; each one returns an awaitable
+    that resolves to the API response. All calls share one pooled httpx.AsyncClient,
+    so a single event loop can keep many requests in flight.
+
+    Args:
+        api_key: API key for authentication. If not provided, uses DECOR8AI_API_KEY env var.
+        base_url: Base URL for the API. Defaults to https://api.decor8.ai
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        keepalive_expiry: Seconds an idle connection is kept alive.
+        timeout: Request timeout in seconds. None waits indefinitely, like Decor8AI.
+        retry_policy: Retry behaviour for transient failures (429/502/503 and
+            connection errors by default). Defaults to RetryPolicy().
+        rate_limiter: Optional RateLimiter; attempts wait for a token without
+            blocking the event loop.
+        cache: Optional ResponseCache for deterministic (seeded) JSON responses.
+        image_cache: Optional ImageCache for input images downloaded from URLs.
+        typed_results: Return DesignResult objects instead of raw response dicts.
+        circuit_breaker: Optional CircuitBreaker; requests to an endpoint whose
+            circuit is open raise CircuitOpenError immediately.
+        single_flight: Optional SingleFlight; identical concurrent JSON requests
+            share one API call.
+        preprocessor: Optional ImagePreprocessor; uploads are preprocessed on its
+            executor (a thread pool by default) so the event loop is not blocked.
+        data_urls: Optional DataURLEncoder to share memoized data URLs of local
+            images between clients. Encoding runs in a worker thread.
+        hooks: Optional Hooks with request lifecycle callbacks; they run on the
+            event loop.
+        metrics: Optional Metrics to record per-endpoint request metrics into.
+
+    Raises:
+        ImportError: If httpx is not installed.
+        ValueError: If no API key is provided or found in environment.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+        timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        image_cache: Optional[ImageCache] = None,
+        typed_results: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        single_flight: Optional[SingleFlight] = None,
+        preprocessor: Optional[ImagePreprocessor] = None,
+        data_urls: Optional[DataURLEncoder] = None,
+        hooks: Optional[Hooks] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        if httpx is None:
+            raise ImportError("AsyncDecor8AI requires httpx. Install it with: pip install decor8ai[async]")
+        super().__init__(
+            api_key,
+            base_url,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            image_cache=image_cache,
+            typed_results=typed_results,
+            circuit_breaker=circuit_breaker,
+            single_flight=single_flight,
+            preprocessor=preprocessor,
+            data_urls=data_urls,
+            hooks=hooks,
+            metrics=metrics,
+        )
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=timeout,
+        )
+
+    async def __aenter__(self) -> "AsyncDecor8AI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close all pooled connections held by the client."""
+        await self._client.aclose()
+
+    async def submit_async(self, endpoint: str, receiver: "AsyncWebhookReceiver", **kwargs: Any) -> "asyncio.Future":
+        """Submit a request whose result is delivered by webhook, without waiting for it.
+
+        See Decor8AI.submit_async(). Awaiting this method sends the request;
+        awaiting the returned future waits for the callback.
+
+        Returns:
+            asyncio.Future resolved with the callback payload.
+        """
+        method = self._webhook_method(endpoint)
+        token, future = receiver.register()
+        try:
+            response = await method(webhooks_data=receiver.webhooks_data(token), **kwargs)
+        except BaseException:
+            receiver.registry.pop(token)
+            raise
+        if response.get('error') and receiver.registry.pop(token) is not None:
+            future.set_result(response)
+        return asyncio.wrap_future(future)
+
+    async def _load_image(self, input_image: ImageInput) -> bytes:
+        """Load image content from a file path, URL, file object or buffer without blocking the event loop."""
+        if isinstance(input_image, bytes):
+            return input_image
+        if isinstance(input_image, str) and _is_url(input_image):
+            cache = self.image_cache
+            if cache is not None:
+                response = await self._client.get(input_image, headers=cache.request_headers(input_image))
+                if response.status_code != 304:
+                    response.raise_for_status()
+                content = cache.resolve(input_image, response.status_code, response.headers, response.content)
+                if content is not None:
+                    return content
+            response = await self._client.get(input_image)
+            response.raise_for_status()
+            if cache is not None:
+                cache.resolve(input_image, response.status_code, response.headers, response.content)
+            return response.content
+        return await asyncio.to_thread(_load_image_bytes, input_image)
+
+    async def _request(
+        self,
+        endpoint: str,
+        body: Optional[MultipartEncoder] = None,
+        output: Optional[ImageOutput] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """POST to an endpoint, retrying transient failures according to retry_policy.
+
+        A streamed multipart body is passed as `body`; it is rewound before each
+        retry, and requests whose body cannot be rewound are not retried. With
+        `output`, the response body is streamed and its inline images decoded
+        into `output`.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open before an attempt.
+        """
+        policy = self.retry_policy
+        retryable = policy.retry_exceptions or _retryable_exceptions(policy)
+        url = f"{self.base_url}{endpoint}"
+        name = _endpoint_name(endpoint)
+        hooks = self.hooks if self.hooks else None
+        request_bytes = request_size(body, kwargs) if hooks is not None else None
+        trace = None
+        attempt = 1
+        while True:
+            queued = time.monotonic()
+            admission = None
+            if self.circuit_breaker is not None:
+                admission = self.circuit_breaker.before_request(name)
+            try:
+                if self.rate_limiter is not None:
+                    wait = self.rate_limiter.reserve(name)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                if body is not None:
+                    kwargs['content'] = body.aiter_chunks()
+                started = time.monotonic()
+                if hooks is not None:
+                    trace = hooks.start(name, attempt, request_bytes, started - queued)
+            except BaseException:
+                self._release_admission(name, admission)
+                raise
+            try:
+                request = self._client.build_request('POST', url, **kwargs)
+                # Always streamed, so the time to headers can be told apart from the body read.
+                response = await self._client.send(request, stream=True)
+                headers = time.monotonic() - started
+                if output is None:
+                    try:
+                        await response.aread()
+                    except BaseException:
+                        await response.aclose()
+                        raise
+            except retryable as exc:
+                self._record_outcome(name, admission, started)
+                delay = policy.exception_delay(attempt)
+                if delay is None or (body is not None and not body.reset()):
+                    if trace is not None:
+                        trace.failed(exc)
+                    raise
+                if trace is not None:
+                    trace.retry(delay, exc)
+            except Exception as exc:
+                self._record_outcome(name, admission, started)
+                if trace is not None:
+                    trace.failed(exc)
+                raise
+            except BaseException as exc:  # cancelled
+                self._release_admission(name, admission)
+                if trace is not None:
+                    trace.failed(exc)
+                raise
+            else:
+                self._record_outcome(name, admission, started, response.status_code)
+                if trace is not None:
+                    trace.received(response, headers)
+                delay = policy.status_delay(attempt, response.status_code, response.headers.get('Retry-After'))
+                if delay is None or (body is not None and not body.reset()):
+                    try:
+                        if output is not None:
+                            result = await self._decode_images(response, output)
+                        else:
+                            result = self._parse_response(response)
+                    except BaseException as exc:
+                        if trace is not None:
+                            trace.failed(exc)
+                        raise
+                    if trace is not None:
+                        trace.done(response, streamed=output is not None)
+                    return result
+                if trace is not None:
+                    trace.retry(delay)
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    async def _decode_images(response: "httpx.Response", output: ImageOutput) -> Dict[str, Any]:
+        """Parse a streamed response, decoding its inline images into output.
+
+        Raises:
+            APIError: If the body is not valid JSON or holds invalid image data.
+        """
+        decoder = ImageResponseDecoder(output)
+        try:
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                decoder.feed(chunk)
+            return decoder.close()
+        except ValueError as e:
+            decoder.abort()
+            raise APIError(response.status_code, str(e)) from None
+        except BaseException:
+            decoder.abort()
+            raise
+        finally:
+            await response.aclose()
+
+    async def _post_json(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a POST request with JSON payload."""
+        if self.data_urls.needs_encoding(data):
+            data = await asyncio.to_thread(self.data_urls.encode_payload, data)
+        key, cached = self._cache_lookup(endpoint, data)
+        if cached is not None:
+            return self._result(cached)
+
+        async def send() -> Dict[str, Any]:
+            response = await self._request(endpoint, headers=self._get_headers('application/json'), json=data)
+            if key is not None:
+                self.cache.set(key, response)
+            return response
+
+        flight = self._flight_key(endpoint, data)
+        return self._result(await self.single_flight.do_async(flight, send) if flight is not None else await send())
+
+    async def _post_image(
+        self,
+        endpoint: str,
+        input_image: ImageInput,
+        data: Optional[Dict] = None,
+        output: Optional[ImageOutput] = None,
+    ) -> Dict[str, Any]:
+        """Upload an image with form fields as a streamed multipart body.
+
+        File paths, file objects and buffers are streamed in chunks; only URL
+        inputs are downloaded into memory first.
+        """
+        if self.preprocessor is not None:
+            input_image = await asyncio.wrap_future(self.preprocessor.submit(await self._load_image(input_image)))
+        elif isinstance(input_image, str) and _is_url(input_image):
+            input_image = await self._load_image(input_image)
+        encoder = MultipartEncoder(data, {'input_image': ('input_image.jpg', input_image)})
+        headers = self._get_headers(encoder.content_type)
+        if encoder.content_length is not None:
+            headers['Content-Length'] = str(encoder.content_length)
+        try:
+            return self._result(await self._request(endpoint, body=encoder, output=output, headers=headers))
+        finally:
+            encoder.close()
@@ -0,0 +1,107 @@
+"""Bounded-concurrency batch execution for Decor8 AI calls.
+
+Used by Decor8AI.map() and Decor8AI.batch(). Items are pulled from the input
+iterable lazily, so very large (or generated) workloads never sit in memory
+all at once.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+
+DEFAULT_CONCURRENCY = 8
+
+
+class BatchResult:
+    """Outcome of one item in a batch.
+
+    Attributes:
+        index: Position of the item in the input iterable.
+        kwargs: Keyword arguments the endpoint method was called with.
+        result: API response, or None if the call raised.
+        error: Exception raised by the call, or None on success.
+    """
+
+    __slots__ = ('index', 'kwargs', 'result', 'error')
+
+    def __init__(
+        self,
+        index: int,
+        kwargs: Dict[str, Any],
+        result: Any = None,
+        error: Optional[BaseException] = None,
+    ):
+        self.index = index
+        self.kwargs = kwargs
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """True if the call completed without raising."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = 'ok' if self.ok else f'error={self.error!r}'
+        return f"BatchResult(index={self.index}, {status})"
+
+
+def _call(func: Callable[..., Any], index: int, kwargs: Dict[str, Any]) -> BatchResult:
+    """Invoke func and capture its result or exception."""
+    try:
+        return BatchResult(index, kwargs, result=func(**kwargs))
+    except Exception as exc:
+        return BatchResult(index, kwargs, error=exc)
+
+
+def run_batch(
+    func: Callable[..., Any],
+    items: Iterable[Dict[str, Any]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """Call func(**item) for every item with at most `concurrency` calls in flight.
+
+    Args:
+        func: Callable invoked once per item.
+        items: Iterable of keyword-argument dicts.
+        concurrency: Maximum number of concurrent calls.
+        ordered: Yield results in input order (True) or as they complete (False).
+
+    Yields:
+        BatchResult for every item. Exceptions raised by func are captured on the
+        result instead of aborting the batch.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    iterator = enumerate(items)
+    # Ordered mode keeps a little extra work queued so one slow head item
+    # does not leave the remaining workers idle.
+    window = concurrency * 2 if ordered else concurrency
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='decor8ai-batch')
+    try:
+        pending = deque()
+
+        def fill() -> None:
+            while len(pending) < window:
+                try:
+                    index, kwargs = next(iterator)
+                except StopIteration:
+                    return
+                pending.append(executor.submit(_call, func, index, dict(kwargs)))
+
+        fill()
+        while pending:
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                for future in done:
+                    yield future.result()
+            fill()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,446 @@
+"""Caching for Decor8 AI responses and input image downloads.
+
+A request made with an explicit ``seed`` returns the same designs every time, so
+its response can be reused. ResponseCache keys responses on a canonical hash of
+the endpoint and payload and stores them in a bounded in-memory LRU, optionally
+backed by a persistent on-disk tier.
+
+ImageCache keeps input images fetched from URLs on disk and revalidates them
+with conditional GETs, so a photo reused across many calls is downloaded once.
+
+Example:
+    >>> from decor8ai import Decor8AI, ImageCache, ResponseCache
+    >>> cache = ResponseCache(maxsize=1024, directory='~/.cache/decor8ai', ttl=7 * 86400)
+    >>> client = Decor8AI(cache=cache, image_cache=ImageCache('~/.cache/decor8ai-images'))
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+DEFAULT_CACHEABLE_ENDPOINTS = ('generate_designs_for_room', 'generate_inspirational_designs')
+DEFAULT_MEMORY_SIZE = 256
+DEFAULT_DISK_BYTES = 512 * 1024 * 1024
+DEFAULT_IMAGE_CACHE_BYTES = 1024 * 1024 * 1024
+
+
+def make_cache_key(endpoint: str, payload: Dict[str, Any]) -> str:
+    """Return a stable hash for an (endpoint, payload) pair.
+
+    Keys are independent of dict ordering, so payloads built by _build_payload in
+    any order map to the same entry.
+    """
+    canonical = json.dumps([endpoint, payload], sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class MemoryCache:
+    """Thread-safe LRU of serialized responses.
+
+    Args:
+        maxsize: Maximum number of entries.
+        ttl: Seconds an entry stays valid. None never expires.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MEMORY_SIZE, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.time() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, stored_at: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (stored_at or time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache:
+    """Size-capped on-disk store of serialized responses.
+
+    Each entry is one file, written atomically. Reads refresh the file's
+    modification time, and once the directory grows past max_bytes the least
+    recently used files are deleted.
+
+    Args:
+        directory: Cache directory, created if missing.
+        max_bytes: Approximate upper bound on the total size of cached files.
+        ttl: Seconds an entry stays valid. None never expires.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_DISK_BYTES, ttl: Optional[float] = None):
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _entries(self) -> List[os.DirEntry]:
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+
+    def get(self, key: str) -> Optional[Tuple[float, str]]:
+        """Return (stored_at, value) for key, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored_at = float(f.readline())
+                value = f.read()
+        except (OSError, ValueError):
+            return None
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return stored_at, value
+
+    def set(self, key: str, value: str) -> None:
+        """Store value under key and evict old entries if the cache is over its size cap."""
+        data = f"{time.time()}\n{value}".encode('utf-8')
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            path = self._path(key)
+            with self._lock:
+                try:
+                    self._size -= os.path.getsize(path)
+                except OSError:
+                    pass
+                os.replace(tmp_path, path)
+                self._size += len(data)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _remove(self, path: str) -> None:
+        with self._lock:
+            try:
+                size = os.path.getsize(path)
+                os.unlink(path)
+            except OSError:
+                return
+            self._size -= size
+
+    def _evict(self) -> None:
+        """Delete least recently used files until the cache is below 90% of max_bytes."""
+        target = self.max_bytes * 0.9
+        stats = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            stats.append((stat.st_mtime, stat.st_size, entry.path))
+        stats.sort()
+        with self._lock:
+            # Another process may share the directory, so resync from what is on disk.
+            self._size = sum(size for _, size, _ in stats)
+            for _, size, path in stats:
+                if self._size <= target:
+                    break
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                self._size -= size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for entry in self._entries():
+            self._remove(entry.path)
+
+
+class ResponseCache:
+    """Opt-in cache for deterministic API responses.
+
+    Only successful responses from the configured endpoints are cached, and by
+    default only when the payload carries an explicit seed.
+
+    Args:
+        maxsize: Maximum number of responses kept in memory.
+        directory: Directory for the persistent tier. None keeps the cache in memory only.
+        max_bytes: Size cap for the persistent tier.
+        ttl: Seconds a cached response stays valid. None never expires.
+        endpoints: Endpoint names (keys of constants.ENDPOINTS) whose responses are cached.
+        require_seed: Only cache payloads that include a 'seed'.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MEMORY_SIZE,
+        directory: Optional[str] = None,
+        *,
+        max_bytes: int = DEFAULT_DISK_BYTES,
+        ttl: Optional[float] = None,
+        endpoints: Iterable[str] = DEFAULT_CACHEABLE_ENDPOINTS,
+        require_seed: bool = True,
+    ):
+        self.memory = MemoryCache(maxsize, ttl)
+        self.disk = DiskCache(directory, max_bytes, ttl) if directory else None
+        self.endpoints = frozenset(endpoints)
+        self.require_seed = require_seed
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, endpoint: str, payload: Dict[str, Any]) -> Optional[str]:
+        """Return the cache key for a request, or None if the request is not cacheable."""
+        if endpoint not in self.endpoints:
+            return None
+        if self.require_seed and payload.get('seed') is None:
+            return None
+        return make_cache_key(endpoint, payload)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the cached response for key, or None."""
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            entry = self.disk.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                self.memory.set(key, value, stored_at)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """Cache a response if it is a success."""
+        if not isinstance(response, dict) or response.get('error'):
+            return
+        value = json.dumps(response, separators=(',', ':'))
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def clear(self) -> None:
+        """Remove all cached responses from both tiers."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+class ImageCache:
+    """Content-addressed disk cache for input images downloaded from URLs.
+
+    Image bodies are stored once per SHA-256 digest, and each URL records the
+    digest together with the ETag and Last-Modified validators it was served with.
+    A repeat fetch sends If-None-Match / If-Modified-Since and reuses the stored
+    bytes on 304 Not Modified. Once stored images exceed max_bytes, the least
+    recently used ones are deleted together with the metadata of the URLs that
+    pointed at them. Sizes and recency are tracked in memory, loaded from the
+    directory on first store, so storing does not rescan the cache.
+
+    The cache itself does no network I/O: clients call request_headers() before
+    the GET and resolve() with the response, so it serves both the blocking and
+    the asyncio client.
+
+    Args:
+        directory: Cache directory, created if missing.
+        max_bytes: Approximate upper bound on the total size of stored images.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_IMAGE_CACHE_BYTES):
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self._blobs = os.path.join(self.directory, 'blobs')
+        self._meta = os.path.join(self.directory, 'meta')
+        os.makedirs(self._blobs, exist_ok=True)
+        os.makedirs(self._meta, exist_ok=True)
+        self._lock = threading.Lock()
+        # Loaded by _load_index(): blob digest -> size in least recently used
+        # order, their total size, and the metadata files pointing at each blob.
+        self._sizes: Optional["OrderedDict[str, int]"] = None
+        self._total = 0
+        self._urls: Dict[str, Set[str]] = {}
+        self._digests: Dict[str, str] = {}
+        self.revalidated = 0
+        self.downloaded = 0
+
+    def _meta_path(self, url: str) -> str:
+        return os.path.join(self._meta, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self._blobs, digest)
+
+    def _read_meta(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._meta_path(url), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(self._blob_path(meta.get('digest', ''))):
+            return None
+        return meta
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """Return conditional request headers for a URL that has a cached copy."""
+        meta = self._read_meta(url)
+        headers = {}
+        if meta is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def resolve(self, url: str, status_code: int, headers: Any, content: bytes) -> Optional[bytes]:
+        """Turn the response to a (conditional) GET into image bytes.
+
+        Args:
+            url: URL that was requested.
+            status_code: HTTP status of the response.
+            headers: Response headers (case-insensitive mapping).
+            content: Response body.
+
+        Returns:
+            The image bytes: the cached copy on 304, otherwise the body, which is
+            stored for next time. None if the response was a 304 but the cached
+            copy has since been evicted; the caller should fetch unconditionally.
+        """
+        if status_code == 304:
+            meta = self._read_meta(url)
+            if meta is None:
+                return None
+            path = self._blob_path(meta['digest'])
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                os.utime(path)
+            except OSError:
+                return None
+            with self._lock:
+                if self._sizes is not None and meta['digest'] in self._sizes:
+                    self._sizes.move_to_end(meta['digest'])
+            self.revalidated += 1
+            return data
+        self.downloaded += 1
+        self.store(url, content, headers.get('ETag'), headers.get('Last-Modified'))
+        return content
+
+    def store(self, url: str, content: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store image bytes for a URL along with its cache validators."""
+        digest = hashlib.sha256(content).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            self._write_atomic(blob_path, content)
+        meta_path = self._meta_path(url)
+        meta = {'url': url, 'digest': digest, 'etag': etag, 'last_modified': last_modified}
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        with self._lock:
+            self._load_index()
+            if digest in self._sizes:
+                self._sizes.move_to_end(digest)
+            else:
+                self._sizes[digest] = len(content)
+                self._total += len(content)
+            self._link(meta_path, digest)
+            self._evict()
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _link(self, meta_path: str, digest: str) -> None:
+        """Record that meta_path points at digest. Called with _lock held."""
+        previous = self._digests.get(meta_path)
+        if previous is not None and previous != digest:
+            self._urls.get(previous, set()).discard(meta_path)
+        self._digests[meta_path] = digest
+        self._urls.setdefault(digest, set()).add(meta_path)
+
+    def _load_index(self) -> None:
+        """Scan the directory once to learn blob sizes, recency and references. Called with _lock held."""
+        if self._sizes is not None:
+            return
+        stats = []
+        with os.scandir(self._blobs) as entries:
+            for entry in entries:
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                stats.append((stat.st_mtime, entry.name, stat.st_size))
+        self._sizes = OrderedDict((digest, size) for _, digest, size in sorted(stats))
+        self._total = sum(self._sizes.values())
+        with os.scandir(self._meta) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        digest = json.load(f).get('digest')
+                except (OSError, ValueError):
+                    digest = None
+                if digest in self._sizes:
+                    self._link(entry.path, digest)
+                else:  # left behind by an older version, or its blob is gone
+                    self._unlink(entry.path)
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Delete least recently used images and their metadata until the cache is within max_bytes.
+
+        Called with _lock held.
+        """
+        if self._total <= self.max_bytes:
+            return
+        while self._sizes and self._total > self.max_bytes * 0.9:
+            digest, size = self._sizes.popitem(last=False)
+            self._total -= size
+            self._unlink(self._blob_path(digest))
+            for meta_path in self._urls.pop(digest, ()):
+                self._digests.pop(meta_path, None)
+                self._unlink(meta_path)
@@ -0,0 +1,224 @@
+"""Per-endpoint circuit breakers for the Decor8 AI clients.
+
+Each endpoint has its own circuit. While it is closed, requests flow and
+their outcomes are recorded in a sliding window. When too many of the recent
+requests failed (transport errors or 5xx responses) or were slow, the circuit
+opens: requests to that endpoint fail immediately with CircuitOpenError
+instead of waiting out timeouts, and other endpoints are unaffected. After
+open_duration the circuit is half-open and lets a few probe requests through;
+if they succeed it closes again, otherwise it reopens.
+
+Every state change starts a new generation of the circuit. before_request()
+returns the generation a request was admitted under and record() takes it
+back, so a request that finishes after the state changed (for example one
+admitted while closed that ends while the circuit is half-open) is ignored
+instead of being counted as a probe.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+from .constants import ENDPOINTS
+from .exceptions import CircuitOpenError
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+DEFAULT_FAILURE_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class _Circuit:
+    """State of one endpoint's circuit. All access goes through CircuitBreaker under the lock."""
+
+    __slots__ = ('state', 'generation', 'outcomes', 'opened_at', 'probes', 'probe_successes', 'lock')
+
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.generation = 0
+        # (failed, slow) per recent request
+        self.outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+        self.lock = threading.Lock()
+
+
+class CircuitBreaker:
+    """Circuit breakers keyed by endpoint name.
+
+    Args:
+        failure_rate: Fraction (0-1] of failed requests in the window that opens the circuit.
+        min_requests: Requests the window must hold before the rates are evaluated.
+        window: Number of recent requests considered per endpoint.
+        slow_call_duration: Seconds after which a request counts as slow. None
+            disables the latency threshold.
+        slow_call_rate: Fraction (0-1] of slow requests in the window that opens the circuit.
+        open_duration: Seconds an open circuit rejects requests before probing.
+        half_open_probes: Probe requests let through while half-open; all of them
+            must succeed to close the circuit.
+        endpoints: Endpoint names (keys of constants.ENDPOINTS) to protect. None protects all.
+        failure_statuses: HTTP status codes counted as failures.
+
+    Raises:
+        ValueError: If an endpoint name is unknown or a rate is not within (0, 1].
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        *,
+        min_requests: int = 10,
+        window: int = 20,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate: float = 1.0,
+        open_duration: float = 30.0,
+        half_open_probes: int = 1,
+        endpoints: Optional[Iterable[str]] = None,
+        failure_statuses: Iterable[int] = DEFAULT_FAILURE_STATUSES,
+    ):
+        for name, rate in (('failure_rate', failure_rate), ('slow_call_rate', slow_call_rate)):
+            if not 0 < rate <= 1:
+                raise ValueError(f"{name} must be within (0, 1]")
+        if endpoints is not None:
+            endpoints = frozenset(endpoints)
+            for name in endpoints:
+                if name not in ENDPOINTS:
+                    raise ValueError(f"Unknown endpoint '{name}'. Expected one of: {', '.join(ENDPOINTS)}")
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.open_duration = open_duration
+        self.half_open_probes = max(1, half_open_probes)
+        self.endpoints = endpoints
+        self.failure_statuses = frozenset(failure_statuses)
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, endpoint: str) -> Optional[_Circuit]:
+        if self.endpoints is not None and endpoint not in self.endpoints:
+            return None
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit(self.window)
+            return circuit
+
+    def state(self, endpoint: str) -> str:
+        """Return 'closed', 'open' or 'half_open' for an endpoint."""
+        circuit = self._circuit(endpoint)
+        if circuit is None:
+            return CLOSED
+        with circuit.lock:
+            if circuit.state == OPEN and time.monotonic() - circuit.opened_at >= self.open_duration:
+                return HALF_OPEN
+            return circuit.state
+
+    def before_request(self, endpoint: str) -> Optional[int]:
+        """Admit a request to endpoint or reject it.
+
+        Every admitted request must be followed by exactly one record() (or
+        release()) call that passes back the value returned here.
+
+        Returns:
+            The circuit generation the request was admitted under, or None if
+            the endpoint is not protected.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open, or half-open with
+                all probe slots taken.
+        """
+        circuit = self._circuit(endpoint)
+        if circuit is None:
+            return
+        with circuit.lock:
+            if circuit.state == CLOSED:
+                return circuit.generation
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                remaining = self.open_duration - (now - circuit.opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(endpoint, remaining)
+                circuit.state = HALF_OPEN
+                circuit.generation += 1
+                circuit.probes = 0
+                circuit.probe_successes = 0
+            if circuit.probes >= self.half_open_probes:
+                raise CircuitOpenError(endpoint, 0.0)
+            circuit.probes += 1
+            return circuit.generation
+
+    def release(self, endpoint: str, admission: Optional[int]) -> None:
+        """Give back a request admitted by before_request() without recording an outcome.
+
+        For requests abandoned before they completed, such as cancelled ones,
+        which say nothing about the endpoint's health. Frees the probe slot of
+        a half-open circuit; use instead of record(), never in addition.
+        """
+        circuit = self._circuit(endpoint)
+        if circuit is None:
+            return
+        with circuit.lock:
+            if admission == circuit.generation and circuit.state == HALF_OPEN:
+                circuit.probes -= 1
+
+    def record(self, endpoint: str, failed: bool, duration: float, admission: Optional[int]) -> None:
+        """Record the outcome of a request admitted by before_request().
+
+        Args:
+            endpoint: Endpoint name.
+            failed: Whether the request failed.
+            duration: Seconds the request took.
+            admission: The value before_request() returned for this request.
+        """
+        circuit = self._circuit(endpoint)
+        if circuit is None:
+            return
+        slow = self.slow_call_duration is not None and duration >= self.slow_call_duration
+        with circuit.lock:
+            if admission != circuit.generation:
+                # Admitted under an earlier state; its outcome is no longer relevant.
+                return
+            if circuit.state == HALF_OPEN:
+                circuit.probes -= 1
+                if failed or slow:
+                    self._open(circuit)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_probes:
+                        circuit.state = CLOSED
+                        circuit.generation += 1
+                        circuit.outcomes.clear()
+                return
+            circuit.outcomes.append((failed, slow))
+            total = len(circuit.outcomes)
+            if total < self.min_requests:
+                return
+            failures = sum(1 for f, _ in circuit.outcomes if f)
+            slow_calls = sum(1 for _, s in circuit.outcomes if s)
+            if failures >= self.failure_rate * total or (
+                self.slow_call_duration is not None and slow_calls >= self.slow_call_rate * total
+            ):
+                self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.generation += 1
+        circuit.opened_at = time.monotonic()
+        circuit.outcomes.clear()
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """Close one endpoint's circuit, or all of them."""
+        with self._lock:
+            circuits = list(self._circuits.values()) if endpoint is None else [self._circuits.get(endpoint)]
+        for circuit in circuits:
+            if circuit is not None:
+                with circuit.lock:
+                    circuit.state = CLOSED
+                    circuit.generation += 1
+                    circuit.outcomes.clear()
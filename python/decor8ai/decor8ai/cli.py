@@ -0,0 +1,422 @@
+"""Command-line interface: ``decor8ai batch`` runs a manifest of API calls.
+
+A manifest is a CSV file (with a header row) or a JSONL file with one call
+per row: an ``endpoint`` column or key naming a method of Decor8AI, plus its
+keyword arguments. CSV values are converted to the parameter types of the
+endpoint method, and empty CSV cells are left out. The manifest is streamed,
+so it can hold millions of rows.
+
+Results are appended to a JSONL file as each call completes. Each line holds
+the manifest row number, ``ok``, and either the response or the error. With
+``--resume``, rows already recorded as successful in that file are skipped.
+An interrupted run can therefore be restarted with the same command plus
+``--resume``; failed rows are tried again.
+
+Example:
+    $ decor8ai batch listings.csv -o results.jsonl --concurrency 16 --download images/
+    $ decor8ai batch listings.csv -o results.jsonl --concurrency 16 --download images/ --resume
+"""
+
+import argparse
+import csv
+import inspect
+import io
+import json
+import os
+import sys
+import threading
+import time
+import typing
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from .batch import DEFAULT_CONCURRENCY, run_batch
+from .constants import ENDPOINTS
+from .streaming import SavedImage
+
+
+PROGRESS_INTERVAL = 1.0
+_COUNT_CHUNK = 1024 * 1024
+_TRUE = ('1', 'true', 'yes', 'y', 'on')
+_FALSE = ('0', 'false', 'no', 'n', 'off')
+
+
+# -----------------------------------------------------------------------------
+# Manifest reading
+# -----------------------------------------------------------------------------
+
+def manifest_format(path: str, explicit: Optional[str] = None) -> str:
+    """Return 'csv' or 'jsonl' for a manifest, from explicit or the file extension.
+
+    Raises:
+        ValueError: If the format cannot be determined.
+    """
+    if explicit:
+        return explicit
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    raise ValueError(f"Cannot tell the format of {path}; pass --format csv or --format jsonl")
+
+
+def read_manifest(stream: TextIO, format: str) -> Iterator[Dict[str, Any]]:
+    """Yield the rows of a manifest one at a time.
+
+    Rows that cannot be parsed are yielded as ``{'__error__': message}`` so the
+    row numbering stays aligned with the file and the error is recorded.
+    """
+    if format == 'csv':
+        for row in csv.DictReader(stream):
+            yield {key: value for key, value in row.items() if key and value not in (None, '')}
+        return
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield {'__error__': f"Invalid JSON: {exc}"}
+            continue
+        yield row if isinstance(row, dict) else {'__error__': 'Manifest rows must be JSON objects'}
+
+
+def count_rows(path: str, format: str) -> Optional[int]:
+    """Count manifest rows by counting lines, without parsing; None if path is not a regular file.
+
+    Blank lines and quoted CSV values spanning several lines make the count approximate;
+    it is only used for the ETA.
+    """
+    if not os.path.isfile(path):
+        return None
+    lines = 0
+    last = b'\n'
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_COUNT_CHUNK), b''):
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    if last != b'\n':
+        lines += 1
+    return max(0, lines - 1) if format == 'csv' else lines
+
+
+def _converter(hint: Any) -> Optional[Callable[[str], Any]]:
+    """Return a str -> value converter for int, float and bool parameters (or Optional ones)."""
+    if typing.get_origin(hint) is typing.Union:
+        args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        hint = args[0] if len(args) == 1 else None
+    if hint is bool:
+        return _parse_bool
+    if hint in (int, float):
+        return hint
+    return None
+
+
+def _parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError(f"Expected a boolean, got {value!r}")
+
+
+def coerce_params(method: Callable[..., Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert string values to the int, float or bool types method's parameters declare.
+
+    Raises:
+        ValueError: If a value cannot be converted.
+    """
+    hints = typing.get_type_hints(method)
+    converted = dict(params)
+    for name, value in params.items():
+        convert = _converter(hints.get(name)) if isinstance(value, str) else None
+        if convert is not None:
+            try:
+                converted[name] = convert(value)
+            except ValueError:
+                raise ValueError(f"Invalid value for {name}: {value!r}") from None
+    return converted
+
+
+# -----------------------------------------------------------------------------
+# Results file
+# -----------------------------------------------------------------------------
+
+def completed_rows(path: str) -> bytearray:
+    """Return a bitmap of the rows recorded as successful in a results file.
+
+    A trailing partial line, left by a run that was killed mid-write, is
+    truncated away so that appended results start on a fresh line.
+    """
+    done = bytearray()
+    if not os.path.exists(path):
+        return done
+    with open(path, 'rb+') as f:
+        valid = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            valid += len(line)
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and record.get('ok') and isinstance(record.get('row'), int):
+                _mark(done, record['row'])
+        f.truncate(valid)
+    return done
+
+
+def _mark(bitmap: bytearray, row: int) -> None:
+    byte = row >> 3
+    if byte >= len(bitmap):
+        bitmap.extend(bytes(byte - len(bitmap) + 1))
+    bitmap[byte] |= 1 << (row & 7)
+
+
+def _is_marked(bitmap: bytearray, row: int) -> bool:
+    byte = row >> 3
+    return byte < len(bitmap) and bool(bitmap[byte] & (1 << (row & 7)))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, SavedImage):
+        return {'path': value.path, 'size': value.size, 'content_type': value.content_type}
+    if isinstance(value, (bytes, bytearray)):
+        return f"<{len(value)} bytes>"
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# -----------------------------------------------------------------------------
+# Batch runner
+# -----------------------------------------------------------------------------
+
+class Progress:
+    """Throughput and ETA line on a terminal, rewritten at most once per interval."""
+
+    def __init__(self, total: Optional[int], stream: Optional[TextIO] = None, interval: float = PROGRESS_INTERVAL):
+        self.total = total
+        self.stream = stream if stream is not None else sys.stderr
+        self.interval = interval
+        self.done = 0
+        self.failed = 0
+        self.skipped = 0
+        self._started = time.monotonic()
+        self._shown = 0.0
+
+    def update(self, ok: bool) -> None:
+        self.done += 1
+        if not ok:
+            self.failed += 1
+        self.show()
+
+    def show(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._shown < self.interval:
+            return
+        self._shown = now
+        elapsed = now - self._started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        line = f"{self.done:,} done, {self.failed:,} failed"
+        if self.skipped:
+            line += f", {self.skipped:,} skipped"
+        line += f" | {rate:.1f}/s | elapsed {_clock(elapsed)}"
+        if self.total is not None:
+            remaining = max(0, self.total - self.skipped - self.done)
+            line += f" | {remaining:,} left"
+            if rate > 0:
+                line += f" | ETA {_clock(remaining / rate)}"
+        end = '\r' if self.stream.isatty() else '\n'
+        self.stream.write(line.ljust(80) + end)
+        self.stream.flush()
+
+
+def _clock(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+class BatchCommand:
+    """Runs a manifest through a client and records the results.
+
+    Args:
+        client: Decor8AI client used for the calls.
+        output: Results JSONL file; appended to.
+        concurrency: Maximum number of calls in flight.
+        default_endpoint: Endpoint for rows without an ``endpoint`` field.
+        download_dir: Directory to save result images in, one subdirectory per row.
+        done: Bitmap of rows to skip (see completed_rows()).
+        progress: Progress display, or None.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        output: TextIO,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        default_endpoint: Optional[str] = None,
+        download_dir: Optional[str] = None,
+        done: Optional[bytearray] = None,
+        progress: Optional[Progress] = None,
+    ):
+        if default_endpoint is not None and default_endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{default_endpoint}'. Expected one of: {', '.join(ENDPOINTS)}")
+        self.client = client
+        self.output = output
+        self.concurrency = concurrency
+        self.default_endpoint = default_endpoint
+        self.download_dir = download_dir
+        self.done = done if done is not None else bytearray()
+        self.progress = progress
+        self._write_lock = threading.Lock()
+
+    def run(self, rows: Iterator[Dict[str, Any]]) -> Tuple[int, int]:
+        """Execute every row not yet done. Returns (succeeded, failed) counts for this run."""
+        succeeded = failed = 0
+        items = ({'row': row, 'fields': fields} for row, fields in self._pending(rows))
+        for result in run_batch(self._call, items, self.concurrency, ordered=False):
+            record = result.result if result.ok else self._error_record(result.kwargs, result.error)
+            with self._write_lock:
+                self.output.write(json.dumps(record, default=_json_default) + '\n')
+                self.output.flush()
+            if record['ok']:
+                succeeded += 1
+            else:
+                failed += 1
+            if self.progress is not None:
+                self.progress.update(record['ok'])
+        if self.progress is not None:
+            self.progress.show(force=True)
+        return succeeded, failed
+
+    def _pending(self, rows: Iterator[Dict[str, Any]]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        for row, fields in enumerate(rows):
+            if _is_marked(self.done, row):
+                if self.progress is not None:
+                    self.progress.skipped += 1
+                continue
+            yield row, fields
+
+    def _call(self, row: int, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Make the call for one manifest row and build its result record."""
+        if '__error__' in fields:
+            raise ValueError(fields['__error__'])
+        params = dict(fields)
+        endpoint = params.pop('endpoint', None) or self.default_endpoint
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{endpoint}'. Expected one of: {', '.join(ENDPOINTS)}")
+        method = getattr(self.client, endpoint)
+        params = coerce_params(method, params)
+        destination = os.path.join(self.download_dir, str(row)) if self.download_dir else None
+        if destination is not None and 'output' in inspect.signature(method).parameters:
+            # Inline images are decoded straight to disk as the response arrives.
+            os.makedirs(destination, exist_ok=True)
+            params['output'] = destination
+        response = method(**params)
+        record: Dict[str, Any] = {'row': row, 'endpoint': endpoint, 'ok': not response.get('error')}
+        if record['ok'] and destination is not None and 'output' not in params:
+            record['files'] = self.client.download_results(response, destination)
+        record['response'] = response
+        return record
+
+    def _error_record(self, kwargs: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+        return {
+            'row': kwargs['row'],
+            'endpoint': kwargs['fields'].get('endpoint') or self.default_endpoint,
+            'ok': False,
+            'error': type(error).__name__,
+            'message': str(error),
+        }
+
+
+# -----------------------------------------------------------------------------
+# Entry point
+# -----------------------------------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='decor8ai', description='Decor8 AI command-line tools.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    batch = commands.add_parser(
+        'batch',
+        help='run a CSV/JSONL manifest of API calls',
+        description='Run one API call per manifest row and append the results to a JSONL file.',
+    )
+    batch.add_argument('manifest', help="CSV or JSONL manifest; '-' reads JSONL or CSV (see --format) from stdin")
+    batch.add_argument('-o', '--output', required=True, help='results JSONL file')
+    batch.add_argument('--format', choices=('csv', 'jsonl'), help='manifest format (default: from the extension)')
+    batch.add_argument('-c', '--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='calls in flight')
+    batch.add_argument('-e', '--endpoint', help='endpoint for rows without an endpoint field')
+    batch.add_argument('-d', '--download', metavar='DIR', help='save result images under DIR/<row>/')
+    batch.add_argument('--resume', action='store_true', help='skip rows already successful in the output file')
+    batch.add_argument('--max-attempts', type=int, help='attempts per call, including retries')
+    batch.add_argument('--api-key', help='API key (default: DECOR8AI_API_KEY)')
+    batch.add_argument('--base-url', help='API base URL')
+    batch.add_argument('-q', '--quiet', action='store_true', help='do not show progress')
+    return parser
+
+
+def run_batch_command(args: argparse.Namespace) -> int:
+    from .client import Decor8AI
+    from .retry import RetryPolicy
+
+    try:
+        format = manifest_format(args.manifest, args.format) if args.manifest != '-' else (args.format or 'jsonl')
+    except ValueError as exc:
+        print(f"decor8ai: {exc}", file=sys.stderr)
+        return 2
+    if os.path.exists(args.output) and os.path.getsize(args.output) and not args.resume:
+        print(f"decor8ai: {args.output} already exists; pass --resume to continue it", file=sys.stderr)
+        return 2
+
+    options: Dict[str, Any] = {'pool_maxsize': max(args.concurrency, 10)}
+    if args.api_key:
+        options['api_key'] = args.api_key
+    if args.base_url:
+        options['base_url'] = args.base_url
+    if args.max_attempts:
+        options['retry_policy'] = RetryPolicy(max_attempts=args.max_attempts)
+
+    done = completed_rows(args.output) if args.resume else bytearray()
+    progress = None if args.quiet else Progress(count_rows(args.manifest, format) if args.manifest != '-' else None)
+    if args.manifest == '-':
+        source = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+    else:
+        source = open(args.manifest, encoding='utf-8', newline='')
+    try:
+        with source, Decor8AI(**options) as client, open(args.output, 'a', encoding='utf-8') as output:
+            command = BatchCommand(
+                client,
+                output,
+                concurrency=args.concurrency,
+                default_endpoint=args.endpoint,
+                download_dir=args.download,
+                done=done,
+                progress=progress,
+            )
+            succeeded, failed = command.run(read_manifest(source, format))
+    except KeyboardInterrupt:
+        print("\ndecor8ai: interrupted; rerun with --resume to continue", file=sys.stderr)
+        return 130
+    except ValueError as exc:
+        print(f"decor8ai: {exc}", file=sys.stderr)
+        return 2
+    if not args.quiet:
+        print(f"{succeeded:,} succeeded, {failed:,} failed; results in {args.output}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the ``decor8ai`` console script."""
+    args = build_parser().parse_args(argv)
+    if args.command == 'batch':
+        return run_batch_command(args)
+    return 2  # pragma: no cover - argparse rejects unknown commands
+
+
+if __name__ == '__main__':
+    sys.exit(main())
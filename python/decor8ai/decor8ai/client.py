@@ -13,14 +13,85 @@ Example:
     ... )
 """
 
+import inspect
+import mmap
 import os
-import requests
-from typing import Optional, Union, Dict, Any
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Optional, Union, Dict, Any, BinaryIO, Callable, Iterable, Iterator, List, Tuple
 from urllib.parse import urlparse
 
+from .batch import DEFAULT_CONCURRENCY, BatchResult, run_batch
+from .cache import ImageCache, ResponseCache
+from .circuit import CircuitBreaker
+from .constants import ENDPOINTS
+from .dataurl import DataURLEncoder
+from .download import download_all, result_image_urls
+from .exceptions import APIError
+from .hedging import HedgeCancelled, HedgingPolicy, hedged_call
+from .hooks import Hooks, request_size
+from .metrics import Metrics
+from .multipart import MultipartEncoder
+from .preprocess import ImagePreprocessor
+from .ratelimit import RateLimiter
+from .results import DesignResult
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .streaming import ImageOutput, ImageResponseDecoder
+
+if TYPE_CHECKING:  # pragma: no cover
+    import requests
+
+    from .webhooks import WebhookReceiver
+
 
 # Default configuration
 DEFAULT_BASE_URL = "https://api.decor8.ai"
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_KEEPALIVE_TIMEOUT = 60.0
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Image inputs accepted by the multipart (upload) endpoints
+ImageInput = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+
+
+def __getattr__(name: str) -> Any:
+    # requests (and with it urllib3, idna, charset detection and certifi) is
+    # imported when the first client is created rather than with this module.
+    # decor8ai.client.requests still resolves, e.g. for
+    # mock.patch('decor8ai.client.requests.Session.post').
+    if name == 'requests':
+        return _requests()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _requests() -> Any:
+    """Return the requests module, importing it on first use."""
+    module = globals().get('requests')
+    if module is None:
+        import requests as module
+        globals()['requests'] = module
+    return module
+
+
+def _retryable_exceptions(policy: RetryPolicy) -> Tuple[type, ...]:
+    """Transport errors retried when the RetryPolicy does not name its own."""
+    requests = _requests()
+    # ConnectTimeout is a ConnectionError; a ReadTimeout is retried only on request.
+    if policy.retry_read_timeouts:
+        return (requests.ConnectionError, requests.Timeout)
+    return (requests.ConnectionError,)
+
+# Endpoint path -> endpoint name, for per-endpoint policies
+_ENDPOINT_NAMES = {path: name for name, path in ENDPOINTS.items()}
+
+
+def _endpoint_name(endpoint: str) -> str:
+    """Return the constants.ENDPOINTS name for an endpoint path."""
+    return _ENDPOINT_NAMES.get(endpoint, endpoint.lstrip('/'))
 
 
 def _is_url(path: str) -> bool:
@@ -32,42 +103,114 @@ def _is_url(path: str) -> bool:
         return False
 
 
-def _load_image_bytes(input_image: Union[str, bytes]) -> bytes:
+def _load_image_bytes(
+    input_image: ImageInput,
+    session: Optional["requests.Session"] = None,
+    image_cache: Optional[ImageCache] = None,
+) -> bytes:
     """Load image content from various sources.
 
     Args:
-        input_image: File path, URL, or raw bytes.
+        input_image: File path, URL, bytes-like object or binary file object.
+        session: Session used to download URL inputs. Defaults to a one-off request.
+        image_cache: Optional cache that revalidates URL inputs with conditional GETs.
 
     Returns:
         Image content as bytes.
     """
     if isinstance(input_image, bytes):
         return input_image
-    elif _is_url(input_image):
-        response = requests.get(input_image)
+    elif isinstance(input_image, (bytearray, memoryview, mmap.mmap)):
+        return bytes(input_image)
+    elif hasattr(input_image, 'read'):
+        return input_image.read()
+    elif isinstance(input_image, str) and _is_url(input_image):
+        http = session or _requests()
+        if image_cache is not None:
+            response = http.get(input_image, headers=image_cache.request_headers(input_image))
+            if response.status_code != 304:
+                response.raise_for_status()
+            content = image_cache.resolve(input_image, response.status_code, response.headers, response.content)
+            if content is not None:
+                return content
+        response = http.get(input_image)
         response.raise_for_status()
+        if image_cache is not None:
+            image_cache.resolve(input_image, response.status_code, response.headers, response.content)
         return response.content
     else:
         with open(input_image, 'rb') as img_file:
             return img_file.read()
 
 
-class Decor8AI:
-    """Client for Decor8 AI API.
+class _Decor8AIBase:
+    """Shared payload building and endpoint methods for the Decor8 AI clients.
+
+    Subclasses provide the transport by implementing _post_json() and _post_image().
+    Each endpoint method returns whatever the transport returns, so the same
+    method definitions serve both the blocking and the asyncio client.
+
+    The image URL parameters of the JSON endpoints (input_image_url,
+    mask_image_url, design_style_image_url) also accept a local file path,
+    bytes-like object or binary file object, which is sent as a data URL.
 
     Args:
         api_key: API key for authentication. If not provided, uses DECOR8AI_API_KEY env var.
         base_url: Base URL for the API. Defaults to https://api.decor8.ai
+        retry_policy: Retry behaviour for transient failures. Defaults to RetryPolicy().
+        rate_limiter: Optional client-side rate limiter applied to every attempt.
+        cache: Optional cache for deterministic (seeded) JSON responses.
+        image_cache: Optional disk cache for input images downloaded from URLs.
+        typed_results: Return DesignResult objects instead of raw response dicts.
+        circuit_breaker: Optional per-endpoint circuit breaker checked before every attempt.
+        single_flight: Optional SingleFlight; identical concurrent JSON requests share one API call.
+        preprocessor: Optional ImagePreprocessor applied to every uploaded image.
+        data_urls: DataURLEncoder for local images passed to image URL parameters.
+            Defaults to a per-client encoder that uses preprocessor, if any.
+        hooks: Request lifecycle callbacks. Defaults to an empty Hooks that
+            callbacks can be added to later via client.hooks.
+        metrics: Optional Metrics to record into; attached through hooks.
 
     Raises:
         ValueError: If no API key is provided or found in environment.
     """
 
-    def __init__(self, api_key: Optional[str] = None, base_url: str = DEFAULT_BASE_URL):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        image_cache: Optional[ImageCache] = None,
+        typed_results: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        single_flight: Optional[SingleFlight] = None,
+        preprocessor: Optional[ImagePreprocessor] = None,
+        data_urls: Optional[DataURLEncoder] = None,
+        hooks: Optional[Hooks] = None,
+        metrics: Optional[Metrics] = None,
+    ):
         self.api_key = api_key or os.environ.get('DECOR8AI_API_KEY')
         if not self.api_key:
             raise ValueError("API key required. Pass api_key or set DECOR8AI_API_KEY environment variable.")
         self.base_url = base_url.rstrip('/')
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.image_cache = image_cache
+        self.typed_results = typed_results
+        self.circuit_breaker = circuit_breaker
+        self.single_flight = single_flight
+        self.preprocessor = preprocessor
+        if data_urls is None:
+            data_urls = DataURLEncoder(transform=preprocessor.run if preprocessor is not None else None)
+        self.data_urls = data_urls
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.attach(self.hooks)
 
     def _get_headers(self, content_type: Optional[str] = None) -> Dict[str, str]:
         """Get request headers with authentication."""
@@ -76,24 +219,83 @@ class Decor8AI:
             headers['Content-Type'] = content_type
         return headers
 
+    @staticmethod
+    def _parse_response(response: Any) -> Dict[str, Any]:
+        """Decode a JSON response body.
+
+        Raises:
+            APIError: If the body is not JSON (e.g. a gateway error page).
+        """
+        try:
+            return response.json()
+        except ValueError:
+            raise APIError(response.status_code, response.text[:500]) from None
+
+    def _record_outcome(
+        self, endpoint_name: str, admission: Optional[int], started: float, status_code: Optional[int] = None,
+    ) -> None:
+        """Report an attempt to the circuit breaker; status_code None means the attempt raised."""
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            failed = status_code is None or status_code in breaker.failure_statuses
+            breaker.record(endpoint_name, failed, time.monotonic() - started, admission)
+
+    def _release_admission(self, endpoint_name: str, admission: Optional[int]) -> None:
+        """Give an attempt's circuit admission back without an outcome (it was abandoned)."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(endpoint_name, admission)
+
+    def _result(self, response: Dict[str, Any]) -> Union[Dict[str, Any], DesignResult]:
+        """Wrap a parsed response in a DesignResult when typed_results is enabled."""
+        return DesignResult(response) if self.typed_results else response
+
+    def _cache_lookup(
+        self, endpoint: str, data: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (cache key, cached response) for a JSON request; both None when not cached."""
+        if self.cache is None:
+            return None, None
+        key = self.cache.key_for(_endpoint_name(endpoint), data)
+        if key is None:
+            return None, None
+        return key, self.cache.get(key)
+
+    def _flight_key(self, endpoint: str, data: Dict[str, Any]) -> Optional[str]:
+        """Return the single-flight key for a JSON request, or None when it is not collapsed."""
+        if self.single_flight is None:
+            return None
+        return self.single_flight.key_for(_endpoint_name(endpoint), data)
+
     def _post_json(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a POST request with JSON payload."""
-        response = requests.post(
-            f"{self.base_url}{endpoint}",
-            headers=self._get_headers('application/json'),
-            json=data
-        )
-        return response.json()
-
-    def _post_multipart(self, endpoint: str, files: Dict, data: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make a POST request with multipart form data."""
-        response = requests.post(
-            f"{self.base_url}{endpoint}",
-            headers=self._get_headers(),
-            files=files,
-            data=data or {}
-        )
-        return response.json()
+        raise NotImplementedError
+
+    def _post_image(
+        self,
+        endpoint: str,
+        input_image: ImageInput,
+        data: Optional[Dict] = None,
+        output: Optional[ImageOutput] = None,
+    ) -> Dict[str, Any]:
+        """Upload an image (file path, URL, file object or buffer) with form fields as multipart form data.
+
+        When `output` is given, inline base64 images in the response are decoded
+        into it as the body arrives (see streaming.ImageResponseDecoder).
+        """
+        raise NotImplementedError
+
+    def _webhook_method(self, endpoint: str) -> Callable[..., Any]:
+        """Return the endpoint method for submit_async(), checking that it accepts webhooks_data.
+
+        Raises:
+            ValueError: If endpoint is unknown or does not support webhooks.
+        """
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{endpoint}'. Expected one of: {', '.join(ENDPOINTS)}")
+        method = getattr(self, endpoint)
+        if 'webhooks_data' not in inspect.signature(method).parameters:
+            raise ValueError(f"Endpoint '{endpoint}' does not accept webhooks_data")
+        return method
 
     def _build_payload(self, required: Dict[str, Any], optional: Dict[str, Any]) -> Dict[str, Any]:
         """Build request payload from required and optional parameters."""
@@ -109,7 +311,7 @@ class Decor8AI:
 
     def generate_designs_for_room(
         self,
-        input_image_url: str,
+        input_image_url: ImageInput,
         room_type: str,
         design_style: str,
         num_images: int = 1,
@@ -122,7 +324,7 @@ class Decor8AI:
         seed: Optional[int] = None,
         guidance_scale: Optional[float] = None,
         num_inference_steps: Optional[int] = None,
-        design_style_image_url: Optional[str] = None,
+        design_style_image_url: Optional[ImageInput] = None,
         design_style_image_strength: Optional[float] = None,
         design_creativity: Optional[float] = None,
         webhooks_data: Optional[str] = None,
@@ -225,7 +427,7 @@ class Decor8AI:
 
     def generate_designs(
         self,
-        input_image: Union[str, bytes],
+        input_image: ImageInput,
         room_type: str,
         design_style: str,
         num_images: int = 1,
@@ -238,13 +440,14 @@ class Decor8AI:
         seed: Optional[int] = None,
         guidance_scale: Optional[float] = None,
         num_inference_steps: Optional[int] = None,
+        output: Optional[ImageOutput] = None,
     ) -> Dict[str, Any]:
         """Generate designs using multipart file upload (legacy method).
 
         For new integrations, prefer generate_designs_for_room() with image URLs.
 
         Args:
-            input_image: File path, URL, or bytes of input image.
+            input_image: File path, URL, bytes-like object or binary file object of input image.
             room_type: Type of room.
             design_style: Design aesthetic.
             num_images: Number of designs to generate (1-4).
@@ -256,13 +459,12 @@ class Decor8AI:
             seed: Random seed.
             guidance_scale: Prompt adherence.
             num_inference_steps: Quality/speed balance.
+            output: Directory to stream the generated images into. Each
+                ``info.images[].data`` string is then replaced by a SavedImage.
 
         Returns:
             API response with generated images.
         """
-        image_bytes = _load_image_bytes(input_image)
-        files = {'input_image': ('input_image.jpg', image_bytes)}
-
         data = {
             'room_type': room_type,
             'design_style': design_style,
@@ -286,13 +488,13 @@ class Decor8AI:
         if num_inference_steps:
             data['num_inference_steps'] = num_inference_steps
 
-        return self._post_multipart('/generate_designs', files, data)
+        return self._post_image('/generate_designs', input_image, data, output=output)
 
     # -------------------------------------------------------------------------
     # Wall & Surface Modifications
     # -------------------------------------------------------------------------
 
-    def prime_walls_for_room(self, input_image_url: str) -> Dict[str, Any]:
+    def prime_walls_for_room(self, input_image_url: ImageInput) -> Dict[str, Any]:
         """Prepare room walls for virtual staging by priming them.
 
         Args:
@@ -303,22 +505,27 @@ class Decor8AI:
         """
         return self._post_json('/prime_walls_for_room', {'input_image_url': input_image_url})
 
-    def prime_the_room_walls(self, input_image: Union[str, bytes]) -> Dict[str, Any]:
+    def prime_the_room_walls(
+        self,
+        input_image: ImageInput,
+        *,
+        output: Optional[ImageOutput] = None,
+    ) -> Dict[str, Any]:
         """Prime room walls using file upload (legacy method).
 
         For new integrations, prefer prime_walls_for_room() with image URLs.
 
         Args:
-            input_image: File path, URL, or bytes of input image.
+            input_image: File path, URL, bytes-like object or binary file object of input image.
+            output: Directory or writable binary file to stream the primed image into.
+                The ``info.images[].data`` string is then replaced by a SavedImage.
 
         Returns:
             API response with primed image.
         """
-        image_bytes = _load_image_bytes(input_image)
-        files = {'input_image': ('input_image.jpg', image_bytes)}
-        return self._post_multipart('/prime_the_room_walls', files)
+        return self._post_image('/prime_the_room_walls', input_image, output=output)
 
-    def change_wall_color(self, input_image_url: str, wall_color_hex_code: str) -> Dict[str, Any]:
+    def change_wall_color(self, input_image_url: ImageInput, wall_color_hex_code: str) -> Dict[str, Any]:
         """Change the wall color in a room image.
 
         Args:
@@ -335,7 +542,7 @@ class Decor8AI:
 
     def change_kitchen_cabinets_color(
         self,
-        input_image_url: str,
+        input_image_url: ImageInput,
         cabinet_color_hex_code: str
     ) -> Dict[str, Any]:
         """Change kitchen cabinet colors in an image.
@@ -358,7 +565,7 @@ class Decor8AI:
 
     def remodel_kitchen(
         self,
-        input_image_url: str,
+        input_image_url: ImageInput,
         design_style: str,
         num_images: int = 1,
         scale_factor: Optional[int] = None,
@@ -388,7 +595,7 @@ class Decor8AI:
 
     def remodel_bathroom(
         self,
-        input_image_url: str,
+        input_image_url: ImageInput,
         design_style: str,
         num_images: int = 1,
         scale_factor: Optional[int] = None,
@@ -420,7 +627,7 @@ class Decor8AI:
     # Exterior & Landscaping
     # -------------------------------------------------------------------------
 
-    def replace_sky_behind_house(self, input_image_url: str, sky_type: str) -> Dict[str, Any]:
+    def replace_sky_behind_house(self, input_image_url: ImageInput, sky_type: str) -> Dict[str, Any]:
         """Replace the sky in an exterior property photo.
 
         Args:
@@ -437,7 +644,7 @@ class Decor8AI:
 
     def generate_landscaping_designs(
         self,
-        input_image_url: str,
+        input_image_url: ImageInput,
         yard_type: str,
         garden_style: str,
         num_images: int = 1,
@@ -471,8 +678,8 @@ class Decor8AI:
 
     def remove_objects_from_room(
         self,
-        input_image_url: str,
-        mask_image_url: Optional[str] = None,
+        input_image_url: ImageInput,
+        mask_image_url: Optional[ImageInput] = None,
     ) -> Dict[str, Any]:
         """Remove objects/furniture from a room image.
 
@@ -490,22 +697,25 @@ class Decor8AI:
 
     def upscale_image(
         self,
-        input_image: Union[str, bytes],
-        scale_factor: int = 2
+        input_image: ImageInput,
+        scale_factor: int = 2,
+        *,
+        output: Optional[ImageOutput] = None,
     ) -> Dict[str, Any]:
         """Upscale an image to higher resolution.
 
         Args:
-            input_image: File path, URL, or bytes of input image (max 4MB).
+            input_image: File path, URL, bytes-like object or binary file object of input image (max 4MB).
             scale_factor: Resolution multiplier (1-8).
+            output: Directory or writable binary file to stream the upscaled image into
+                instead of returning it as a base64 string. ``info.upscaled_image``
+                is then a SavedImage.
 
         Returns:
             API response with base64-encoded upscaled image.
         """
-        image_bytes = _load_image_bytes(input_image)
-        files = {'input_image': ('input_image.jpg', image_bytes)}
         data = {'scale_factor': scale_factor}
-        return self._post_multipart('/upscale_image', files, data)
+        return self._post_image('/upscale_image', input_image, data, output=output)
 
     # -------------------------------------------------------------------------
     # 3D & Rendering
@@ -513,7 +723,7 @@ class Decor8AI:
 
     def sketch_to_3d_render(
         self,
-        input_image_url: str,
+        input_image_url: ImageInput,
         design_style: str,
         num_images: int = 1,
         scale_factor: Optional[int] = None,
@@ -545,6 +755,406 @@ class Decor8AI:
         return self._post_json('/sketch_to_3d_render', payload)
 
 
+class Decor8AI(_Decor8AIBase):
+    """Client for Decor8 AI API.
+
+    The client keeps a pooled, keep-alive HTTP session that is shared by all
+    endpoint methods. Call close() when done, or use the client as a context
+    manager.
+
+    Args:
+        api_key: API key for authentication. If not provided, uses DECOR8AI_API_KEY env var.
+        base_url: Base URL for the API. Defaults to https://api.decor8.ai
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept open per host.
+        keepalive_timeout: Seconds a pooled connection may sit idle before the
+            pool is recycled. None keeps connections until the server closes them.
+        retry_policy: Retry behaviour for transient failures (429/502/503 and
+            connection errors by default). Defaults to RetryPolicy(); pass
+            RetryPolicy(max_attempts=1) to disable retries.
+        rate_limiter: Optional RateLimiter; every attempt, including retries,
+            waits for a token before it is sent.
+        cache: Optional ResponseCache; seeded requests it covers are answered
+            from the cache when possible.
+        image_cache: Optional ImageCache; URL inputs to multipart endpoints are
+            revalidated with conditional GETs instead of downloaded every time.
+        hedging: Optional HedgingPolicy; slow seeded JSON requests are duplicated
+            and the first response wins.
+        circuit_breaker: Optional CircuitBreaker; requests to an endpoint whose
+            circuit is open raise CircuitOpenError immediately.
+        typed_results: Return DesignResult objects (typed, lazily decoded, still
+            usable as read-only mappings) instead of raw response dicts.
+        single_flight: Optional SingleFlight; identical JSON requests made while
+            one is already in flight wait for its response instead of calling the API.
+        preprocessor: Optional ImagePreprocessor; images uploaded to multipart
+            endpoints are auto-oriented, stripped of metadata, resized and
+            re-encoded to its byte budget first.
+        data_urls: Optional DataURLEncoder to share memoized data URLs of local
+            images between clients.
+        hooks: Optional Hooks with on_request_start/on_response/on_retry/on_error
+            callbacks, which receive per-phase timings and byte sizes.
+        metrics: Optional Metrics; request counts, errors, retries, in-flight
+            requests and latency histograms are recorded per endpoint.
+
+    Raises:
+        ValueError: If no API key is provided or found in environment.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keepalive_timeout: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        image_cache: Optional[ImageCache] = None,
+        typed_results: bool = False,
+        hedging: Optional[HedgingPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        single_flight: Optional[SingleFlight] = None,
+        preprocessor: Optional[ImagePreprocessor] = None,
+        data_urls: Optional[DataURLEncoder] = None,
+        hooks: Optional[Hooks] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        super().__init__(
+            api_key,
+            base_url,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            image_cache=image_cache,
+            typed_results=typed_results,
+            circuit_breaker=circuit_breaker,
+            single_flight=single_flight,
+            preprocessor=preprocessor,
+            data_urls=data_urls,
+            hooks=hooks,
+            metrics=metrics,
+        )
+        self.keepalive_timeout = keepalive_timeout
+        self.hedging = hedging
+        self._session = self._create_session(pool_connections, pool_maxsize)
+        self._last_used = time.monotonic()
+        self._session_lock = threading.Lock()
+
+    def __enter__(self) -> "Decor8AI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled connections held by the client."""
+        self._session.close()
+
+    @staticmethod
+    def _create_session(pool_connections: int, pool_maxsize: int) -> "requests.Session":
+        """Create a session with pooled adapters for HTTP and HTTPS."""
+        requests = _requests()
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _get_session(self) -> "requests.Session":
+        """Return the shared session, recycling connections idle past keepalive_timeout."""
+        now = time.monotonic()
+        with self._session_lock:
+            if self.keepalive_timeout is not None and now - self._last_used > self.keepalive_timeout:
+                # Closing the adapters only drops the pools; they are rebuilt on demand.
+                self._session.close()
+            self._last_used = now
+        return self._session
+
+    def _request(
+        self,
+        endpoint: str,
+        body: Optional[MultipartEncoder] = None,
+        output: Optional[ImageOutput] = None,
+        cancel_event: Optional[threading.Event] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """POST to an endpoint, retrying transient failures according to retry_policy.
+
+        A streamed multipart body is passed as `body`; it is rewound before each
+        retry, and requests whose body cannot be rewound are not retried. With
+        `output`, the response body is streamed and its inline images decoded
+        into `output`. Once `cancel_event` is set (the request lost a hedge
+        race) no further attempts are made.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open before an attempt.
+        """
+        policy = self.retry_policy
+        retryable = policy.retry_exceptions or _retryable_exceptions(policy)
+        url = f"{self.base_url}{endpoint}"
+        name = _endpoint_name(endpoint)
+        if body is not None:
+            kwargs['data'] = body
+        if output is not None:
+            kwargs['stream'] = True
+        hooks = self.hooks if self.hooks else None
+        request_bytes = request_size(body, kwargs) if hooks is not None else None
+        trace = None
+        attempt = 1
+        while True:
+            queued = time.monotonic()
+            admission = None
+            if self.circuit_breaker is not None:
+                admission = self.circuit_breaker.before_request(name)
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(name)
+                started = time.monotonic()
+                if hooks is not None:
+                    trace = hooks.start(name, attempt, request_bytes, started - queued)
+            except BaseException:
+                self._release_admission(name, admission)
+                raise
+            try:
+                response = self._get_session().post(url, **kwargs)
+            except retryable as exc:
+                self._record_outcome(name, admission, started)
+                delay = policy.exception_delay(attempt)
+                if delay is None or (body is not None and not body.reset()):
+                    if trace is not None:
+                        trace.failed(exc)
+                    raise
+                if trace is not None:
+                    trace.retry(delay, exc)
+            except Exception as exc:
+                self._record_outcome(name, admission, started)
+                if trace is not None:
+                    trace.failed(exc)
+                raise
+            except BaseException as exc:  # interrupted, e.g. KeyboardInterrupt
+                self._release_admission(name, admission)
+                if trace is not None:
+                    trace.failed(exc)
+                raise
+            else:
+                self._record_outcome(name, admission, started, response.status_code)
+                if trace is not None:
+                    trace.received(response)
+                delay = policy.status_delay(attempt, response.status_code, response.headers.get('Retry-After'))
+                if delay is None or (body is not None and not body.reset()):
+                    try:
+                        if output is not None:
+                            result = self._decode_images(response, output)
+                        else:
+                            result = self._parse_response(response)
+                    except BaseException as exc:
+                        if trace is not None:
+                            trace.failed(exc)
+                        raise
+                    if trace is not None:
+                        trace.done(response, streamed=output is not None)
+                    return result
+                if trace is not None:
+                    trace.retry(delay)
+                response.close()
+            if cancel_event is not None and cancel_event.wait(delay):
+                raise HedgeCancelled()
+            if cancel_event is None:
+                time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _decode_images(response: "requests.Response", output: ImageOutput) -> Dict[str, Any]:
+        """Parse a streamed response, decoding its inline images into output.
+
+        Raises:
+            APIError: If the body is not valid JSON or holds invalid image data.
+        """
+        decoder = ImageResponseDecoder(output)
+        try:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                decoder.feed(chunk)
+            return decoder.close()
+        except ValueError as e:
+            decoder.abort()
+            raise APIError(response.status_code, str(e)) from None
+        except BaseException:
+            decoder.abort()
+            raise
+        finally:
+            response.close()
+
+    def _post_json(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a POST request with JSON payload."""
+        data = self.data_urls.encode_payload(data)
+        key, cached = self._cache_lookup(endpoint, data)
+        if cached is not None:
+            return self._result(cached)
+        headers = self._get_headers('application/json')
+        name = _endpoint_name(endpoint)
+
+        def send() -> Dict[str, Any]:
+            if self.hedging is not None and self.hedging.applies(name, data):
+                response = hedged_call(
+                    self.hedging,
+                    name,
+                    lambda cancel_event: self._request(endpoint, cancel_event=cancel_event, headers=headers, json=data),
+                )
+            else:
+                response = self._request(endpoint, headers=headers, json=data)
+            if key is not None:
+                self.cache.set(key, response)
+            return response
+
+        flight = self._flight_key(endpoint, data)
+        return self._result(self.single_flight.do(flight, send) if flight is not None else send())
+
+    def _post_image(
+        self,
+        endpoint: str,
+        input_image: ImageInput,
+        data: Optional[Dict] = None,
+        output: Optional[ImageOutput] = None,
+    ) -> Dict[str, Any]:
+        """Upload an image with form fields as a streamed multipart body.
+
+        File paths, file objects and buffers are streamed to the socket in chunks;
+        only URL inputs are downloaded into memory first.
+        """
+        if self.preprocessor is not None:
+            input_image = self.preprocessor.run(_load_image_bytes(input_image, self._get_session(), self.image_cache))
+        elif isinstance(input_image, str) and _is_url(input_image):
+            input_image = _load_image_bytes(input_image, self._get_session(), self.image_cache)
+        encoder = MultipartEncoder(data, {'input_image': ('input_image.jpg', input_image)})
+        headers = self._get_headers(encoder.content_type)
+        try:
+            return self._result(self._request(endpoint, body=encoder, output=output, headers=headers))
+        finally:
+            encoder.close()
+
+    # -------------------------------------------------------------------------
+    # Batch Execution
+    # -------------------------------------------------------------------------
+
+    def map(
+        self,
+        endpoint: str,
+        items: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[BatchResult]:
+        """Call an endpoint method once per argument dict with bounded concurrency.
+
+        Items are consumed lazily, so `items` may be a generator over millions of rows.
+        A failing item does not abort the batch; its exception is captured on the result.
+
+        Args:
+            endpoint: Endpoint name, one of the keys of constants.ENDPOINTS
+                (e.g. 'generate_designs_for_room').
+            items: Iterable of keyword-argument dicts for the endpoint method.
+            concurrency: Maximum number of requests in flight.
+            ordered: Yield results in input order (True) or as soon as they complete (False).
+
+        Returns:
+            Iterator of BatchResult objects.
+
+        Raises:
+            ValueError: If endpoint is not a known endpoint name.
+        """
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{endpoint}'. Expected one of: {', '.join(ENDPOINTS)}")
+        return run_batch(getattr(self, endpoint), items, concurrency=concurrency, ordered=ordered)
+
+    def batch(
+        self,
+        endpoint: str,
+        items: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> List[BatchResult]:
+        """Run map() to completion and return all results in input order.
+
+        See map() for argument details.
+        """
+        return list(self.map(endpoint, items, concurrency=concurrency, ordered=True))
+
+    # -------------------------------------------------------------------------
+    # Webhooks
+    # -------------------------------------------------------------------------
+
+    def submit_async(self, endpoint: str, receiver: "WebhookReceiver", **kwargs: Any) -> Future:
+        """Submit a request whose result is delivered by webhook, without waiting for it.
+
+        The request is sent with webhooks_data pointing at receiver, and the
+        returned future resolves with the callback payload when it arrives. If
+        the API rejects the request, the future resolves with the error
+        response instead. If no callback arrives within the receiver's
+        timeout, the future fails with TimeoutError.
+
+        Args:
+            endpoint: Endpoint name that accepts webhooks_data (e.g. 'generate_designs_for_room').
+            receiver: A started WebhookReceiver (or AsyncWebhookReceiver) reachable by the API.
+            **kwargs: Arguments for the endpoint method.
+
+        Returns:
+            concurrent.futures.Future resolved with the callback payload.
+
+        Raises:
+            ValueError: If endpoint is unknown or does not accept webhooks_data.
+        """
+        method = self._webhook_method(endpoint)
+        token, future = receiver.register()
+        try:
+            response = method(webhooks_data=receiver.webhooks_data(token), **kwargs)
+        except BaseException:
+            receiver.registry.pop(token)
+            raise
+        if response.get('error') and receiver.registry.pop(token) is not None:
+            future.set_result(response)
+        return future
+
+    # -------------------------------------------------------------------------
+    # Result Downloads
+    # -------------------------------------------------------------------------
+
+    def download_results(
+        self,
+        response: Union[Mapping, Iterable[Mapping]],
+        dest_dir: str,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        verify: bool = True,
+    ) -> List[str]:
+        """Download the result images referenced by one or more API responses.
+
+        Images are fetched concurrently over the client's connection pool and
+        streamed to disk; each file appears under its final name only once
+        complete. Files are named after the image uuid.
+
+        Args:
+            response: API response (or an iterable of responses) whose
+                ``info.images[].url`` / ``info.image.url`` entries to download.
+            dest_dir: Destination directory; created if missing.
+            concurrency: Maximum number of downloads in flight. Keep it at or
+                below pool_maxsize to reuse pooled connections.
+            verify: Check that each download is an image of the advertised size.
+
+        Returns:
+            Local file paths, in the order the images appear in the response(s).
+
+        Raises:
+            DownloadError: If verification of a download fails.
+            requests.HTTPError: If an image URL returns an error status.
+            ValueError: If concurrency is less than 1.
+        """
+        responses = [response] if isinstance(response, Mapping) else list(response)
+        items = [item for r in responses for item in result_image_urls(r)]
+        return download_all(self._get_session(), items, dest_dir, concurrency, verify)
+
+
 # =============================================================================
 # Module-level functions for backward compatibility
 # =============================================================================
@@ -553,31 +1163,48 @@ class Decor8AI:
 _default_client: Optional[Decor8AI] = None
 
 
+_default_client_lock = threading.Lock()
+
+
 def _get_default_client() -> Decor8AI:
-    """Get or create the default client instance."""
+    """Get or create the default client instance.
+
+    The instance (and its connection pool) is shared by all module-level functions.
+    """
     global _default_client
     if _default_client is None:
-        _default_client = Decor8AI()
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Decor8AI()
     return _default_client
 
 
-def prime_the_room_walls(input_image: Union[str, bytes]) -> Dict[str, Any]:
+def close_default_client() -> None:
+    """Close the shared default client and release its pooled connections."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is not None:
+            _default_client.close()
+            _default_client = None
+
+
+def prime_the_room_walls(input_image: ImageInput, output: Optional[ImageOutput] = None) -> Dict[str, Any]:
     """Prime room walls using file upload. See Decor8AI.prime_the_room_walls()."""
-    return _get_default_client().prime_the_room_walls(input_image)
+    return _get_default_client().prime_the_room_walls(input_image, output=output)
 
 
-def prime_walls_for_room(input_image_url: str) -> Dict[str, Any]:
+def prime_walls_for_room(input_image_url: ImageInput) -> Dict[str, Any]:
     """Prime room walls from URL. See Decor8AI.prime_walls_for_room()."""
     return _get_default_client().prime_walls_for_room(input_image_url)
 
 
-def replace_sky_behind_house(input_image_url: str, sky_type: str) -> Dict[str, Any]:
+def replace_sky_behind_house(input_image_url: ImageInput, sky_type: str) -> Dict[str, Any]:
     """Replace sky in exterior photo. See Decor8AI.replace_sky_behind_house()."""
     return _get_default_client().replace_sky_behind_house(input_image_url, sky_type)
 
 
 def generate_designs(
-    input_image: Union[str, bytes],
+    input_image: ImageInput,
     room_type: str = None,
     design_style: str = None,
     num_captions: int = None,
@@ -592,6 +1219,7 @@ def generate_designs(
     seed: int = None,
     guidance_scale: float = None,
     num_inference_steps: int = None,
+    output: Optional[ImageOutput] = None,
 ) -> Dict[str, Any]:
     """Generate designs from file upload. See Decor8AI.generate_designs()."""
     return _get_default_client().generate_designs(
@@ -607,11 +1235,12 @@ def generate_designs(
         seed=seed,
         guidance_scale=guidance_scale,
         num_inference_steps=num_inference_steps,
+        output=output,
     )
 
 
 def generate_designs_for_room(
-    input_image_url: str,
+    input_image_url: ImageInput,
     mask_info: str = None,
     room_type: str = None,
     design_style: str = None,
@@ -681,28 +1310,32 @@ def generate_image_captions(design_style: str, room_type: str, num_captions: int
     })
 
 
-def upscale_image(input_image: Union[str, bytes], scale_factor: int = 2) -> Dict[str, Any]:
+def upscale_image(
+    input_image: ImageInput,
+    scale_factor: int = 2,
+    output: Optional[ImageOutput] = None,
+) -> Dict[str, Any]:
     """Upscale an image. See Decor8AI.upscale_image()."""
-    return _get_default_client().upscale_image(input_image, scale_factor)
+    return _get_default_client().upscale_image(input_image, scale_factor, output=output)
 
 
-def remove_objects_from_room(input_image_url: str, mask_image_url: str = None) -> Dict[str, Any]:
+def remove_objects_from_room(input_image_url: ImageInput, mask_image_url: Optional[ImageInput] = None) -> Dict[str, Any]:
     """Remove objects from room. See Decor8AI.remove_objects_from_room()."""
     return _get_default_client().remove_objects_from_room(input_image_url, mask_image_url)
 
 
-def change_wall_color(input_image_url: str, wall_color_hex_code: str) -> Dict[str, Any]:
+def change_wall_color(input_image_url: ImageInput, wall_color_hex_code: str) -> Dict[str, Any]:
     """Change wall color. See Decor8AI.change_wall_color()."""
     return _get_default_client().change_wall_color(input_image_url, wall_color_hex_code)
 
 
-def change_kitchen_cabinets_color(input_image_url: str, cabinet_color_hex_code: str) -> Dict[str, Any]:
+def change_kitchen_cabinets_color(input_image_url: ImageInput, cabinet_color_hex_code: str) -> Dict[str, Any]:
     """Change kitchen cabinet color. See Decor8AI.change_kitchen_cabinets_color()."""
     return _get_default_client().change_kitchen_cabinets_color(input_image_url, cabinet_color_hex_code)
 
 
 def generate_landscaping_designs(
-    input_image_url: str,
+    input_image_url: ImageInput,
     yard_type: str,
     garden_style: str,
     num_images: int = 1,
@@ -714,7 +1347,7 @@ def generate_landscaping_designs(
 
 
 def remodel_kitchen(
-    input_image_url: str,
+    input_image_url: ImageInput,
     design_style: str,
     num_images: int = 1,
     scale_factor: int = None,
@@ -726,7 +1359,7 @@ def remodel_kitchen(
 
 
 def remodel_bathroom(
-    input_image_url: str,
+    input_image_url: ImageInput,
     design_style: str,
     num_images: int = 1,
     scale_factor: int = None,
@@ -738,7 +1371,7 @@ def remodel_bathroom(
 
 
 def sketch_to_3d_render(
-    input_image_url: str,
+    input_image_url: ImageInput,
     design_style: str,
     num_images: int = 1,
     scale_factor: int = None,
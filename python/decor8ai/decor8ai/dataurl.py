@@ -0,0 +1,159 @@
+"""Data-URL encoding of local images for the JSON endpoints.
+
+The JSON endpoints take image URLs (``input_image_url``, ``mask_image_url``,
+``design_style_image_url``). The API accepts ``data:`` URLs there, so a local
+file or buffer can be sent inline instead of being uploaded to separate
+hosting first. DataURLEncoder does that conversion. It encodes with
+binascii's C base64 encoder and keeps recent results in an LRU keyed by the
+SHA-256 of the image content, so a photo used across many calls (or many
+styles) is only encoded once.
+
+Example:
+    >>> from decor8ai import Decor8AI
+    >>> client = Decor8AI()
+    >>> client.generate_designs_for_room('photos/living.jpg', 'livingroom', 'modern')
+"""
+
+import binascii
+import hashlib
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+
+IMAGE_URL_PARAMS = ('input_image_url', 'mask_image_url', 'design_style_image_url')
+DEFAULT_MEMO_BYTES = 256 * 1024 * 1024
+DEFAULT_MIME_TYPE = 'image/jpeg'
+
+_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'BM', 'image/bmp'),
+)
+
+
+def sniff_mime_type(data: bytes) -> str:
+    """Guess an image MIME type from its leading bytes; defaults to image/jpeg."""
+    for signature, mime_type in _SIGNATURES:
+        if data.startswith(signature):
+            return mime_type
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'image/webp'
+    return DEFAULT_MIME_TYPE
+
+
+def is_remote(value: Any) -> bool:
+    """True if value is already something the API can fetch: an absolute URL or a data URL."""
+    if not isinstance(value, str):
+        return False
+    if value.startswith('data:'):
+        return True
+    try:
+        parsed = urlparse(value)
+    except ValueError:
+        return False
+    return bool(parsed.scheme and parsed.netloc)
+
+
+def encode_data_url(data: bytes, mime_type: Optional[str] = None) -> str:
+    """Return data as a base64 ``data:`` URL."""
+    mime_type = mime_type or sniff_mime_type(data)
+    return f"data:{mime_type};base64," + binascii.b2a_base64(data, newline=False).decode('ascii')
+
+
+def _read(value: Any) -> bytes:
+    """Read a local image: path, bytes-like object or binary file object."""
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, (bytearray, memoryview, mmap.mmap)):
+        return bytes(value)
+    if hasattr(value, 'read'):
+        return value.read()
+    with open(os.fspath(value), 'rb') as f:
+        return f.read()
+
+
+class DataURLEncoder:
+    """Encodes local images as data URLs, memoized by content hash.
+
+    Thread-safe; one instance may be shared by several clients.
+
+    Args:
+        max_bytes: Total size of memoized data URLs to keep; least recently
+            used entries are dropped beyond it. 0 disables memoization.
+        transform: Optional function applied to the image bytes before encoding
+            (the clients pass their ImagePreprocessor here). Its output is
+            memoized together with the encoding.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMO_BYTES, transform: Optional[Callable[[bytes], bytes]] = None):
+        self.max_bytes = max_bytes
+        self.transform = transform
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def encode(self, value: Any) -> str:
+        """Return value unchanged if it is a URL, otherwise its content as a data URL."""
+        if is_remote(value):
+            return value
+        data = _read(value)
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            url = self._entries.get(digest)
+            if url is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return url
+            self.misses += 1
+        if self.transform is not None:
+            data = self.transform(data)
+        url = encode_data_url(data)
+        self._store(digest, url)
+        return url
+
+    def needs_encoding(self, payload: Dict[str, Any]) -> bool:
+        """True if any image URL field of payload holds a local image."""
+        return any(
+            payload.get(name) is not None and not is_remote(payload[name]) for name in IMAGE_URL_PARAMS
+        )
+
+    def encode_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Return payload with local images in its image URL fields replaced by data URLs."""
+        if not self.needs_encoding(payload):
+            return payload
+        payload = dict(payload)
+        for name in IMAGE_URL_PARAMS:
+            if payload.get(name) is not None:
+                payload[name] = self.encode(payload[name])
+        return payload
+
+    def stats(self) -> Dict[str, int]:
+        """Return memo hits, misses, entries and total size in bytes."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'bytes': self._size}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _store(self, digest: str, url: str) -> None:
+        if len(url) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(digest, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[digest] = url
+            self._size += len(url)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
@@ -0,0 +1,116 @@
+"""Concurrent download of result images referenced by API responses.
+
+Used by Decor8AI.download_results(). Each image is streamed to a temporary
+file next to its destination and renamed into place only once complete, so
+a destination path never holds a partial image.
+"""
+
+import mimetypes
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from .exceptions import DownloadError
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def result_image_urls(response: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Return (file stem, url) for every result image in an API response.
+
+    Handles both the multi-image shape (``info.images[]``) and the
+    single-image shape (``info.image``). The stem is the image uuid when the
+    API provides one, otherwise the file name from the URL.
+    """
+    info = response.get('info') or {}
+    images = list(info.get('images') or [])
+    if isinstance(info.get('image'), dict):
+        images.append(info['image'])
+    results = []
+    for image in images:
+        url = image.get('url') if isinstance(image, dict) else None
+        if not url:
+            continue
+        stem = image.get('uuid') or os.path.splitext(os.path.basename(urlparse(url).path))[0] or f'image_{len(results)}'
+        results.append((str(stem), url))
+    return results
+
+
+def _extension(url: str, content_type: Optional[str]) -> str:
+    """Pick a file extension from the URL path, falling back to the Content-Type."""
+    extension = os.path.splitext(urlparse(url).path)[1]
+    if extension:
+        return extension
+    if content_type:
+        guessed = mimetypes.guess_extension(content_type.split(';')[0].strip())
+        if guessed:
+            return '.jpg' if guessed == '.jpe' else guessed
+    return '.jpg'
+
+
+def download_file(session: Any, url: str, dest_dir: str, stem: str, verify: bool = True) -> str:
+    """Stream one URL to dest_dir/<stem><ext> with an atomic rename.
+
+    Args:
+        session: requests.Session (or compatible) used for the GET.
+        url: Image URL.
+        dest_dir: Existing destination directory.
+        stem: File name without extension.
+        verify: Check that the response is an image and that its size matches Content-Length.
+
+    Returns:
+        Path of the downloaded file.
+
+    Raises:
+        DownloadError: If verification fails.
+        requests.HTTPError: If the server returns an error status.
+    """
+    with session.get(url, stream=True) as response:
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type')
+        if verify and content_type and not content_type.startswith('image/'):
+            raise DownloadError(url, f"unexpected Content-Type {content_type!r}")
+        path = os.path.join(dest_dir, stem + _extension(url, content_type))
+        fd, temp_path = tempfile.mkstemp(dir=dest_dir, prefix=f'.{stem}_', suffix='.part')
+        try:
+            size = 0
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+                    size += len(chunk)
+            expected = response.headers.get('Content-Length')
+            if verify and expected is not None and 'Content-Encoding' not in response.headers and int(expected) != size:
+                raise DownloadError(url, f"expected {expected} bytes, received {size}")
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+    return path
+
+
+def download_all(
+    session: Any,
+    items: List[Tuple[str, str]],
+    dest_dir: str,
+    concurrency: int,
+    verify: bool = True,
+) -> List[str]:
+    """Download (stem, url) pairs concurrently and return their paths in order.
+
+    All downloads are attempted; if any fail, the first failure (in input
+    order) is raised after the others have finished.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    os.makedirs(dest_dir, exist_ok=True)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        futures = [executor.submit(download_file, session, url, dest_dir, stem, verify) for stem, url in items]
+    return [future.result() for future in futures]
@@ -0,0 +1,72 @@
+"""Exceptions raised by the Decor8 AI SDK."""
+
+from typing import Any, Optional
+
+
+class Decor8AIError(Exception):
+    """Base class for all errors raised by the Decor8 AI SDK."""
+
+
+class APIError(Decor8AIError):
+    """The API returned a response that could not be used.
+
+    Raised for responses whose body is not JSON, typically proxy or gateway
+    errors that persist after all retries.
+
+    Attributes:
+        status_code: HTTP status code of the response.
+        body: Response body text (truncated).
+    """
+
+    def __init__(self, status_code: int, body: Optional[str] = None):
+        self.status_code = status_code
+        self.body = body
+        message = f"Decor8 AI API returned HTTP {status_code}"
+        if body:
+            message = f"{message}: {body}"
+        super().__init__(message)
+
+
+class DownloadError(Decor8AIError):
+    """A result image download failed verification.
+
+    Attributes:
+        url: URL of the image.
+        reason: What was wrong with the download.
+    """
+
+    def __init__(self, url: str, reason: str):
+        self.url = url
+        self.reason = reason
+        super().__init__(f"Download of {url} failed: {reason}")
+
+
+class CircuitOpenError(Decor8AIError):
+    """A request was rejected without being sent because the endpoint's circuit is open.
+
+    Attributes:
+        endpoint: Endpoint name (a key of constants.ENDPOINTS).
+        retry_after: Seconds until the circuit lets a probe request through.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(f"Circuit for {endpoint} is open; retry in {retry_after:.1f}s")
+
+
+class StageError(Decor8AIError):
+    """A pipeline stage returned an error response or an unusable result.
+
+    Attributes:
+        stage: Name of the stage.
+        error: Error code from the response, or a short description.
+        response: The response the stage returned, if any.
+    """
+
+    def __init__(self, stage: str, error: str, message: str = '', response: Optional[Any] = None):
+        self.stage = stage
+        self.error = error
+        self.response = response
+        detail = f"{error}: {message}" if message else error
+        super().__init__(f"Stage {stage} failed: {detail}")
@@ -0,0 +1,267 @@
+"""Hedged requests for cutting tail latency.
+
+A hedged call sends its request and, if no response has arrived after a
+delay taken from recent latencies of that endpoint (e.g. the 95th
+percentile), sends a duplicate and uses whichever response arrives first.
+Both requests run on a pool of reused threads owned by the policy, so the
+caller returns as soon as either succeeds and the slower request is
+abandoned; when the pool is busy, the call runs in the calling thread
+without hedging. Only requests that are safe to duplicate are hedged: by default the seeded generation endpoints, whose
+repeated calls produce the same result. The number of duplicates in flight
+at once is capped, which bounds the extra load hedging puts on the API.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+
+from .cache import DEFAULT_CACHEABLE_ENDPOINTS
+
+
+DEFAULT_HEDGED_ENDPOINTS = DEFAULT_CACHEABLE_ENDPOINTS
+
+
+class HedgeCancelled(Exception):
+    """Raised inside a request that lost the race, to stop further retries."""
+
+
+class LatencyTracker:
+    """Sliding window of recent request latencies for one endpoint."""
+
+    def __init__(self, window: int):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Return the given percentile (0-100) of the window, or None if it is empty."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(percentile / 100.0 * (len(samples) - 1))))
+        return samples[index]
+
+
+class HedgingPolicy:
+    """When and how much to hedge.
+
+    Args:
+        percentile: Latency percentile (0-100) after which a duplicate is sent.
+        min_samples: Latencies an endpoint must have recorded before it is hedged;
+            until then initial_delay is used (or no hedging when it is None).
+        window: Number of recent latencies kept per endpoint.
+        initial_delay: Hedge delay in seconds used before min_samples are recorded.
+        min_delay: Lower bound in seconds for the hedge delay.
+        max_delay: Upper bound in seconds for the hedge delay.
+        max_extra_in_flight: Maximum number of duplicate requests in flight across
+            all calls sharing this policy. Calls that find the cap reached are not hedged.
+        max_workers: Maximum number of hedgeable calls whose primary request runs
+            on the policy's pool at once. Further calls run in the calling thread
+            and are not hedged.
+        endpoints: Endpoint names (keys of constants.ENDPOINTS) that may be hedged.
+        require_seed: Only hedge payloads that include a 'seed', so both requests
+            produce the same result.
+
+    Raises:
+        ValueError: If percentile is not within (0, 100], or max_extra_in_flight or
+            max_workers is negative.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        *,
+        min_samples: int = 20,
+        window: int = 200,
+        initial_delay: Optional[float] = None,
+        min_delay: float = 0.0,
+        max_delay: Optional[float] = None,
+        max_extra_in_flight: int = 4,
+        max_workers: int = 32,
+        endpoints: Iterable[str] = DEFAULT_HEDGED_ENDPOINTS,
+        require_seed: bool = True,
+    ):
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be within (0, 100]")
+        if max_extra_in_flight < 0:
+            raise ValueError("max_extra_in_flight must not be negative")
+        if max_workers < 0:
+            raise ValueError("max_workers must not be negative")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_extra_in_flight = max_extra_in_flight
+        self.max_workers = max_workers
+        self.endpoints = frozenset(endpoints)
+        self.require_seed = require_seed
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self._extra_in_flight = 0
+        self._primaries_in_flight = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def applies(self, endpoint: str, payload: Dict[str, Any]) -> bool:
+        """Return True if a request to endpoint with payload may be hedged."""
+        if endpoint not in self.endpoints:
+            return False
+        return not self.require_seed or payload.get('seed') is not None
+
+    def _tracker(self, endpoint: str) -> LatencyTracker:
+        with self._lock:
+            tracker = self._trackers.get(endpoint)
+            if tracker is None:
+                tracker = self._trackers[endpoint] = LatencyTracker(self.window)
+            return tracker
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a completed request."""
+        self._tracker(endpoint).record(seconds)
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """Return how long to wait before hedging a request, or None to not hedge it."""
+        tracker = self._tracker(endpoint)
+        delay = tracker.percentile(self.percentile) if len(tracker) >= self.min_samples else self.initial_delay
+        if delay is None:
+            return None
+        delay = max(delay, self.min_delay)
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+
+    def try_acquire(self) -> bool:
+        """Reserve a slot for a duplicate request; False if the cap is reached."""
+        with self._lock:
+            if self._extra_in_flight >= self.max_extra_in_flight:
+                return False
+            self._extra_in_flight += 1
+            self.hedged += 1
+            return True
+
+    def release(self) -> None:
+        """Free a slot reserved by try_acquire()."""
+        with self._lock:
+            self._extra_in_flight -= 1
+
+    def record_win(self) -> None:
+        """Count a call whose duplicate succeeded before the primary request."""
+        with self._lock:
+            self.hedge_wins += 1
+
+    def try_acquire_worker(self) -> bool:
+        """Reserve a pool thread for a primary request; False if all max_workers are busy."""
+        with self._lock:
+            if self._primaries_in_flight >= self.max_workers:
+                return False
+            self._primaries_in_flight += 1
+            return True
+
+    def release_worker(self) -> None:
+        """Free a thread reserved by try_acquire_worker()."""
+        with self._lock:
+            self._primaries_in_flight -= 1
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        """Run func(*args) on the policy's pool.
+
+        The pool has a thread for every primary and duplicate slot, so work
+        submitted after reserving a slot never queues.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.max_workers + self.max_extra_in_flight),
+                    thread_name_prefix='decor8ai-hedge',
+                )
+            return self._executor.submit(func, *args)
+
+
+def _succeeded(future: Future) -> bool:
+    """Return True if a finished request returned a response without an error."""
+    if future.exception() is not None:
+        return False
+    result = future.result()
+    return not (isinstance(result, dict) and result.get('error'))
+
+
+def _start(policy: HedgingPolicy, func: Callable[[threading.Event], Any], release: Callable[[], None]) -> Future:
+    """Run func(cancel_event) on the policy's pool; the future carries the event as .cancel_event."""
+    cancel_event = threading.Event()
+    future = policy.submit(func, cancel_event)
+    future.cancel_event = cancel_event
+    future.add_done_callback(lambda _: release())
+    return future
+
+
+def hedged_call(
+    policy: HedgingPolicy,
+    endpoint: str,
+    request: Callable[[threading.Event], Any],
+) -> Any:
+    """Call request(cancel_event), duplicating it once if it is slow.
+
+    Returns as soon as one request succeeds. The losing request is signalled
+    through its cancel event and abandoned: the transport stops retrying it,
+    and it finishes on its pool thread with its response discarded. A response
+    holding an error counts as a failure, like an exception.
+
+    Args:
+        policy: Policy deciding the delay and the in-flight caps.
+        endpoint: Endpoint name, for latency tracking.
+        request: Performs one request; must raise HedgeCancelled (or return)
+            promptly once its cancel event is set.
+
+    Returns:
+        The first successful response. If both requests fail, the primary's
+        outcome is returned or raised.
+    """
+    def timed(cancel_event: threading.Event) -> Any:
+        started = time.monotonic()
+        result = request(cancel_event)
+        policy.record(endpoint, time.monotonic() - started)
+        return result
+
+    delay = policy.delay(endpoint)
+    if delay is None or not policy.try_acquire_worker():
+        return timed(threading.Event())
+    try:
+        primary = _start(policy, timed, policy.release_worker)
+    except RuntimeError:  # pool shut down at interpreter exit
+        policy.release_worker()
+        return timed(threading.Event())
+
+    if wait([primary], timeout=delay).done or not policy.try_acquire():
+        return primary.result()
+    try:
+        hedge = _start(policy, timed, policy.release)
+    except RuntimeError:
+        policy.release()
+        return primary.result()
+
+    pending = {primary, hedge}
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in (primary, hedge):
+                if future in done and _succeeded(future):
+                    if future is hedge:
+                        policy.record_win()
+                    return future.result()
+        return primary.result()
+    finally:
+        # Also reached when the caller is interrupted; the loser stops retrying.
+        primary.cancel_event.set()
+        hedge.cancel_event.set()
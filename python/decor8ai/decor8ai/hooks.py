@@ -0,0 +1,208 @@
+"""Request lifecycle hooks with per-phase timings.
+
+Register callbacks on a client's Hooks to observe every request attempt:
+
+- on_request_start: an attempt is about to be sent.
+- on_response: the final response of a call was received and decoded.
+- on_retry: an attempt failed (retryable status or exception) and will be retried.
+- on_error: the call raised, or was cancelled or interrupted.
+
+Each callback receives the RequestTrace of the attempt. Its ``timings`` dict
+holds seconds spent in each phase so far:
+
+- queue: waiting for the rate limiter (and circuit breaker check).
+- headers: from sending the request until the response headers arrived, i.e.
+  connection setup (DNS, TCP, TLS), upload and server processing. The HTTP
+  libraries do not report those separately.
+- body: reading the response body.
+- decode: parsing the JSON (and decoding images for ``output=`` requests, where
+  reading and decoding are interleaved and both count here).
+- total: the whole attempt, excluding queue.
+
+Hooks run synchronously in the requesting thread (or event loop), so they
+should be quick. Exceptions raised by a hook propagate to the caller. When no
+callbacks are registered the request path skips all instrumentation.
+
+Example:
+    >>> client = Decor8AI()
+    >>> @client.hooks.on('on_response')
+    ... def log(trace):
+    ...     print(trace.endpoint, trace.status_code, trace.timings)
+"""
+
+import datetime
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+EVENTS = ('on_request_start', 'on_response', 'on_retry', 'on_error')
+
+Hook = Callable[["RequestTrace"], Any]
+
+
+class Hooks:
+    """Callbacks for request lifecycle events.
+
+    Args:
+        on_request_start: Callback, or list of callbacks, for each attempt sent.
+        on_response: Callback(s) for final responses.
+        on_retry: Callback(s) for attempts that will be retried.
+        on_error: Callback(s) for calls that raise.
+    """
+
+    def __init__(
+        self,
+        on_request_start: Any = None,
+        on_response: Any = None,
+        on_retry: Any = None,
+        on_error: Any = None,
+    ):
+        self._callbacks: Dict[str, List[Hook]] = {event: [] for event in EVENTS}
+        for event, callbacks in zip(EVENTS, (on_request_start, on_response, on_retry, on_error)):
+            if callbacks is None:
+                continue
+            for callback in callbacks if isinstance(callbacks, (list, tuple)) else [callbacks]:
+                self.add(event, callback)
+
+    def __bool__(self) -> bool:
+        return any(self._callbacks.values())
+
+    def add(self, event: str, callback: Hook) -> Hook:
+        """Register callback for event. Returns callback.
+
+        Raises:
+            ValueError: If event is not one of EVENTS.
+        """
+        if event not in self._callbacks:
+            raise ValueError(f"Unknown event '{event}'. Expected one of: {', '.join(EVENTS)}")
+        self._callbacks[event].append(callback)
+        return callback
+
+    def on(self, event: str) -> Callable[[Hook], Hook]:
+        """Decorator form of add()."""
+        return lambda callback: self.add(event, callback)
+
+    def remove(self, event: str, callback: Hook) -> None:
+        """Unregister callback from event; does nothing if it is not registered."""
+        callbacks = self._callbacks.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def emit(self, event: str, trace: "RequestTrace") -> None:
+        for callback in self._callbacks[event]:
+            callback(trace)
+
+    def start(
+        self,
+        endpoint: str,
+        attempt: int,
+        request_bytes: Optional[int],
+        queued: float,
+    ) -> "RequestTrace":
+        """Begin tracing an attempt and fire on_request_start."""
+        trace = RequestTrace(self, endpoint, attempt, request_bytes, queued)
+        self.emit('on_request_start', trace)
+        return trace
+
+
+class RequestTrace:
+    """Timings, sizes and outcome of one request attempt.
+
+    Attributes:
+        endpoint: Endpoint name (a key of constants.ENDPOINTS).
+        attempt: Attempt number, starting at 1.
+        request_bytes: Size of the request body, or None if unknown.
+        response_bytes: Size of the response body, or None if unknown.
+        status_code: HTTP status, once a response arrived.
+        error: Exception raised by the attempt, if any.
+        retry_delay: Seconds until the next attempt, for on_retry.
+        timings: Seconds spent per phase (see the module docstring).
+    """
+
+    __slots__ = (
+        'endpoint', 'attempt', 'request_bytes', 'response_bytes', 'status_code',
+        'error', 'retry_delay', 'timings', '_hooks', '_started', '_mark',
+    )
+
+    def __init__(self, hooks: Hooks, endpoint: str, attempt: int, request_bytes: Optional[int], queued: float):
+        self._hooks = hooks
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.request_bytes = request_bytes
+        self.response_bytes: Optional[int] = None
+        self.status_code: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.retry_delay: Optional[float] = None
+        self.timings: Dict[str, float] = {'queue': queued}
+        self._started = self._mark = time.monotonic()
+
+    def received(self, response: Any, headers: Optional[float] = None) -> None:
+        """Record that the response arrived (and, unless streamed, its body was read).
+
+        Args:
+            response: The HTTP response.
+            headers: Seconds from the start of the attempt until the headers
+                arrived, when measured by the caller. Otherwise it is taken
+                from response.elapsed where the HTTP library reports it.
+        """
+        now = time.monotonic()
+        sent = now - self._started
+        if headers is None:
+            elapsed = getattr(response, 'elapsed', None)
+            headers = elapsed.total_seconds() if isinstance(elapsed, datetime.timedelta) else sent
+        headers = min(headers, sent)
+        self.timings['headers'] = headers
+        self.timings['body'] = sent - headers
+        self.status_code = response.status_code
+        self._mark = now
+
+    def done(self, response: Any, streamed: bool = False) -> None:
+        """Record the decoded final response and fire on_response."""
+        now = time.monotonic()
+        self.timings['decode'] = now - self._mark
+        self.timings['total'] = now - self._started
+        self.response_bytes = _body_size(response, streamed)
+        self._hooks.emit('on_response', self)
+
+    def retry(self, delay: float, error: Optional[BaseException] = None) -> None:
+        """Fire on_retry for an attempt that will be repeated after delay seconds."""
+        self.error = error
+        self.retry_delay = delay
+        self.timings['total'] = time.monotonic() - self._started
+        self._hooks.emit('on_retry', self)
+
+    def failed(self, error: BaseException) -> None:
+        """Fire on_error for an exception leaving the call."""
+        self.error = error
+        self.timings['total'] = time.monotonic() - self._started
+        self._hooks.emit('on_error', self)
+
+    def __repr__(self) -> str:
+        return f"RequestTrace({self.endpoint!r}, attempt={self.attempt}, status={self.status_code})"
+
+
+def request_size(body: Any, kwargs: Dict[str, Any]) -> Optional[int]:
+    """Return the size of a request body, or None when it is not known up front.
+
+    Only called when hooks are registered: JSON bodies are serialized once more
+    to measure them.
+    """
+    if body is not None:
+        return body.content_length
+    if kwargs.get('json') is not None:
+        return len(json.dumps(kwargs['json']).encode('utf-8'))
+    return None
+
+
+def _body_size(response: Any, streamed: bool) -> Optional[int]:
+    length = response.headers.get('Content-Length') if hasattr(response, 'headers') else None
+    if length is not None:
+        try:
+            return int(length)
+        except ValueError:
+            pass
+    if streamed:
+        return None
+    content = getattr(response, 'content', None)
+    return len(content) if isinstance(content, (bytes, bytearray)) else None
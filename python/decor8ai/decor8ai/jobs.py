@@ -0,0 +1,292 @@
+"""Resumable batch jobs backed by a SQLite journal.
+
+JobRunner records every item of a batch in a local SQLite database (WAL
+mode) together with its state, attempt count and response. If the process
+dies, running the job again skips finished items and re-runs only what was
+pending or in flight. SIGTERM/SIGINT trigger a graceful drain: no new items
+are started, in-flight items are finished and recorded, and run() returns.
+
+Example:
+    >>> from decor8ai import Decor8AI, JobRunner
+    >>> with Decor8AI() as client:
+    ...     runner = JobRunner(client, 'staging.db', 'generate_designs_for_room', concurrency=16)
+    ...     runner.add(rows)           # idempotent: re-adding the same rows is a no-op
+    ...     counts = runner.run()      # resumes where the previous run stopped
+"""
+
+import json
+import os
+import signal
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from .batch import DEFAULT_CONCURRENCY, run_batch
+from .constants import ENDPOINTS
+
+
+PENDING = 'pending'
+IN_FLIGHT = 'in_flight'
+DONE = 'done'
+FAILED = 'failed'
+STATES = (PENDING, IN_FLIGHT, DONE, FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    kwargs TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    response TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_state ON items (state, id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize typed results (Mappings) and SavedImage paths in responses."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if hasattr(value, '__fspath__'):
+        try:
+            return os.fspath(value)
+        except TypeError:
+            pass
+    return str(value)
+
+
+class JobJournal:
+    """SQLite journal of batch items and their states.
+
+    Items are identified by their position in the input, so re-adding the same
+    manifest is idempotent. The journal is safe to use from several threads.
+
+    Args:
+        path: Database file; created if missing.
+        endpoint: Endpoint name the journal belongs to. Opening an existing
+            journal with a different endpoint raises ValueError.
+    """
+
+    def __init__(self, path: str, endpoint: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(_SCHEMA)
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'endpoint'").fetchone()
+        if row is None:
+            self._db.execute("INSERT INTO meta (key, value) VALUES ('endpoint', ?)", (endpoint,))
+        elif row[0] != endpoint:
+            raise ValueError(f"Journal {path} belongs to endpoint '{row[0]}', not '{endpoint}'")
+        self.endpoint = endpoint
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def add(self, items: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """Add items that are not yet in the journal. Returns the number added."""
+        added = 0
+        chunk = []
+        now = time.time()
+
+        def flush():
+            nonlocal added
+            with self._lock:
+                with self._db:
+                    self._db.execute('BEGIN')
+                    before = self._db.total_changes
+                    self._db.executemany(
+                        'INSERT OR IGNORE INTO items (id, kwargs, updated_at) VALUES (?, ?, ?)', chunk
+                    )
+                    added += self._db.total_changes - before
+            chunk.clear()
+
+        for index, kwargs in enumerate(items):
+            chunk.append((index, json.dumps(kwargs, sort_keys=True), now))
+            if len(chunk) >= chunk_size:
+                flush()
+        if chunk:
+            flush()
+        return added
+
+    def recover(self) -> int:
+        """Return items left in flight by a previous process to pending. Returns how many."""
+        with self._lock:
+            cursor = self._db.execute(
+                'UPDATE items SET state = ?, updated_at = ? WHERE state = ?', (PENDING, time.time(), IN_FLIGHT)
+            )
+            return cursor.rowcount
+
+    def pending(self, after: int = -1, limit: int = 500) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Return up to limit pending (id, kwargs) pairs with id greater than after."""
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT id, kwargs FROM items WHERE state = ? AND id > ? ORDER BY id LIMIT ?',
+                (PENDING, after, limit),
+            ).fetchall()
+        return ((item_id, json.loads(kwargs)) for item_id, kwargs in rows)
+
+    def start(self, item_id: int) -> None:
+        """Mark an item in flight and count the attempt."""
+        with self._lock:
+            self._db.execute(
+                'UPDATE items SET state = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?',
+                (IN_FLIGHT, time.time(), item_id),
+            )
+
+    def finish(self, item_id: int, state: str, response: Any = None, error: Optional[str] = None) -> None:
+        """Record the outcome of an attempt (state is DONE, FAILED or PENDING to retry)."""
+        body = json.dumps(response, default=_json_default) if response is not None else None
+        with self._lock:
+            self._db.execute(
+                'UPDATE items SET state = ?, response = ?, error = ?, updated_at = ? WHERE id = ?',
+                (state, body, error, time.time(), item_id),
+            )
+
+    def attempts(self, item_id: int) -> int:
+        with self._lock:
+            row = self._db.execute('SELECT attempts FROM items WHERE id = ?', (item_id,)).fetchone()
+        return row[0] if row else 0
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of items in each state."""
+        with self._lock:
+            rows = self._db.execute('SELECT state, COUNT(*) FROM items GROUP BY state').fetchall()
+        counts = dict.fromkeys(STATES, 0)
+        counts.update(rows)
+        return counts
+
+    def results(self, state: str = DONE) -> Iterator[Tuple[int, Dict[str, Any], Any, Optional[str]]]:
+        """Yield (id, kwargs, response, error) for items in the given state, in input order."""
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT id, kwargs, response, error FROM items WHERE state = ? ORDER BY id', (state,)
+            ).fetchall()
+        for item_id, kwargs, response, error in rows:
+            yield item_id, json.loads(kwargs), json.loads(response) if response else None, error
+
+
+class JobRunner:
+    """Runs an endpoint over a journaled batch with bounded concurrency.
+
+    Args:
+        client: Decor8AI client used for the calls.
+        journal: Path of the SQLite journal (or an open JobJournal).
+        endpoint: Endpoint name, one of the keys of constants.ENDPOINTS.
+        concurrency: Maximum number of requests in flight.
+        max_attempts: Runs an item may take before it is left failed. Each run
+            already includes the client's own retries; this covers items that
+            still fail (e.g. error responses) and is applied across restarts.
+        handle_signals: Drain gracefully on SIGTERM/SIGINT while run() is active
+            (only possible from the main thread).
+
+    Raises:
+        ValueError: If endpoint is unknown.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        journal: Any,
+        endpoint: str,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_attempts: int = 1,
+        handle_signals: bool = True,
+    ):
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{endpoint}'. Expected one of: {', '.join(ENDPOINTS)}")
+        self.client = client
+        self.endpoint = endpoint
+        self.journal = journal if isinstance(journal, JobJournal) else JobJournal(journal, endpoint)
+        self.concurrency = concurrency
+        self.max_attempts = max(1, max_attempts)
+        self.handle_signals = handle_signals
+        self._stopping = threading.Event()
+
+    def add(self, items: Iterable[Dict[str, Any]]) -> int:
+        """Stage items; ones already journaled (by position) are skipped. Returns the number added."""
+        return self.journal.add(items)
+
+    def stop(self) -> None:
+        """Drain: start no new items, let in-flight ones finish. Safe to call from any thread."""
+        self._stopping.set()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stopping.is_set()
+
+    def _items(self, ids: Dict[int, int]) -> Iterator[Dict[str, Any]]:
+        """Yield pending items lazily, marking each in flight as it is handed out."""
+        last = -1
+        index = 0
+        while not self._stopping.is_set():
+            page = list(self.journal.pending(after=last))
+            if not page:
+                return
+            for item_id, kwargs in page:
+                if self._stopping.is_set():
+                    return
+                self.journal.start(item_id)
+                ids[index] = item_id
+                index += 1
+                last = item_id
+                yield kwargs
+
+    def _install_signal_handlers(self) -> Dict[int, Any]:
+        if not self.handle_signals or threading.current_thread() is not threading.main_thread():
+            return {}
+        previous = {}
+
+        def handler(signum, frame):
+            self.stop()
+            # A second signal gets the previous behaviour (e.g. KeyboardInterrupt).
+            for sig, old in previous.items():
+                signal.signal(sig, old)
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            previous[sig] = signal.signal(sig, handler)
+        return previous
+
+    def run(self) -> Dict[str, int]:
+        """Process pending items until none are left or a drain is requested.
+
+        Returns:
+            Number of items in each state after the run.
+        """
+        self._stopping.clear()
+        self.journal.recover()
+        previous = self._install_signal_handlers()
+        method = getattr(self.client, self.endpoint)
+        try:
+            while not self._stopping.is_set():
+                ids: Dict[int, int] = {}
+                processed = 0
+                for result in run_batch(method, self._items(ids), concurrency=self.concurrency, ordered=False):
+                    processed += 1
+                    self._record(ids.pop(result.index), result)
+                # Items put back to pending for another attempt are picked up by the next pass.
+                if processed == 0 or self.journal.counts()[PENDING] == 0:
+                    break
+        finally:
+            for sig, old in previous.items():
+                signal.signal(sig, old)
+        return self.journal.counts()
+
+    def _record(self, item_id: int, result: Any) -> None:
+        if result.ok and not (isinstance(result.result, Mapping) and result.result.get('error')):
+            self.journal.finish(item_id, DONE, response=result.result)
+            return
+        if result.ok:
+            response, error = result.result, f"{result.result.get('error')}: {result.result.get('message', '')}"
+        else:
+            response, error = None, f"{type(result.error).__name__}: {result.error}"
+        retry = self.journal.attempts(item_id) < self.max_attempts
+        self.journal.finish(item_id, PENDING if retry else FAILED, response=response, error=error)
@@ -0,0 +1,314 @@
+"""Ready-made request metrics with per-endpoint latency histograms.
+
+A Metrics instance attached to a client (``Decor8AI(metrics=...)``) records,
+per endpoint: requests sent (every attempt), retries, errors by class (HTTP
+status class such as ``5xx`` or the exception type), requests in flight and
+a latency histogram of completed attempts. snapshot() returns everything as
+a plain dict; prometheus() renders the Prometheus text exposition format.
+
+Recording is lock-free: each thread updates its own shard of counters and
+histogram buckets, and readers merge the shards. When a thread exits, its
+shard is folded into a shared one, so the cost of reading stays bounded by
+the number of live threads. Histograms use HDR-style
+log-linear buckets (16 per power of two, about 3% relative error) from 60µs
+to over an hour, so percentiles stay accurate without storing samples.
+
+Metrics are fed by the client's request hooks (see hooks.py).
+
+Example:
+    >>> from decor8ai import Decor8AI, Metrics
+    >>> metrics = Metrics()
+    >>> client = Decor8AI(metrics=metrics)
+    >>> ...
+    >>> metrics.snapshot()['generate_designs_for_room']['latency']['p99']
+    41.3
+    >>> print(metrics.prometheus())
+"""
+
+import math
+import threading
+import weakref
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .hooks import Hooks, RequestTrace
+
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+DEFAULT_NAMESPACE = 'decor8ai'
+
+_SUB_BUCKETS = 16
+_MIN_EXPONENT = -13  # frexp exponent of the smallest tracked value (~61µs)
+_MAX_EXPONENT = 13   # frexp exponent of the largest tracked value (~2.3h)
+_BUCKETS = (_MAX_EXPONENT - _MIN_EXPONENT + 1) * _SUB_BUCKETS
+
+
+def bucket_index(seconds: float) -> int:
+    """Return the histogram bucket for a duration; out-of-range values are clamped."""
+    if seconds <= 0:
+        return 0
+    mantissa, exponent = math.frexp(seconds)
+    if exponent < _MIN_EXPONENT:
+        return 0
+    if exponent > _MAX_EXPONENT:
+        return _BUCKETS - 1
+    return (exponent - _MIN_EXPONENT) * _SUB_BUCKETS + int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+
+
+def bucket_upper_bound(index: int) -> float:
+    """Return the largest duration that falls into bucket index."""
+    octave, sub = divmod(index, _SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub + 1) / (2.0 * _SUB_BUCKETS), octave + _MIN_EXPONENT)
+
+
+class _Shard:
+    """One thread's counters and histograms; only that thread writes to it."""
+
+    __slots__ = ('counters', 'buckets', 'sums', 'maxima')
+
+    def __init__(self):
+        self.counters: Dict[Tuple[str, str, str], int] = {}
+        self.buckets: Dict[str, List[int]] = {}
+        self.sums: Dict[str, float] = {}
+        self.maxima: Dict[str, float] = {}
+
+    def count(self, key: Tuple[str, str, str]) -> None:
+        self.counters[key] = self.counters.get(key, 0) + 1
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        buckets = self.buckets.get(endpoint)
+        if buckets is None:
+            buckets = self.buckets[endpoint] = [0] * _BUCKETS
+        buckets[bucket_index(seconds)] += 1
+        self.sums[endpoint] = self.sums.get(endpoint, 0.0) + seconds
+        if seconds > self.maxima.get(endpoint, 0.0):
+            self.maxima[endpoint] = seconds
+
+    def merge(self, other: '_Shard') -> None:
+        """Add other's values to this shard. other must no longer be written to."""
+        for key, value in other.counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for endpoint, counts in other.buckets.items():
+            merged = self.buckets.setdefault(endpoint, [0] * _BUCKETS)
+            for index, count in enumerate(counts):
+                if count:
+                    merged[index] += count
+        for endpoint, total in other.sums.items():
+            self.sums[endpoint] = self.sums.get(endpoint, 0.0) + total
+        for endpoint, peak in other.maxima.items():
+            self.maxima[endpoint] = max(self.maxima.get(endpoint, 0.0), peak)
+
+
+class _ShardOwner:
+    """Thread-local handle whose collection at thread exit retires the thread's shard."""
+
+    __slots__ = ('shard', '__weakref__')
+
+    def __init__(self, shard: _Shard):
+        self.shard = shard
+
+
+class Metrics:
+    """Per-endpoint request metrics.
+
+    One instance may be attached to several clients; their numbers are combined.
+
+    Args:
+        quantiles: Latency quantiles (0-1) reported by snapshot() and prometheus().
+        namespace: Prefix for Prometheus metric names.
+
+    Raises:
+        ValueError: If a quantile is outside (0, 1).
+    """
+
+    def __init__(self, quantiles: Iterable[float] = DEFAULT_QUANTILES, namespace: str = DEFAULT_NAMESPACE):
+        self.quantiles = tuple(quantiles)
+        if any(not 0 < q < 1 for q in self.quantiles):
+            raise ValueError("quantiles must be within (0, 1)")
+        self.namespace = namespace
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        # Values of exited threads, and shards whose thread has exited but that
+        # are not folded in yet. The finalizer only appends to _exited: it can
+        # run during garbage collection in any thread, even one holding _lock.
+        self._retired = _Shard()
+        self._exited: List[_Shard] = []
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def attach(self, target: Any) -> Any:
+        """Register this instance's callbacks on a client (or a Hooks object). Returns target."""
+        hooks = target if isinstance(target, Hooks) else target.hooks
+        hooks.add('on_request_start', self._on_start)
+        hooks.add('on_response', self._on_response)
+        hooks.add('on_retry', self._on_retry)
+        hooks.add('on_error', self._on_error)
+        return target
+
+    def _shard(self) -> _Shard:
+        owner = getattr(self._local, 'owner', None)
+        if owner is None:
+            shard = _Shard()
+            owner = self._local.owner = _ShardOwner(shard)
+            weakref.finalize(owner, self._exited.append, shard)
+            with self._lock:
+                self._retire_exited()
+                self._shards.append(shard)
+        return owner.shard
+
+    def _retire_exited(self) -> None:
+        # Called with _lock held.
+        while self._exited:
+            shard = self._exited.pop()
+            try:
+                self._shards.remove(shard)
+            except ValueError:  # recorded before reset()
+                continue
+            self._retired.merge(shard)
+
+    def _on_start(self, trace: RequestTrace) -> None:
+        self._shard().count(('requests', trace.endpoint, ''))
+
+    def _finish(self, shard: _Shard, trace: RequestTrace) -> None:
+        shard.count(('finished', trace.endpoint, ''))
+        if trace.status_code is not None:
+            shard.observe(trace.endpoint, trace.timings['total'])
+
+    def _on_response(self, trace: RequestTrace) -> None:
+        shard = self._shard()
+        self._finish(shard, trace)
+        if trace.status_code >= 400:
+            shard.count(('errors', trace.endpoint, f"{trace.status_code // 100}xx"))
+
+    def _on_retry(self, trace: RequestTrace) -> None:
+        shard = self._shard()
+        self._finish(shard, trace)
+        shard.count(('retries', trace.endpoint, ''))
+        error = type(trace.error).__name__ if trace.error is not None else f"{trace.status_code // 100}xx"
+        shard.count(('errors', trace.endpoint, error))
+
+    def _on_error(self, trace: RequestTrace) -> None:
+        shard = self._shard()
+        self._finish(shard, trace)
+        shard.count(('errors', trace.endpoint, type(trace.error).__name__))
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def _merged(self) -> Tuple[Dict[Tuple[str, str, str], int], Dict[str, List[int]], Dict[str, float], Dict[str, float]]:
+        counters: Dict[Tuple[str, str, str], int] = {}
+        buckets: Dict[str, List[int]] = {}
+        sums: Dict[str, float] = {}
+        maxima: Dict[str, float] = {}
+        with self._lock:
+            self._retire_exited()
+            shards = list(self._shards)
+            retired = _Shard()
+            retired.merge(self._retired)
+        for shard in [retired] + shards:
+            # dict.copy() is atomic under the GIL, so writers never need to lock.
+            for key, value in shard.counters.copy().items():
+                counters[key] = counters.get(key, 0) + value
+            for endpoint, counts in shard.buckets.copy().items():
+                merged = buckets.setdefault(endpoint, [0] * _BUCKETS)
+                for index, count in enumerate(list(counts)):
+                    if count:
+                        merged[index] += count
+            for endpoint, total in shard.sums.copy().items():
+                sums[endpoint] = sums.get(endpoint, 0.0) + total
+            for endpoint, peak in shard.maxima.copy().items():
+                maxima[endpoint] = max(maxima.get(endpoint, 0.0), peak)
+        return counters, buckets, sums, maxima
+
+    @staticmethod
+    def _quantile(counts: List[int], total: int, quantile: float) -> float:
+        rank = quantile * total
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if count and seen >= rank:
+                return bucket_upper_bound(index)
+        return bucket_upper_bound(len(counts) - 1)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return current metrics per endpoint.
+
+        Returns:
+            Dict of endpoint name to ``requests``, ``in_flight``, ``retries``,
+            ``errors`` (class to count) and ``latency`` (``count``, ``sum``,
+            ``max`` and one ``pNN`` entry per quantile, in seconds).
+        """
+        counters, buckets, sums, maxima = self._merged()
+        endpoints = sorted({endpoint for _, endpoint, _ in counters} | set(buckets))
+        result: Dict[str, Dict[str, Any]] = {}
+        for endpoint in endpoints:
+            counts = buckets.get(endpoint, [0] * _BUCKETS)
+            total = sum(counts)
+            latency: Dict[str, float] = {'count': total, 'sum': sums.get(endpoint, 0.0), 'max': maxima.get(endpoint, 0.0)}
+            for quantile in self.quantiles:
+                latency[_quantile_label(quantile)] = self._quantile(counts, total, quantile) if total else 0.0
+            requests = counters.get(('requests', endpoint, ''), 0)
+            result[endpoint] = {
+                'requests': requests,
+                'in_flight': requests - counters.get(('finished', endpoint, ''), 0),
+                'retries': counters.get(('retries', endpoint, ''), 0),
+                'errors': {label: n for (name, ep, label), n in sorted(counters.items()) if name == 'errors' and ep == endpoint},
+                'latency': latency,
+            }
+        return result
+
+    def prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        prefix = self.namespace
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_requests_total Requests sent, including retries.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        lines += [f'{prefix}_requests_total{{endpoint="{ep}"}} {m["requests"]}' for ep, m in snapshot.items()]
+        lines += [
+            f"# HELP {prefix}_retries_total Attempts that were retried.",
+            f"# TYPE {prefix}_retries_total counter",
+        ]
+        lines += [f'{prefix}_retries_total{{endpoint="{ep}"}} {m["retries"]}' for ep, m in snapshot.items()]
+        lines += [
+            f"# HELP {prefix}_errors_total Failed attempts by error class.",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        for endpoint, metrics in snapshot.items():
+            for label, count in metrics['errors'].items():
+                lines.append(f'{prefix}_errors_total{{endpoint="{endpoint}",class="{label}"}} {count}')
+        lines += [
+            f"# HELP {prefix}_in_flight Requests currently in flight.",
+            f"# TYPE {prefix}_in_flight gauge",
+        ]
+        lines += [f'{prefix}_in_flight{{endpoint="{ep}"}} {m["in_flight"]}' for ep, m in snapshot.items()]
+        lines += [
+            f"# HELP {prefix}_request_duration_seconds Latency of completed attempts.",
+            f"# TYPE {prefix}_request_duration_seconds summary",
+        ]
+        for endpoint, metrics in snapshot.items():
+            latency = metrics['latency']
+            for quantile in self.quantiles:
+                value = latency[_quantile_label(quantile)]
+                lines.append(
+                    f'{prefix}_request_duration_seconds{{endpoint="{endpoint}",quantile="{quantile:g}"}} {value:.6g}'
+                )
+            lines.append(f'{prefix}_request_duration_seconds_sum{{endpoint="{endpoint}"}} {latency["sum"]:.6g}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{endpoint="{endpoint}"}} {latency["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """Drop all recorded values. In-flight requests finishing afterwards may show as negative in_flight."""
+        with self._lock:
+            self._shards = []
+            self._retired = _Shard()
+            self._local = threading.local()
+
+
+def _quantile_label(quantile: float) -> str:
+    """Return the snapshot key for a quantile: 0.5 -> 'p50', 0.999 -> 'p99.9'."""
+    return f"p{quantile * 100:g}"
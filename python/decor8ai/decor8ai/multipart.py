@@ -0,0 +1,223 @@
+"""Streaming multipart/form-data encoder for image uploads.
+
+MultipartEncoder produces the request body incrementally from its sources
+(file paths, open binary files, bytes-like objects and mmap buffers), so an
+upload never holds more than one chunk of the body in memory beyond what the
+caller already has.
+"""
+
+import mmap
+import os
+import uuid
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+class _Source:
+    """Readable view over one file part's content."""
+
+    def __init__(self, source: Any):
+        self._source = source
+        self._file = None
+        self._owns_file = False
+        self._view: Optional[memoryview] = None
+        self._offset = 0
+        self._start: Optional[int] = None
+        self.size: Optional[int] = None
+
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            self._view = memoryview(source).cast('B')
+            self.size = self._view.nbytes
+        elif isinstance(source, (str, os.PathLike)):
+            self.size = os.path.getsize(source)
+        elif hasattr(source, 'read'):
+            self._file = source
+            self._start, self.size = _file_position_and_size(source)
+        else:
+            raise TypeError(f"Unsupported image source type: {type(source).__name__}")
+
+    def read(self, size: int) -> bytes:
+        if self._view is not None:
+            chunk = self._view[self._offset:self._offset + size]
+            self._offset += len(chunk)
+            return bytes(chunk)
+        if self._file is None:
+            self._file = open(self._source, 'rb')
+            self._owns_file = True
+        return self._file.read(size)
+
+    def reset(self) -> bool:
+        if self._view is not None:
+            self._offset = 0
+            return True
+        if self._owns_file:
+            self._file.seek(0)
+            return True
+        if self._file is None:
+            return True
+        if self._start is None:
+            return False
+        self._file.seek(self._start)
+        return True
+
+    def close(self) -> None:
+        if self._owns_file and self._file is not None:
+            self._file.close()
+            self._file = None
+            self._owns_file = False
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+
+
+def _file_position_and_size(file: Any) -> Tuple[Optional[int], Optional[int]]:
+    """Return (start position, remaining bytes) of a file object, or (None, None) if it is not seekable."""
+    try:
+        if not file.seekable():
+            return None, None
+        start = file.tell()
+        try:
+            end = os.fstat(file.fileno()).st_size
+        except (AttributeError, OSError, ValueError):
+            end = file.seek(0, os.SEEK_END)
+            file.seek(start)
+        return start, max(0, end - start)
+    except (AttributeError, OSError, ValueError):
+        return None, None
+
+
+class MultipartEncoder:
+    """Lazily encoded multipart/form-data body.
+
+    The encoder is a readable, iterable body: requests streams it with a
+    Content-Length when every part has a known size and with chunked transfer
+    encoding otherwise (e.g. for pipes). It can be rewound with reset() so a
+    failed upload can be retried, unless it reads from a non-seekable stream.
+
+    Args:
+        fields: Plain form fields; values are sent as str().
+        files: Mapping of field name to (filename, source) or (filename, source, content_type).
+            A source is a file path, an open binary file, or a bytes-like object
+            (bytes, bytearray, memoryview, mmap).
+        boundary: Multipart boundary. Generated when not given.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Tuple]] = None,
+        boundary: Optional[str] = None,
+    ):
+        self.boundary = boundary or uuid.uuid4().hex
+        self._segments: List[Union[bytes, _Source]] = []
+        for name, value in (fields or {}).items():
+            if not isinstance(value, bytes):
+                value = str(value).encode('utf-8')
+            self._segments.append(self._part_header(name) + value + b'\r\n')
+        for name, spec in (files or {}).items():
+            filename, source = spec[0], spec[1]
+            content_type = spec[2] if len(spec) > 2 else None
+            self._segments.append(self._part_header(name, filename, content_type))
+            self._segments.append(_Source(source))
+            self._segments.append(b'\r\n')
+        self._segments.append(f'--{self.boundary}--\r\n'.encode('ascii'))
+        self._index = 0
+        self._offset = 0
+
+    def _part_header(self, name: str, filename: Optional[str] = None, content_type: Optional[str] = None) -> bytes:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        header = f'--{self.boundary}\r\nContent-Disposition: {disposition}\r\n'
+        if content_type:
+            header += f'Content-Type: {content_type}\r\n'
+        return (header + '\r\n').encode('utf-8')
+
+    @property
+    def content_type(self) -> str:
+        """Value for the request's Content-Type header."""
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Total body size in bytes, or None if a part has unknown size."""
+        total = 0
+        for segment in self._segments:
+            if isinstance(segment, bytes):
+                total += len(segment)
+            elif segment.size is None:
+                return None
+            else:
+                total += segment.size
+        return total
+
+    def __len__(self) -> int:
+        length = self.content_length
+        if length is None:
+            # requests treats TypeError from len() as "unknown length" and sends the body chunked.
+            raise TypeError("multipart body has unknown length")
+        return length
+
+    def __bool__(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes of the encoded body (all remaining bytes if size < 0)."""
+        chunks = []
+        remaining = size
+        while self._index < len(self._segments) and remaining != 0:
+            segment = self._segments[self._index]
+            want = remaining if remaining > 0 else CHUNK_SIZE
+            if isinstance(segment, bytes):
+                chunk = segment[self._offset:self._offset + want]
+                self._offset += len(chunk)
+                if self._offset >= len(segment):
+                    self._index += 1
+                    self._offset = 0
+            else:
+                chunk = segment.read(want)
+                if not chunk:
+                    self._index += 1
+                    continue
+            chunks.append(chunk)
+            if remaining > 0:
+                remaining -= len(chunk)
+        return b''.join(chunks)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Yield the body in chunks for async HTTP clients.
+
+        Each chunk is read in a worker thread, so file reads do not block the
+        event loop.
+        """
+        import asyncio
+
+        while True:
+            chunk = await asyncio.to_thread(self.read, CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def reset(self) -> bool:
+        """Rewind to the start of the body. Returns False if a source cannot be rewound."""
+        for segment in self._segments:
+            if isinstance(segment, _Source) and not segment.reset():
+                return False
+        self._index = 0
+        self._offset = 0
+        return True
+
+    def close(self) -> None:
+        """Close files opened by the encoder. Caller-supplied file objects are left open."""
+        for segment in self._segments:
+            if isinstance(segment, _Source):
+                segment.close()
@@ -0,0 +1,281 @@
+"""Multi-stage pipelines that chain endpoints over many images concurrently.
+
+A Pipeline is a list of Stages, each naming an endpoint plus fixed
+parameters. The first result image of a stage becomes the input image of the
+next: as a URL where the API returned one (passed straight through to
+``input_image_url`` endpoints without downloading), otherwise as the image
+bytes (uploaded to ``input_image`` endpoints such as upscale_image, or sent
+as a data URL to ``input_image_url`` endpoints).
+
+Every stage has its own worker threads and a bounded input queue, so while
+image A is being staged, image B can be upscaled and image C cleaned up. When a
+stage falls behind, its full queue blocks the stage before it instead of
+buffering unbounded work in memory.
+
+Example:
+    >>> from decor8ai import Decor8AI, Pipeline, Stage
+    >>> pipeline = Pipeline(client, [
+    ...     Stage('remove_objects_from_room', workers=4),
+    ...     Stage('upscale_image', workers=2, scale_factor=2),
+    ...     Stage('generate_designs', workers=4, room_type='familyroom', design_style='rustic'),
+    ... ])
+    >>> for result in pipeline.run(photo_urls):
+    ...     print(result.index, result.ok, result.result)
+"""
+
+import inspect
+import queue
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+from .constants import ENDPOINTS
+from .exceptions import StageError
+from .results import DesignResult
+
+
+DEFAULT_STAGE_WORKERS = 4
+URL_PARAM = 'input_image_url'
+IMAGE_PARAM = 'input_image'
+
+_DONE = object()
+_POLL_INTERVAL = 0.1
+
+
+class Stage:
+    """One step of a Pipeline.
+
+    Args:
+        endpoint: Endpoint name, one of the keys of constants.ENDPOINTS.
+        workers: Number of requests this stage runs at once.
+        queue_size: Items that may wait for this stage; defaults to 2 * workers.
+        name: Label used in results and errors; defaults to the endpoint name.
+        **params: Fixed keyword arguments for the endpoint method.
+
+    Raises:
+        ValueError: If endpoint is unknown or workers is not positive.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        workers: int = DEFAULT_STAGE_WORKERS,
+        queue_size: Optional[int] = None,
+        name: Optional[str] = None,
+        **params: Any,
+    ):
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{endpoint}'. Expected one of: {', '.join(ENDPOINTS)}")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.endpoint = endpoint
+        self.workers = workers
+        self.queue_size = queue_size if queue_size is not None else 2 * workers
+        self.name = name or endpoint
+        self.params = params
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r}, workers={self.workers})"
+
+
+class PipelineResult:
+    """Outcome of one input image in a pipeline.
+
+    Attributes:
+        index: Position of the item in the input iterable.
+        input: The input item as given.
+        responses: Responses of the stages that completed, in stage order.
+        error: Exception that stopped the item, or None if every stage completed.
+        stage: Name of the stage that failed, or None.
+    """
+
+    __slots__ = ('index', 'input', 'responses', 'error', 'stage')
+
+    def __init__(self, index: int, input: Any):
+        self.index = index
+        self.input = input
+        self.responses: List[Any] = []
+        self.error: Optional[BaseException] = None
+        self.stage: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if every stage completed."""
+        return self.error is None
+
+    @property
+    def result(self) -> Any:
+        """Response of the last completed stage, or None."""
+        return self.responses[-1] if self.responses else None
+
+    def __repr__(self) -> str:
+        status = 'ok' if self.ok else f'failed at {self.stage}: {self.error!r}'
+        return f"PipelineResult(index={self.index}, {status})"
+
+
+def _input_param(method: Callable[..., Any]) -> Optional[str]:
+    """Return the image parameter an endpoint method takes, if any."""
+    parameters = inspect.signature(method).parameters
+    for name in (URL_PARAM, IMAGE_PARAM):
+        if name in parameters:
+            return name
+    return None
+
+
+def _next_input(stage: Stage, response: Any) -> Any:
+    """Pick the value a stage passes on to the next one: its first image's URL or bytes."""
+    result = response if isinstance(response, DesignResult) else DesignResult(response)
+    image = result.image
+    if image is None:
+        raise StageError(stage.name, 'NoImage', 'response has no image to pass on', response)
+    # Inline data sent to an input_image_url endpoint is encoded as a data URL by the client.
+    return image.url or image.data
+
+
+class Pipeline:
+    """Runs images through a sequence of stages with per-stage concurrency.
+
+    Args:
+        client: Decor8AI client used for the calls.
+        stages: Stages in execution order.
+
+    Raises:
+        ValueError: If stages is empty or a later stage takes no input image.
+    """
+
+    def __init__(self, client: Any, stages: Sequence[Stage]):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.client = client
+        self.stages = list(stages)
+        self._methods = [getattr(client, stage.endpoint) for stage in self.stages]
+        self._params = [_input_param(method) for method in self._methods]
+        for stage, param in zip(self.stages[1:], self._params[1:]):
+            if param is None:
+                raise ValueError(f"Stage {stage.name} takes no input image and cannot follow another stage")
+
+    def run(self, items: Iterable[Any]) -> Iterator[PipelineResult]:
+        """Push items through the pipeline and yield results as they complete.
+
+        Each item is an image for the first stage (URL, path or bytes) or a
+        dict of keyword arguments for it. Items are consumed lazily. A failing
+        item does not stop the others; its error and the stage it failed at
+        are recorded on its result.
+
+        Args:
+            items: Inputs for the first stage.
+
+        Returns:
+            Iterator of PipelineResult objects, in completion order.
+        """
+        stop = threading.Event()
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        output: queue.Queue = queue.Queue(maxsize=self.stages[-1].queue_size)
+        threads = [threading.Thread(target=self._feed, args=(items, queues[0], output, stop), daemon=True)]
+        for position, stage in enumerate(self.stages):
+            downstream = queues[position + 1] if position + 1 < len(self.stages) else output
+            remaining = [stage.workers]
+            lock = threading.Lock()
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(position, queues[position], downstream, output, stop, remaining, lock),
+                    daemon=True,
+                    name=f'decor8ai-pipeline-{stage.name}',
+                ))
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = _get(output, stop)
+                if item is _DONE:
+                    return
+                yield item
+        finally:
+            stop.set()
+
+    def _feed(self, items: Iterable[Any], first: queue.Queue, output: queue.Queue, stop: threading.Event) -> None:
+        try:
+            for index, item in enumerate(items):
+                if not _put(first, (PipelineResult(index, item), item), stop):
+                    return
+        except Exception as exc:
+            # The input iterable itself failed: report it and end the run.
+            result = PipelineResult(-1, None)
+            result.error = exc
+            _put(output, result, stop)
+        _put(first, _DONE, stop)
+
+    def _work(
+        self,
+        position: int,
+        source: queue.Queue,
+        downstream: queue.Queue,
+        output: queue.Queue,
+        stop: threading.Event,
+        remaining: List[int],
+        lock: threading.Lock,
+    ) -> None:
+        stage = self.stages[position]
+        last = position + 1 == len(self.stages)
+        while True:
+            entry = _get(source, stop)
+            if entry is None:
+                return
+            if entry is _DONE:
+                # Let sibling workers see the marker; the last one to stop forwards it.
+                _put(source, _DONE, stop)
+                with lock:
+                    remaining[0] -= 1
+                    finished = remaining[0] == 0
+                if finished:
+                    _put(downstream, _DONE, stop)
+                return
+            result, value = entry
+            try:
+                response = self._call(position, value)
+                result.responses.append(response)
+                if last:
+                    _put(output, result, stop)
+                else:
+                    _put(downstream, (result, _next_input(stage, response)), stop)
+            except Exception as exc:
+                result.error = exc
+                result.stage = stage.name
+                _put(output, result, stop)
+
+    def _call(self, position: int, value: Any) -> Any:
+        stage = self.stages[position]
+        kwargs = dict(stage.params)
+        if isinstance(value, Mapping) and not isinstance(value, DesignResult):
+            kwargs.update(value)
+        elif self._params[position] is None:
+            raise ValueError(f"Stage {stage.name} takes no input image; pass keyword-argument dicts instead")
+        else:
+            kwargs[self._params[position]] = value
+        response = self._methods[position](**kwargs)
+        if isinstance(response, Mapping) and response.get('error'):
+            raise StageError(stage.name, response['error'], response.get('message') or '', response)
+        return response
+
+
+def _put(target: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Put item, waiting for room unless the run is stopped. Returns False if stopped."""
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(source: queue.Queue, stop: threading.Event) -> Any:
+    """Get the next item, or None once the run is stopped."""
+    while not stop.is_set():
+        try:
+            return source.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            continue
+    return None
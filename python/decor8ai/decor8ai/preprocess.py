@@ -0,0 +1,199 @@
+"""Client-side preprocessing of images before upload.
+
+Phone photos are often 12MP JPEGs with large EXIF blocks, well over what the
+upload endpoints need (upscale_image rejects inputs over 4MB). An
+ImagePreprocessor applies the EXIF orientation, drops metadata, resizes to a
+maximum dimension and re-encodes to fit a byte budget before the image is
+uploaded. Images that already fit and carry no metadata (EXIF, XMP, ICC
+profiles, comments, ...) are passed through unchanged, so they are not
+recompressed.
+
+Requires the optional Pillow dependency (``pip install decor8ai[images]``).
+
+Example:
+    >>> from decor8ai import Decor8AI, ImagePreprocessor
+    >>> client = Decor8AI(preprocessor=ImagePreprocessor(max_dimension=2048, max_bytes=4 * 1024 * 1024))
+    >>> client.upscale_image('IMG_2041.jpg', scale_factor=2)
+"""
+
+import io
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Optional
+
+# Pillow is imported by the first ImagePreprocessor, not with this module.
+Image = ImageOps = None
+
+
+DEFAULT_MAX_DIMENSION = 2048
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+DEFAULT_QUALITY = 90
+DEFAULT_MIN_QUALITY = 60
+DEFAULT_WORKERS = 4
+
+_QUALITY_STEP = 10
+_SHRINK_FACTOR = 0.75
+_PASSTHROUGH_FORMATS = ('JPEG', 'PNG', 'WEBP')
+# image.info keys that describe the encoding rather than the photo. Anything
+# else (exif, xmp, icc_profile, photoshop, comments, PNG text chunks, ...) may
+# carry metadata, so such files are re-encoded instead of passed through.
+_STRUCTURAL_INFO_KEYS = frozenset({
+    'jfif', 'jfif_version', 'jfif_unit', 'jfif_density', 'dpi', 'progressive', 'progression',
+    'adobe', 'adobe_transform', 'interlace', 'gamma', 'aspect', 'transparency', 'loop',
+    'background', 'duration', 'timestamp',
+})
+
+
+def _import_pillow() -> None:
+    """Import Pillow into this module on first use.
+
+    Raises:
+        ImportError: If Pillow is not installed.
+    """
+    global Image, ImageOps
+    if Image is None:
+        try:
+            from PIL import Image, ImageOps
+        except ImportError:
+            raise ImportError("ImagePreprocessor requires Pillow. Install it with: pip install decor8ai[images]") from None
+
+
+class ImagePreprocessor:
+    """Normalizes images for upload.
+
+    Args:
+        max_dimension: Longest side in pixels after resizing; None keeps the size.
+        max_bytes: Byte budget for the encoded image; None only re-encodes once
+            at quality.
+        quality: Initial JPEG/WebP quality.
+        min_quality: Lowest quality tried before the image is scaled down further
+            to meet max_bytes.
+        format: Output format, 'JPEG' or 'WEBP'.
+        executor: Executor used by submit() and, when given, by the clients for
+            every upload (e.g. a ProcessPoolExecutor for CPU-heavy batches).
+            Defaults to a private thread pool used only by submit().
+        workers: Size of the default thread pool.
+
+    Raises:
+        ImportError: If Pillow is not installed.
+        ValueError: If the quality range or format is invalid.
+    """
+
+    def __init__(
+        self,
+        max_dimension: Optional[int] = DEFAULT_MAX_DIMENSION,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        *,
+        quality: int = DEFAULT_QUALITY,
+        min_quality: int = DEFAULT_MIN_QUALITY,
+        format: str = 'JPEG',
+        executor: Optional[Executor] = None,
+        workers: int = DEFAULT_WORKERS,
+    ):
+        _import_pillow()
+        if not 1 <= min_quality <= quality <= 100:
+            raise ValueError("quality and min_quality must satisfy 1 <= min_quality <= quality <= 100")
+        format = format.upper()
+        if format not in ('JPEG', 'WEBP'):
+            raise ValueError("format must be 'JPEG' or 'WEBP'")
+        self.max_dimension = max_dimension
+        self.max_bytes = max_bytes
+        self.quality = quality
+        self.min_quality = min_quality
+        self.format = format
+        self.executor = executor
+        self.workers = workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def __getstate__(self):
+        # Picklable for ProcessPoolExecutor: the executors stay in the parent.
+        state = self.__dict__.copy()
+        state.update(executor=None, _pool=None, _pool_lock=None)
+        return state
+
+    def __setstate__(self, state):
+        _import_pillow()
+        self.__dict__.update(state)
+        self._pool_lock = threading.Lock()
+
+    def process(self, data: bytes) -> bytes:
+        """Return data oriented, stripped, resized and encoded within the budget.
+
+        Raises:
+            PIL.UnidentifiedImageError: If data is not an image Pillow can read.
+        """
+        with Image.open(io.BytesIO(data)) as image:
+            if self._fits(image, len(data)):
+                return data
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ('RGB', 'L'):
+                image = self._flatten(image)
+            if self.max_dimension and max(image.size) > self.max_dimension:
+                image.thumbnail((self.max_dimension, self.max_dimension), Image.Resampling.LANCZOS)
+            return self._encode(image)
+
+    def run(self, data: bytes) -> bytes:
+        """Process data on the configured executor, or in the calling thread when there is none."""
+        if self.executor is None:
+            return self.process(data)
+        return self.executor.submit(self.process, data).result()
+
+    def submit(self, data: bytes) -> Future:
+        """Process data on the executor (or the default thread pool) and return a future."""
+        return self._executor().submit(self.process, data)
+
+    def close(self) -> None:
+        """Shut down the default thread pool, if it was started."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def _executor(self) -> Executor:
+        if self.executor is not None:
+            return self.executor
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix='decor8ai-preprocess')
+            return self._pool
+
+    def _fits(self, image: "Image.Image", size: int) -> bool:
+        """True if the original bytes can be uploaded as they are."""
+        if image.format not in _PASSTHROUGH_FORMATS or not _STRUCTURAL_INFO_KEYS.issuperset(image.info):
+            return False
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+        return not self.max_dimension or max(image.size) <= self.max_dimension
+
+    @staticmethod
+    def _flatten(image: "Image.Image") -> "Image.Image":
+        """Convert to RGB, compositing transparency onto white."""
+        if image.mode in ('RGBA', 'LA') or 'transparency' in image.info:
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            return background
+        return image.convert('RGB')
+
+    def _encode(self, image: "Image.Image") -> bytes:
+        """Encode, lowering quality and then size until the budget is met."""
+        # Pillow copies some metadata, such as JPEG comments, from image.info when saving.
+        image.info = {}
+        while True:
+            quality = self.quality
+            while True:
+                buffer = io.BytesIO()
+                image.save(buffer, self.format, quality=quality, optimize=True)
+                if self.max_bytes is None or buffer.tell() <= self.max_bytes:
+                    return buffer.getvalue()
+                if quality - _QUALITY_STEP < self.min_quality:
+                    break
+                quality -= _QUALITY_STEP
+            width, height = image.size
+            if width <= 1 and height <= 1:
+                return buffer.getvalue()
+            image = image.resize(
+                (max(1, int(width * _SHRINK_FACTOR)), max(1, int(height * _SHRINK_FACTOR))),
+                Image.Resampling.LANCZOS,
+            )
@@ -0,0 +1,207 @@
+"""Client-side token-bucket rate limiting for Decor8 AI requests.
+
+A RateLimiter keeps one bucket for all requests and, optionally, one bucket per
+endpoint. Buckets are thread-safe; with ``shared_dir`` set, their state lives in
+small lock-protected files so every worker process on the host draws from the
+same budget.
+
+Example:
+    >>> from decor8ai import Decor8AI, RateLimiter
+    >>> limiter = RateLimiter(rate=5, burst=10, per_endpoint={'upscale_image': (1, 2)})
+    >>> client = Decor8AI(rate_limiter=limiter)
+"""
+
+import os
+import struct
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .constants import ENDPOINTS
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+class TokenBucket:
+    """Thread-safe token bucket for a single process.
+
+    Tokens refill continuously at `rate` per second up to `burst`. reserve()
+    always succeeds immediately and returns how long the caller must wait before
+    using its token, so callers are served in the order they arrive and the same
+    bucket works for blocking and asyncio code.
+
+    Args:
+        rate: Sustained requests per second.
+        burst: Maximum number of requests that may be sent back to back.
+            Defaults to max(1, rate).
+
+    Raises:
+        ValueError: If rate or burst is not positive.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        if self.burst <= 0:
+            raise ValueError("burst must be positive")
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def _take(self, tokens: float, stored: float, updated: float, now: float) -> Tuple[float, float]:
+        """Refill and remove tokens; return (remaining tokens, wait seconds)."""
+        available = min(self.burst, stored + (now - updated) * self.rate) - tokens
+        wait = -available / self.rate if available < 0 else 0.0
+        return available, wait
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens from the bucket and return the seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = self._take(tokens, self._tokens, self._updated, now)
+            self._updated = now
+        return wait
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block until tokens are available."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state is shared between processes through a locked file.
+
+    The file holds the token count and last refill time; every reservation takes an
+    exclusive OS-level lock on it, so all processes using the same path share one
+    budget. Each process opens the file itself: a descriptor inherited across fork
+    shares its lock with the parent, so it is reopened on first use in the child.
+
+    Args:
+        path: State file, created if missing.
+        rate: Sustained requests per second.
+        burst: Maximum number of requests that may be sent back to back.
+    """
+
+    _STATE = struct.Struct('dd')
+
+    def __init__(self, path: str, rate: float, burst: Optional[float] = None):
+        super().__init__(rate, burst)
+        self.path = path
+        self._pid = os.getpid()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def close(self) -> None:
+        """Close the state file."""
+        if getattr(self, '_fd', None) is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _reopen_after_fork(self) -> None:
+        # flock locks belong to the open file description, which a forked child
+        # shares with its parent, so the child needs a description of its own.
+        if self._pid != os.getpid():
+            self._lock = threading.Lock()
+            if self._fd is not None:
+                os.close(self._fd)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+
+    def __del__(self):
+        self.close()
+
+    def _lock_file(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens from the shared bucket and return the seconds to wait before using them."""
+        self._reopen_after_fork()
+        # The thread lock is still needed: flock does not exclude threads sharing one descriptor.
+        with self._lock:
+            self._lock_file()
+            try:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                raw = os.read(self._fd, self._STATE.size)
+                now = time.time()
+                if len(raw) == self._STATE.size:
+                    stored, updated = self._STATE.unpack(raw)
+                else:
+                    stored, updated = self.burst, now
+                remaining, wait = self._take(tokens, stored, updated, now)
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, self._STATE.pack(remaining, now))
+            finally:
+                self._unlock_file()
+        return wait
+
+
+class RateLimiter:
+    """Rate limiter with a global budget and optional per-endpoint budgets.
+
+    Args:
+        rate: Requests per second across all endpoints. None for no global limit.
+        burst: Burst size for the global budget.
+        per_endpoint: Mapping of endpoint name (a key of constants.ENDPOINTS) to
+            (rate, burst) for endpoint-specific budgets.
+        shared_dir: Directory for state files. When set, the budgets are shared by
+            every process using the same directory.
+
+    Raises:
+        ValueError: If an endpoint name is unknown.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        *,
+        per_endpoint: Optional[Dict[str, Tuple[float, Optional[float]]]] = None,
+        shared_dir: Optional[str] = None,
+    ):
+        self.shared_dir = shared_dir
+        if shared_dir:
+            os.makedirs(shared_dir, exist_ok=True)
+        self._global = self._make_bucket('global', rate, burst) if rate is not None else None
+        self._endpoints: Dict[str, TokenBucket] = {}
+        for name, (endpoint_rate, endpoint_burst) in (per_endpoint or {}).items():
+            if name not in ENDPOINTS:
+                raise ValueError(f"Unknown endpoint '{name}'. Expected one of: {', '.join(ENDPOINTS)}")
+            self._endpoints[name] = self._make_bucket(name, endpoint_rate, endpoint_burst)
+
+    def _make_bucket(self, name: str, rate: float, burst: Optional[float]) -> TokenBucket:
+        if self.shared_dir:
+            return FileTokenBucket(os.path.join(self.shared_dir, f"{name}.bucket"), rate, burst)
+        return TokenBucket(rate, burst)
+
+    def reserve(self, endpoint: Optional[str] = None) -> float:
+        """Reserve one request for an endpoint and return the seconds to wait before sending it."""
+        wait = 0.0
+        if self._global is not None:
+            wait = self._global.reserve()
+        bucket = self._endpoints.get(endpoint)
+        if bucket is not None:
+            wait = max(wait, bucket.reserve())
+        return wait
+
+    def acquire(self, endpoint: Optional[str] = None) -> None:
+        """Block until a request to the endpoint may be sent."""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,163 @@
+"""Typed, lazily built views of API responses.
+
+Returned by the clients when constructed with ``typed_results=True``.
+DesignResult is a thin view: it keeps the parsed JSON and builds its image
+list on first access, so it holds slightly more than the dict on its own.
+ResultImage decodes an inline base64 image when ``.data`` is first read and
+stores the bytes in place of the base64 text in the response, so the image
+is held once, in its smaller form. Both use __slots__.
+
+DesignResult is also a read-only Mapping over the original response, so code
+written against the raw dicts (``result['info']['images']``) keeps working.
+"""
+
+import base64
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .streaming import SavedImage
+
+
+class ResultImage:
+    """One image of an API response.
+
+    Args:
+        raw: The image entry as returned by the API.
+        source: The dict and key holding the image's base64 text when it is
+            not raw['data'] (e.g. ``info.upscaled_image``).
+
+    Attributes:
+        raw: The image entry as returned by the API, except that ``data``
+            holds the decoded bytes once .data has been read.
+    """
+
+    __slots__ = ('raw', '_source')
+
+    def __init__(self, raw: Dict[str, Any], source: Optional[Tuple[Dict[str, Any], str]] = None):
+        self.raw = raw
+        self._source = source or (raw, 'data')
+
+    @property
+    def uuid(self) -> Optional[str]:
+        """Image identifier, when the API provides one."""
+        return self.raw.get('uuid')
+
+    @property
+    def url(self) -> Optional[str]:
+        """URL of the hosted image, for URL-based endpoints."""
+        return self.raw.get('url')
+
+    @property
+    def width(self) -> Optional[int]:
+        return self.raw.get('width')
+
+    @property
+    def height(self) -> Optional[int]:
+        return self.raw.get('height')
+
+    @property
+    def saved(self) -> Optional[SavedImage]:
+        """Where the image was written, when the request was made with output=."""
+        data = self.raw.get('data')
+        return data if isinstance(data, SavedImage) else None
+
+    @property
+    def data(self) -> Optional[bytes]:
+        """Image bytes, decoded from base64 on first access (or read from the saved file).
+
+        The decoded bytes replace the base64 text in the response, so later
+        reads return them without decoding again. None for images that are
+        only available by URL.
+        """
+        container, key = self._source
+        data = container.get(key)
+        if isinstance(data, SavedImage):
+            if data.path is None:
+                return None
+            with open(data.path, 'rb') as f:
+                return f.read()
+        if isinstance(data, str) and data:
+            data = container[key] = base64.b64decode(data)
+            self.raw['data'] = data
+        return data or None
+
+    def __repr__(self) -> str:
+        where = self.url or self.saved or ('<inline>' if self.raw.get('data') else None)
+        return f"ResultImage(uuid={self.uuid!r}, {where})"
+
+
+class DesignResult(Mapping):
+    """Typed view of an API response.
+
+    The result holds the whole parsed response, including any inline images,
+    for as long as it is referenced. Requests made with output= keep only
+    file references in place of the images.
+
+    Attributes:
+        raw: The parsed JSON response.
+    """
+
+    __slots__ = ('raw', '_images')
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self._images: Optional[Tuple[ResultImage, ...]] = None
+
+    # Mapping interface over the raw response
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @property
+    def error(self) -> str:
+        """Error code, or an empty string on success."""
+        return self.raw.get('error') or ''
+
+    @property
+    def message(self) -> str:
+        """Human-readable status message."""
+        return self.raw.get('message') or ''
+
+    @property
+    def ok(self) -> bool:
+        """True if the API reported no error."""
+        return not self.error
+
+    @property
+    def info(self) -> Dict[str, Any]:
+        """The ``info`` payload, or an empty dict."""
+        return self.raw.get('info') or {}
+
+    @property
+    def images(self) -> Tuple[ResultImage, ...]:
+        """All result images: ``info.images[]``, ``info.image`` and ``info.upscaled_image``."""
+        if self._images is None:
+            info = self.info
+            entries: List[Dict[str, Any]] = [image for image in info.get('images') or [] if isinstance(image, dict)]
+            if isinstance(info.get('image'), dict):
+                entries.append(info['image'])
+            images = [ResultImage(entry) for entry in entries]
+            if info.get('upscaled_image') is not None:
+                images.append(ResultImage({'data': info['upscaled_image']}, (info, 'upscaled_image')))
+            self._images = tuple(images)
+        return self._images
+
+    @property
+    def image(self) -> Optional[ResultImage]:
+        """The first result image, or None."""
+        images = self.images
+        return images[0] if images else None
+
+    @property
+    def captions(self) -> List[str]:
+        return self.info.get('captions') or []
+
+    def __repr__(self) -> str:
+        if not self.ok:
+            return f"DesignResult(error={self.error!r}, message={self.message!r})"
+        return f"DesignResult(images={len(self.images)})"
@@ -0,0 +1,114 @@
+"""Retry policy for transient Decor8 AI API failures."""
+
+import random
+import time
+from typing import FrozenSet, Iterable, Optional, Tuple, Type
+
+
+# Statuses where the request was not processed, so retrying cannot charge twice.
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503})
+# Statuses where the server may have done (and billed) the work; retried only on request.
+UNSAFE_RETRY_STATUSES = frozenset({500, 504})
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, honouring Retry-After headers.
+
+    The delay before retry n (1-based) is drawn uniformly from
+    [0, min(backoff_cap, backoff_base * 2 ** (n - 1))], which spreads retries
+    from many workers instead of having them hit the API in lockstep. When the
+    response carries a Retry-After header, that delay is used instead.
+
+    The generation endpoints are paid POSTs that are not safe to repeat, so by
+    default only failures where the request was not processed are retried:
+    429, 502 and 503 responses and connection errors. A 500 or 504 response
+    or a read timeout may arrive after the server has generated, and charged
+    for, the design; retrying those (add UNSAFE_RETRY_STATUSES to
+    retry_statuses, set retry_read_timeouts) risks paying twice.
+
+    Args:
+        max_attempts: Total attempts per request, including the first. 1 disables retries.
+        backoff_base: Base delay in seconds for the exponential backoff.
+        backoff_cap: Upper bound in seconds for a single backoff delay.
+        jitter: Apply full jitter to backoff delays.
+        respect_retry_after: Use the server's Retry-After header when present.
+        max_retry_after: Give up instead of retrying when Retry-After asks for a
+            longer wait than this many seconds.
+        retry_statuses: HTTP status codes that are retried.
+        retry_exceptions: Exception classes that are retried. None uses the
+            transport's connection errors (including connect timeouts).
+        retry_read_timeouts: Also retry timeouts after the request was sent,
+            when retry_exceptions is None.
+
+    Raises:
+        ValueError: If max_attempts is less than 1.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_exceptions: Optional[Tuple[Type[BaseException], ...]] = None,
+        retry_read_timeouts: bool = False,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+        self.retry_read_timeouts = retry_read_timeouts
+
+    def backoff(self, attempt: int) -> float:
+        """Return the backoff delay in seconds after the given failed attempt (1-based)."""
+        delay = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def status_delay(self, attempt: int, status_code: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """Return the delay before retrying a response, or None if it must not be retried.
+
+        Args:
+            attempt: Number of the attempt that produced the response (1-based).
+            status_code: HTTP status code of the response.
+            retry_after: Value of the response's Retry-After header, if any.
+        """
+        if attempt >= self.max_attempts or status_code not in self.retry_statuses:
+            return None
+        if self.respect_retry_after and retry_after:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return delay if delay <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+    def exception_delay(self, attempt: int) -> Optional[float]:
+        """Return the delay before retrying after a retryable exception, or None if attempts are exhausted."""
+        if attempt >= self.max_attempts:
+            return None
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime  # only needed for the rare date form
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
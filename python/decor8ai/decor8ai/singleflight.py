@@ -0,0 +1,154 @@
+"""Collapsing of identical concurrent requests.
+
+When several threads (or tasks) make the same JSON request at the same time,
+for example many users opening the same listing, only the first one (the
+leader) calls the API. The others wait for the leader's response and each
+get their own copy of it. Requests are identical when their endpoint and
+canonical payload hash match (see cache.make_cache_key).
+
+Unlike ResponseCache, nothing is kept after the leader's call finishes: a
+request that starts after it is sent again. Errors raised by the leader are
+raised in every waiting caller too, except cancellation: when a leader task
+is cancelled, one of its waiting tasks takes over the call.
+
+Example:
+    >>> from decor8ai import Decor8AI, SingleFlight
+    >>> flights = SingleFlight()
+    >>> client = Decor8AI(single_flight=flights)
+    >>> ...
+    >>> flights.stats()
+    {'calls': 120, 'collapsed': 380, 'in_flight': 0}
+"""
+
+import copy
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from .cache import make_cache_key
+from .constants import ENDPOINTS
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class SingleFlight:
+    """Tracks in-flight requests and lets identical ones share a response.
+
+    One instance may be shared by several clients.
+
+    Args:
+        endpoints: Endpoint names (keys of constants.ENDPOINTS) whose requests
+            may be collapsed. Defaults to all endpoints.
+        require_seed: Only collapse payloads that include a 'seed', so callers
+            never receive a design another caller asked for without one.
+
+    Raises:
+        ValueError: If an endpoint name is unknown.
+
+    Attributes:
+        calls: Requests that were sent to the API as leaders.
+        collapsed: Requests answered with a leader's response instead of an API call.
+    """
+
+    def __init__(self, endpoints: Optional[Iterable[str]] = None, *, require_seed: bool = False):
+        endpoints = frozenset(ENDPOINTS if endpoints is None else endpoints)
+        unknown = sorted(endpoints - set(ENDPOINTS))
+        if unknown:
+            raise ValueError(f"Unknown endpoint '{unknown[0]}'. Expected one of: {', '.join(ENDPOINTS)}")
+        self.endpoints = endpoints
+        self.require_seed = require_seed
+        self.calls = 0
+        self.collapsed = 0
+        self._flights: Dict[str, Future] = {}
+        self._async_flights: Dict[str, "asyncio.Future"] = {}
+        self._lock = threading.Lock()
+
+    def key_for(self, endpoint: str, payload: Dict[str, Any]) -> Optional[str]:
+        """Return the flight key for a request, or None if it must not be collapsed."""
+        if endpoint not in self.endpoints:
+            return None
+        if self.require_seed and payload.get('seed') is None:
+            return None
+        return make_cache_key(endpoint, payload)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently being made."""
+        return len(self._flights) + len(self._async_flights)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the call, collapsed and in-flight counters."""
+        return {'calls': self.calls, 'collapsed': self.collapsed, 'in_flight': self.in_flight}
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """Call func, or wait for the identical call already in flight under key."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = Future()
+                self.calls += 1
+                leader = True
+            else:
+                self.collapsed += 1
+                leader = False
+        if not leader:
+            return copy.deepcopy(flight.result())
+        try:
+            result = func()
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    async def do_async(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await func(), or wait for the identical call already in flight under key.
+
+        Must be used from a single event loop per SingleFlight instance. If
+        the leader is cancelled, a waiting caller retries and becomes the new
+        leader instead of being cancelled with it.
+        """
+        import asyncio  # deferred so the sync client does not import asyncio
+
+        while True:
+            with self._lock:
+                flight = self._async_flights.get(key)
+                if flight is None:
+                    flight = self._async_flights[key] = asyncio.get_running_loop().create_future()
+                    self.calls += 1
+                    break
+                self.collapsed += 1
+            try:
+                # shield() keeps a cancelled follower from cancelling the leader's call.
+                result = await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                # Retry only when the leader was cancelled, not this task.
+                if not flight.cancelled() or getattr(task, 'cancelling', lambda: 0)():
+                    raise
+                with self._lock:
+                    self.collapsed -= 1
+                continue
+            return copy.deepcopy(result)
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            # Mark the exception retrieved when nobody was waiting for it.
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._async_flights[key]
@@ -0,0 +1,331 @@
+"""Incremental decoding of base64 image payloads in API responses.
+
+The legacy upload endpoints return images inline as base64 strings
+(``info.upscaled_image`` for upscale_image, ``info.images[].data`` for
+generate_designs and prime_the_room_walls). ImageResponseDecoder scans the
+response body as it arrives and decodes those strings chunk by chunk into
+files or a caller-supplied buffer, so the encoded string, its decoded bytes
+and the parsed response never have to coexist in memory.
+
+JSONFieldStreamer is sans-IO: it is fed bytes by whichever HTTP client
+produced them and never reads from a socket itself.
+"""
+
+import binascii
+import json
+import os
+import re
+import tempfile
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+
+# Where the API puts inline images
+IMAGE_FIELDS = (('info', 'upscaled_image'), ('info', 'images', int, 'data'))
+
+# Image outputs accepted by the streaming endpoints: a directory or a writable binary file
+ImageOutput = Union[str, os.PathLike, BinaryIO]
+
+_STRUCTURAL = re.compile(rb'[{}\[\],:"]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_WHITESPACE = b' \t\r\n'
+
+_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg', '.jpg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png', '.png'),
+    (b'GIF8', 'image/gif', '.gif'),
+)
+
+
+def _sniff(head: bytes) -> Tuple[str, str]:
+    """Return (content type, file extension) for the leading bytes of an image."""
+    for signature, content_type, extension in _SIGNATURES:
+        if head.startswith(signature):
+            return content_type, extension
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp', '.webp'
+    return 'application/octet-stream', '.bin'
+
+
+def is_image_field(path: Tuple[Any, ...]) -> bool:
+    """Return True if a JSON path (tuple of keys and indexes) holds an inline image."""
+    for pattern in IMAGE_FIELDS:
+        if len(path) == len(pattern) and all(
+            isinstance(part, expected) if isinstance(expected, type) else part == expected
+            for part, expected in zip(path, pattern)
+        ):
+            return True
+    return False
+
+
+class JSONFieldStreamer:
+    """Incremental JSON scanner that diverts selected string values to sinks.
+
+    Everything except the selected strings is kept as (small) JSON text and
+    parsed by close(); each selected string is replaced by null in that text
+    and its unescaped contents are written to the sink returned by
+    open_sink(path) as they arrive. close() then stores sink.finish() at the
+    string's place in the parsed document.
+
+    Args:
+        is_target: Called with the path of every string value; return True to stream it.
+        open_sink: Called with the path of a streamed string; returns an object
+            with write(bytes), finish() -> value and abort().
+    """
+
+    def __init__(self, is_target: Callable[[Tuple[Any, ...]], bool], open_sink: Callable[[Tuple[Any, ...]], Any]):
+        self._is_target = is_target
+        self._open_sink = open_sink
+        self._skeleton: List[bytes] = []
+        # One frame per open container: [is_object, key or index, expecting_key]
+        self._stack: List[list] = []
+        self._mode = 'value'  # 'value', 'key', 'string' or 'target'
+        self._key: List[bytes] = []
+        self._sink: Any = None
+        self._carry = b''
+        self._streamed: List[Tuple[Tuple[Any, ...], Any]] = []
+
+    def _path(self) -> Tuple[Any, ...]:
+        return tuple(frame[1] for frame in self._stack)
+
+    def feed(self, data: bytes) -> None:
+        """Consume the next piece of the document."""
+        if self._carry:
+            data = self._carry + data
+            self._carry = b''
+        pos, end = 0, len(data)
+        while pos < end:
+            if self._mode == 'value':
+                pos = self._scan_value(data, pos)
+            else:
+                pos = self._scan_string(data, pos)
+
+    def _scan_value(self, data: bytes, pos: int) -> int:
+        match = _STRUCTURAL.search(data, pos)
+        if match is None:
+            self._skeleton.append(data[pos:])
+            return len(data)
+        index = match.start()
+        char = data[index:index + 1]
+        stack = self._stack
+        if char == b'"':
+            self._skeleton.append(data[pos:index])
+            if stack and stack[-1][0] and stack[-1][2]:
+                self._mode = 'key'
+                self._key = []
+                self._skeleton.append(char)
+            elif self._is_target(self._path()):
+                self._mode = 'target'
+                self._sink = self._open_sink(self._path())
+                self._streamed.append((self._path(), self._sink))
+                self._skeleton.append(b'null')
+            else:
+                self._mode = 'string'
+                self._skeleton.append(char)
+            return index + 1
+        self._skeleton.append(data[pos:index + 1])
+        if char == b'{':
+            stack.append([True, None, True])
+        elif char == b'[':
+            stack.append([False, 0, False])
+        elif char in (b'}', b']'):
+            if not stack:
+                raise ValueError("Unbalanced JSON document")
+            stack.pop()
+        elif char == b',':
+            if stack and stack[-1][0]:
+                stack[-1][2] = True
+            elif stack:
+                stack[-1][1] += 1
+        elif char == b':' and stack:
+            stack[-1][2] = False
+        return index + 1
+
+    def _scan_string(self, data: bytes, pos: int) -> int:
+        match = _STRING_SPECIAL.search(data, pos)
+        index = match.start() if match is not None else len(data)
+        self._emit(data[pos:index])
+        if match is None:
+            return index
+        if data[index:index + 1] == b'"':
+            self._end_string()
+            return index + 1
+        # Backslash escape: \uXXXX is six bytes, everything else two
+        length = 6 if data[index + 1:index + 2] == b'u' else 2
+        escape = data[index:index + length]
+        if len(escape) < length:
+            self._carry = escape
+            return len(data)
+        if self._mode == 'target':
+            self._sink.write(json.loads(b'"' + escape + b'"').encode('utf-8'))
+        else:
+            self._emit(escape)
+        return index + length
+
+    def _emit(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        if self._mode == 'target':
+            self._sink.write(chunk)
+            return
+        self._skeleton.append(chunk)
+        if self._mode == 'key':
+            self._key.append(chunk)
+
+    def _end_string(self) -> None:
+        if self._mode == 'key':
+            self._stack[-1][1] = json.loads(b'"' + b''.join(self._key) + b'"')
+        if self._mode != 'target':
+            self._skeleton.append(b'"')
+        self._sink = None
+        self._mode = 'value'
+
+    def close(self) -> Any:
+        """Finish the document and return it, with streamed strings replaced by their sink results.
+
+        Raises:
+            ValueError: If the document is truncated or not valid JSON.
+        """
+        if self._mode != 'value' or self._stack or self._carry:
+            raise ValueError("Truncated JSON document")
+        document = json.loads(b''.join(self._skeleton))
+        for path, sink in self._streamed:
+            target = document
+            for part in path[:-1]:
+                target = target[part]
+            target[path[-1]] = sink.finish()
+        return document
+
+    def abort(self) -> None:
+        """Discard partial output of every streamed string."""
+        for _, sink in self._streamed:
+            sink.abort()
+
+
+class SavedImage:
+    """An image from a response that was decoded to a file or buffer.
+
+    Attributes:
+        path: File the image was written to, or None for a caller-supplied buffer.
+        file: The caller-supplied buffer, or None when written to a file.
+        size: Decoded size in bytes.
+        content_type: Image type detected from the leading bytes.
+    """
+
+    __slots__ = ('path', 'file', 'size', 'content_type')
+
+    def __init__(self, path: Optional[str], file: Optional[BinaryIO], size: int, content_type: str):
+        self.path = path
+        self.file = file
+        self.size = size
+        self.content_type = content_type
+
+    def __fspath__(self) -> str:
+        if self.path is None:
+            raise TypeError("image was written to a caller-supplied buffer, not a file")
+        return self.path
+
+    def __repr__(self) -> str:
+        where = repr(self.path) if self.path is not None else repr(self.file)
+        return f"SavedImage({where}, size={self.size}, content_type={self.content_type!r})"
+
+
+class _Base64Sink:
+    """Decodes base64 text written in arbitrary pieces into a binary file."""
+
+    def __init__(self, file: BinaryIO, path: Optional[str] = None, owns_file: bool = False):
+        self._file = file
+        self._path = path
+        self._owns_file = owns_file
+        self._pending = b''
+        self._head = b''
+        self.size = 0
+
+    def write(self, text: bytes) -> None:
+        text = self._pending + text.translate(None, _WHITESPACE)
+        usable = len(text) - len(text) % 4
+        self._pending = text[usable:]
+        if usable:
+            self._write_decoded(text[:usable])
+
+    def _write_decoded(self, text: bytes) -> None:
+        try:
+            decoded = binascii.a2b_base64(text)
+        except binascii.Error as e:
+            raise ValueError(f"Invalid base64 image data: {e}") from None
+        if len(self._head) < 16:
+            self._head += decoded[:16 - len(self._head)]
+        self._file.write(decoded)
+        self.size += len(decoded)
+
+    def finish(self) -> SavedImage:
+        if self._pending:
+            self._write_decoded(self._pending + b'=' * (-len(self._pending) % 4))
+            self._pending = b''
+        content_type, extension = _sniff(self._head)
+        if not self._owns_file:
+            return SavedImage(None, self._file, self.size, content_type)
+        self._file.close()
+        path = self._path[:-len('.part')] + extension
+        os.replace(self._path, path)
+        self._path = None
+        return SavedImage(path, None, self.size, content_type)
+
+    def abort(self) -> None:
+        if self._owns_file and self._path is not None:
+            self._file.close()
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+            self._path = None
+
+
+class ImageResponseDecoder:
+    """Streams the inline images of an API response to disk or a buffer.
+
+    Feed it the raw response body with feed() and call close() for the parsed
+    response, in which every inline image string is replaced by a SavedImage.
+
+    Args:
+        output: Directory to write images into (created if missing; each image
+            gets a unique name such as ``upscaled_image_k2x9.jpg``), or a
+            writable binary file object that receives the single image of the
+            response.
+    """
+
+    def __init__(self, output: ImageOutput):
+        self._output = output
+        self._used_file = False
+        if not hasattr(output, 'write'):
+            os.makedirs(output, exist_ok=True)
+        self._streamer = JSONFieldStreamer(is_image_field, self._open_sink)
+
+    def _open_sink(self, path: Tuple[Any, ...]) -> _Base64Sink:
+        if hasattr(self._output, 'write'):
+            if self._used_file:
+                raise ValueError("Response has several images; pass a directory as output")
+            self._used_file = True
+            return _Base64Sink(self._output)
+        stem = path[-1] if path[-1] != 'data' else f'image_{path[-2]}'
+        fd, temp_path = tempfile.mkstemp(dir=self._output, prefix=f'{stem}_', suffix='.part')
+        return _Base64Sink(os.fdopen(fd, 'wb'), temp_path, owns_file=True)
+
+    def feed(self, data: bytes) -> None:
+        """Consume the next chunk of the response body."""
+        self._streamer.feed(data)
+
+    def close(self) -> Dict[str, Any]:
+        """Return the parsed response. Partial files are removed if the body is invalid.
+
+        Raises:
+            ValueError: If the body is truncated, not JSON, or holds invalid base64.
+        """
+        try:
+            return self._streamer.close()
+        except Exception:
+            self.abort()
+            raise
+
+    def abort(self) -> None:
+        """Remove partially written image files."""
+        self._streamer.abort()
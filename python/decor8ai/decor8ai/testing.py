@@ -0,0 +1,486 @@
+"""Offline mock of the Decor8 AI API for load tests and benchmarks.
+
+MockAPIServer answers every path in constants.ENDPOINTS (plus the legacy
+``/generate_image_captions``) with responses shaped like the real API:
+JSON endpoints return hosted image URLs (served by the mock itself),
+generate_designs and prime_the_room_walls return base64 ``data`` images and
+upscale_image returns ``info.upscaled_image``. Latency, error and 429
+injection and the size of the returned images are configurable, so client
+throughput and retry behaviour can be measured without spending credits.
+
+The server runs on a background thread in the calling process, or in a
+separate process (MockAPIProcess, or ``python -m decor8ai.testing``) so that
+it does not compete with the client under test for the GIL.
+
+Example:
+    >>> from decor8ai import Decor8AI
+    >>> from decor8ai.testing import MockAPIServer, lognormal
+    >>> with MockAPIServer(latency=lognormal(0.2, 0.5), rate_limit_rate=0.05) as server:
+    ...     client = Decor8AI(api_key='test', base_url=server.url)
+    ...     client.generate_designs_for_room('https://example.com/room.jpg', 'livingroom', 'modern')
+"""
+
+import argparse
+import base64
+import json
+import math
+import random
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from .constants import ENDPOINTS
+
+
+DEFAULT_IMAGE_BYTES = 256 * 1024
+DEFAULT_IMAGE_SIZE = (768, 512)
+IMAGE_PATH = '/mock-images/'
+MAX_BODY_BYTES = 64 * 1024 * 1024
+MAX_IMAGES = 4
+
+# Endpoints that take a multipart upload and return images inline as base64.
+MULTIPART_ENDPOINTS = ('generate_designs', 'prime_the_room_walls', 'upscale_image')
+CAPTIONS_PATH = '/generate_image_captions'
+
+Latency = Union[None, float, Tuple[float, float], Callable[[random.Random], float]]
+
+
+# -----------------------------------------------------------------------------
+# Latency distributions
+# -----------------------------------------------------------------------------
+
+def constant(seconds: float) -> Callable[[random.Random], float]:
+    """Latency distribution that always returns seconds."""
+    return lambda rng: seconds
+
+
+def uniform(low: float, high: float) -> Callable[[random.Random], float]:
+    """Latency distribution uniform between low and high seconds."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float = 0.5) -> Callable[[random.Random], float]:
+    """Long-tailed latency distribution with the given median, as real generation times are."""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def _latency_function(latency: Latency) -> Callable[[random.Random], float]:
+    """Normalize a latency setting: None, seconds, a (low, high) range or a callable."""
+    if latency is None:
+        return constant(0.0)
+    if callable(latency):
+        return latency
+    if isinstance(latency, (tuple, list)):
+        return uniform(*latency)
+    return constant(float(latency))
+
+
+def fake_jpeg(size: int, seed: int = 0) -> bytes:
+    """Return size bytes framed as a JPEG (SOI/APP0/EOI markers around random filler)."""
+    filler = random.Random(seed).randbytes(max(0, size - 6))
+    return b'\xff\xd8\xff\xe0' + filler + b'\xff\xd9'
+
+
+# -----------------------------------------------------------------------------
+# Server
+# -----------------------------------------------------------------------------
+
+class MockAPIServer:
+    """Threaded HTTP server imitating the Decor8 AI API.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on; 0 picks a free port (see .port after start()).
+        latency: Delay before each response: seconds, a (low, high) uniform
+            range, or a callable taking a random.Random and returning seconds
+            (see constant(), uniform() and lognormal()).
+        endpoint_latency: Per-endpoint overrides of latency, keyed by endpoint name.
+        error_rate: Fraction of requests answered with a 500 error.
+        rate_limit_rate: Fraction of requests answered with 429 and Retry-After.
+        retry_after: Retry-After value sent with injected 429 responses, in seconds.
+        image_bytes: Size of every returned image before base64 encoding.
+        image_size: (width, height) reported for returned images.
+        api_key: If set, requests must send it as their bearer token.
+        seed: Seed for the latency and error draws, for reproducible runs.
+
+    Raises:
+        ValueError: If an endpoint_latency key is unknown or the rates exceed 1.
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        *,
+        latency: Latency = None,
+        endpoint_latency: Optional[Dict[str, Latency]] = None,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1,
+        image_bytes: int = DEFAULT_IMAGE_BYTES,
+        image_size: Tuple[int, int] = DEFAULT_IMAGE_SIZE,
+        api_key: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        for endpoint in endpoint_latency or {}:
+            if endpoint not in ENDPOINTS:
+                raise ValueError(f"Unknown endpoint '{endpoint}'. Expected one of: {', '.join(ENDPOINTS)}")
+        if error_rate < 0 or rate_limit_rate < 0 or error_rate + rate_limit_rate > 1:
+            raise ValueError("error_rate and rate_limit_rate must be non-negative and sum to at most 1")
+        self.host = host
+        self.port = port
+        self.latency = _latency_function(latency)
+        self.endpoint_latency = {name: _latency_function(value) for name, value in (endpoint_latency or {}).items()}
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.image_size = image_size
+        self.api_key = api_key
+        self.image = fake_jpeg(image_bytes)
+        self._image_b64 = base64.b64encode(self.image).decode('ascii')
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._bytes_received = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "MockAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to the clients as base_url."""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "MockAPIServer":
+        """Start listening on a background thread. Returns self."""
+        self._server = self._make_server()
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.1,), daemon=True, name='decor8ai-mock-api'
+        )
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop listening."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request counts per endpoint and status, and total request bytes received."""
+        with self._lock:
+            counts = dict(self._counts)
+            received = self._bytes_received
+        endpoints: Dict[str, Dict[int, int]] = {}
+        for (endpoint, status), count in sorted(counts.items()):
+            endpoints.setdefault(endpoint, {})[status] = count
+        return {
+            'requests': sum(counts.values()),
+            'bytes_received': received,
+            'endpoints': endpoints,
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._bytes_received = 0
+
+    def _make_server(self) -> ThreadingHTTPServer:
+        server = ThreadingHTTPServer((self.host, self.port), _handler(self))
+        server.daemon_threads = True
+        self.port = server.server_port
+        return server
+
+    # -------------------------------------------------------------------------
+    # Request handling
+    # -------------------------------------------------------------------------
+
+    def _draw(self, endpoint: str) -> Tuple[float, float]:
+        """Return the latency and a uniform draw for error injection."""
+        latency = self.endpoint_latency.get(endpoint, self.latency)
+        with self._lock:
+            return max(0.0, latency(self._random)), self._random.random()
+
+    def _record(self, endpoint: str, status: int, received: int) -> None:
+        with self._lock:
+            key = (endpoint, status)
+            self._counts[key] = self._counts.get(key, 0) + 1
+            self._bytes_received += received
+
+    def handle(self, method: str, path: str, headers: Any, body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        """Answer one request. Returns the status, extra headers and body."""
+        route = urlparse(path).path
+        if method == 'GET' and route.startswith(IMAGE_PATH):
+            return 200, {'Content-Type': 'image/jpeg'}, self.image
+        endpoint = route.lstrip('/')
+        known = endpoint in ENDPOINTS or route == CAPTIONS_PATH
+        if not known:
+            return _error(404, 'NotFound', f"No endpoint at {route}")
+        if method != 'POST':
+            return _error(405, 'MethodNotAllowed', 'Use POST')
+        if self.api_key is not None and headers.get('Authorization') != f"Bearer {self.api_key}":
+            return _error(401, 'Unauthorized', 'Invalid API key')
+
+        latency, draw = self._draw(endpoint)
+        if latency:
+            time.sleep(latency)
+        if draw < self.rate_limit_rate:
+            status, extra, payload = _error(429, 'TooManyRequests', 'Rate limit exceeded')
+            extra['Retry-After'] = f"{self.retry_after:g}"
+            return status, extra, payload
+        if draw < self.rate_limit_rate + self.error_rate:
+            return _error(500, 'InternalError', 'Injected server error')
+
+        try:
+            params = _parse_params(headers.get('Content-Type') or '', body)
+        except ValueError as exc:
+            return _error(400, 'InvalidInput', str(exc))
+        if endpoint in MULTIPART_ENDPOINTS and 'input_image' not in params:
+            return _error(400, 'InvalidInput', 'input_image is required')
+        return 200, {'Content-Type': 'application/json'}, json.dumps(self._respond(endpoint, params)).encode('utf-8')
+
+    def _respond(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a successful response body for endpoint."""
+        if endpoint == 'upscale_image':
+            info: Dict[str, Any] = {'upscaled_image': self._image_b64}
+        elif endpoint == CAPTIONS_PATH.lstrip('/'):
+            info = {'captions': [f"A {params.get('design_style', 'modern')} {params.get('room_type', 'room')}".lower()
+                                 for _ in range(_count(params.get('num_captions')))]}
+        else:
+            inline = endpoint in MULTIPART_ENDPOINTS
+            info = {'images': [self._image_entry(inline) for _ in range(_count(params.get('num_images')))]}
+            if params.get('num_captions'):
+                info['captions'] = ['A mock design' for _ in range(_count(params['num_captions']))]
+        return {'error': '', 'message': 'Successfully generated designs.', 'info': info}
+
+    def _image_entry(self, inline: bool) -> Dict[str, Any]:
+        image_id = str(uuid.uuid4())
+        width, height = self.image_size
+        entry: Dict[str, Any] = {'uuid': image_id, 'width': width, 'height': height}
+        if inline:
+            entry['data'] = self._image_b64
+        else:
+            entry['url'] = f"{self.url}{IMAGE_PATH}{image_id}.jpg"
+        return entry
+
+
+def _error(status: int, error: str, message: str) -> Tuple[int, Dict[str, str], bytes]:
+    body = json.dumps({'error': error, 'message': message}).encode('utf-8')
+    return status, {'Content-Type': 'application/json'}, body
+
+
+def _count(value: Any) -> int:
+    """Number of images or captions to return for a request field."""
+    try:
+        return max(1, min(MAX_IMAGES, int(value)))
+    except (TypeError, ValueError):
+        return 1
+
+
+def _parse_params(content_type: str, body: bytes) -> Dict[str, Any]:
+    """Parse a JSON or multipart request body into a dict of fields.
+
+    Multipart file parts are included as bytes.
+
+    Raises:
+        ValueError: If the body cannot be parsed.
+    """
+    if content_type.startswith('multipart/form-data'):
+        message = BytesParser(policy=HTTP).parsebytes(
+            b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body
+        )
+        if not message.is_multipart():
+            raise ValueError('Malformed multipart body')
+        params: Dict[str, Any] = {}
+        for part in message.iter_parts():
+            name = part.get_param('name', header='content-disposition')
+            payload = part.get_payload(decode=True)
+            params[name] = payload if part.get_filename() else payload.decode('utf-8')
+        return params
+    if not body:
+        return {}
+    try:
+        params = json.loads(body)
+    except ValueError:
+        raise ValueError('Request body is not valid JSON')
+    if not isinstance(params, dict):
+        raise ValueError('Request body must be a JSON object')
+    return params
+
+
+def _handler(server: MockAPIServer) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        # Keep connections open, as the real API does, so pooled clients reuse them.
+        protocol_version = 'HTTP/1.1'
+
+        def _read_body(self) -> bytes:
+            if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+                chunks: List[bytes] = []
+                total = 0
+                while True:
+                    size = int(self.rfile.readline().split(b';', 1)[0].strip() or b'0', 16)
+                    if size == 0:
+                        # Skip trailers up to the terminating blank line.
+                        while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                            pass
+                        return b''.join(chunks)
+                    total += size
+                    if total > MAX_BODY_BYTES:
+                        raise ValueError('Request body too large')
+                    chunks.append(self.rfile.read(size))
+                    self.rfile.readline()
+            length = int(self.headers.get('Content-Length') or 0)
+            if length > MAX_BODY_BYTES:
+                raise ValueError('Request body too large')
+            return self.rfile.read(length)
+
+        def _handle(self):
+            try:
+                body = self._read_body()
+            except ValueError as exc:
+                status, extra, payload = _error(413, 'PayloadTooLarge', str(exc))
+                self.close_connection = True
+                body = b''
+            else:
+                status, extra, payload = server.handle(self.command, self.path, self.headers, body)
+            route = urlparse(self.path).path
+            server._record('image' if route.startswith(IMAGE_PATH) else route.lstrip('/'), status, len(body))
+            self.send_response(status)
+            for name, value in extra.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_POST = do_GET = do_PUT = _handle
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+# -----------------------------------------------------------------------------
+# Subprocess
+# -----------------------------------------------------------------------------
+
+class MockAPIProcess:
+    """Runs a MockAPIServer in a child process.
+
+    Takes the command-line options of ``python -m decor8ai.testing`` as
+    keyword arguments (latency, error_rate, rate_limit_rate, retry_after,
+    image_bytes, api_key, seed); latency is seconds or a (low, high) range.
+
+    Example:
+        >>> with MockAPIProcess(latency=(0.1, 0.3)) as server:
+        ...     client = Decor8AI(api_key='test', base_url=server.url)
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, **options: Any):
+        self.host = host
+        self.port = port
+        self.options = options
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "MockAPIProcess":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "MockAPIProcess":
+        """Start the child process and wait until it is listening. Returns self.
+
+        Raises:
+            RuntimeError: If the process exits before it starts listening.
+        """
+        command = [sys.executable, '-m', 'decor8ai.testing', '--host', self.host, '--port', str(self.port)]
+        for name, value in self.options.items():
+            if value is None:
+                continue
+            flag = '--' + name.replace('_', '-')
+            if isinstance(value, (tuple, list)):
+                command += [flag, ','.join(str(v) for v in value)]
+            else:
+                command += [flag, str(value)]
+        self._process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+        line = self._process.stdout.readline()
+        if not line:
+            self._process.wait()
+            raise RuntimeError(f"Mock API server exited with status {self._process.returncode}")
+        self.port = int(line.rsplit(':', 1)[1])
+        return self
+
+    def close(self) -> None:
+        """Stop the child process."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+
+def _parse_latency(value: str) -> Latency:
+    """Parse --latency: 'SECONDS', 'LOW,HIGH' or 'lognormal:MEDIAN[,SIGMA]'."""
+    if value.startswith('lognormal:'):
+        return lognormal(*(float(part) for part in value.split(':', 1)[1].split(',')))
+    parts = [float(part) for part in value.split(',')]
+    return parts[0] if len(parts) == 1 else (parts[0], parts[1])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m decor8ai.testing', description='Offline mock of the Decor8 AI API.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=_parse_latency, default=None,
+                        help="seconds, 'LOW,HIGH' or 'lognormal:MEDIAN[,SIGMA]'")
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=float, default=1)
+    parser.add_argument('--image-bytes', type=int, default=DEFAULT_IMAGE_BYTES)
+    parser.add_argument('--api-key', default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = MockAPIServer(
+        args.host,
+        args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        image_bytes=args.image_bytes,
+        api_key=args.api_key,
+        seed=args.seed,
+    )
+    http_server = server._make_server()
+    # MockAPIProcess reads the port from this line.
+    print(f"Mock Decor8 AI API listening on {server.url}", flush=True)
+    try:
+        http_server.serve_forever(0.1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        http_server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,324 @@
+"""Embeddable receivers for Decor8 AI webhook callbacks.
+
+Instead of holding an HTTP request open for every generation, a caller can
+pass ``webhooks_data`` pointing at one of these receivers and wait on a
+future that is resolved when the callback arrives (see
+Decor8AI.submit_async()). Each submission gets an unguessable token that is
+part of its callback URL, so callbacks are matched to futures without relying
+on the payload format, and stray or forged requests cannot resolve them.
+
+WebhookReceiver runs a small threaded HTTP server; AsyncWebhookReceiver runs
+on an asyncio event loop. Both need a URL reachable by the API; pass
+public_url when the receiver sits behind a proxy or tunnel. A submission whose
+callback does not arrive within the receiver's timeout has its future failed
+with TimeoutError and its token forgotten.
+"""
+
+import asyncio
+import http
+import json
+import secrets
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+DEFAULT_PATH = '/decor8ai/webhooks/'
+MAX_BODY_BYTES = 16 * 1024 * 1024
+DEFAULT_TIMEOUT = 3600.0
+# How often the receivers fail futures whose callback is overdue.
+EXPIRY_INTERVAL = 1.0
+
+
+def default_webhooks_data(callback_url: str) -> str:
+    """Build the webhooks_data request field for a callback URL."""
+    return json.dumps({'url': callback_url})
+
+
+def _content_length(value: Optional[str]) -> Optional[int]:
+    """Parse a Content-Length header, or return None if it is malformed."""
+    try:
+        length = int(value or 0)
+    except ValueError:
+        return None
+    return length if length >= 0 else None
+
+
+class WebhookRegistry:
+    """Thread-safe map of callback tokens to the futures waiting on them.
+
+    Args:
+        timeout: Seconds a token waits for its callback before expire() fails
+            its future with TimeoutError and forgets it. None to wait forever.
+    """
+
+    def __init__(self, timeout: Optional[float] = DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        # Insertion order is deadline order, since every entry has the same timeout.
+        self._futures: Dict[str, Tuple[Future, float]] = {}
+        self._lock = threading.Lock()
+
+    def register(self) -> Tuple[str, Future]:
+        """Create a token and the future its callback will resolve."""
+        self.expire()
+        token = secrets.token_urlsafe(16)
+        future: Future = Future()
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else float('inf')
+        with self._lock:
+            self._futures[token] = (future, deadline)
+        return token, future
+
+    def pop(self, token: str) -> Optional[Future]:
+        """Remove and return the future for token, or None if unknown."""
+        with self._lock:
+            entry = self._futures.pop(token, None)
+        return entry[0] if entry is not None else None
+
+    def expire(self) -> int:
+        """Fail and forget the futures whose callback is overdue. Returns how many expired."""
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            for token, (future, deadline) in self._futures.items():
+                if deadline > now:
+                    break
+                expired.append(token)
+            futures = [self._futures.pop(token)[0] for token in expired]
+        for future in futures:
+            if not future.done():
+                future.set_exception(TimeoutError(f"No webhook callback within {self.timeout} seconds"))
+        return len(futures)
+
+    def resolve(self, token: str, payload: Any) -> bool:
+        """Resolve the future for token with payload. Returns False if the token is unknown."""
+        future = self.pop(token)
+        if future is None:
+            return False
+        if not future.done():
+            future.set_result(payload)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+
+class _ReceiverBase:
+    """URL building, registration and delivery shared by both receivers."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        public_url: Optional[str],
+        path: str,
+        webhooks_data: Callable[[str], str],
+        timeout: Optional[float],
+    ):
+        self.host = host
+        self.port = port
+        self.public_url = public_url.rstrip('/') if public_url else None
+        self.path = '/' + path.strip('/') + '/'
+        self.registry = WebhookRegistry(timeout)
+        self._webhooks_data = webhooks_data
+
+    @property
+    def url(self) -> str:
+        """Base URL the API calls back on."""
+        return self.public_url or f"http://{self.host}:{self.port}"
+
+    @property
+    def pending(self) -> int:
+        """Number of submissions still waiting for their callback."""
+        return len(self.registry)
+
+    def register(self) -> Tuple[str, Future]:
+        """Register a submission; returns its token and the future its callback resolves."""
+        return self.registry.register()
+
+    def callback_url(self, token: str) -> str:
+        return f"{self.url}{self.path}{token}"
+
+    def webhooks_data(self, token: str) -> str:
+        """Return the webhooks_data value that routes a request's callback to token's future."""
+        return self._webhooks_data(self.callback_url(token))
+
+    def _deliver(self, method: str, path: str, body: bytes) -> int:
+        """Handle one callback request and return the HTTP status to answer with."""
+        if method != 'POST':
+            return 405
+        if not path.startswith(self.path):
+            return 404
+        token = path[len(self.path):].split('?', 1)[0]
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400
+        return 200 if self.registry.resolve(token, payload) else 404
+
+
+class WebhookReceiver(_ReceiverBase):
+    """Webhook receiver on a background thread.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on; 0 picks a free port (see .port after start()).
+        public_url: Base URL the API should call, when it differs from http://host:port.
+        path: URL path prefix for callbacks.
+        webhooks_data: Builds the webhooks_data field from a callback URL.
+        timeout: Seconds to wait for a callback before its future fails with
+            TimeoutError. None to wait forever.
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        *,
+        public_url: Optional[str] = None,
+        path: str = DEFAULT_PATH,
+        webhooks_data: Callable[[str], str] = default_webhooks_data,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ):
+        super().__init__(host, port, public_url, path, webhooks_data, timeout)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "WebhookReceiver":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start(self) -> "WebhookReceiver":
+        """Start listening. Returns self."""
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _handle(self):
+                header = self.headers.get('Content-Length')
+                length = _content_length(header)
+                if header is None and self.command == 'POST':
+                    status = 411  # chunked bodies are not accepted
+                elif length is None:
+                    status = 400
+                elif length > MAX_BODY_BYTES:
+                    status = 413
+                else:
+                    status = receiver._deliver(self.command, self.path, self.rfile.read(length))
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            do_POST = do_GET = do_PUT = _handle
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            next_expiry = 0.0
+
+            def service_actions(self):
+                # Runs after every poll of serve_forever (0.1s).
+                if time.monotonic() >= self.next_expiry:
+                    self.next_expiry = time.monotonic() + EXPIRY_INTERVAL
+                    receiver.registry.expire()
+
+        self._server = Server((self.host, self.port), Handler)
+        self.port = self._server.server_port
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.1,), daemon=True, name='decor8ai-webhooks'
+        )
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop listening. Pending futures stay unresolved and no longer time out."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class AsyncWebhookReceiver(_ReceiverBase):
+    """Webhook receiver on the running asyncio event loop.
+
+    Takes the same arguments as WebhookReceiver. Futures returned by
+    register() are concurrent.futures.Future objects; await them with
+    asyncio.wrap_future() (AsyncDecor8AI.submit_async() does this for you).
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        *,
+        public_url: Optional[str] = None,
+        path: str = DEFAULT_PATH,
+        webhooks_data: Callable[[str], str] = default_webhooks_data,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ):
+        super().__init__(host, port, public_url, path, webhooks_data, timeout)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._expiry: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncWebhookReceiver":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self) -> "AsyncWebhookReceiver":
+        """Start listening. Returns self."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._expiry = asyncio.get_running_loop().create_task(self._expire_pending())
+        return self
+
+    async def _expire_pending(self) -> None:
+        while True:
+            await asyncio.sleep(EXPIRY_INTERVAL)
+            self.registry.expire()
+
+    async def close(self) -> None:
+        """Stop listening. Pending futures stay unresolved and no longer time out."""
+        if self._expiry is not None:
+            self._expiry.cancel()
+            self._expiry = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one HTTP/1.1 request and close the connection."""
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+            lines = head.decode('latin-1').split('\r\n')
+            method, path = lines[0].split(' ')[:2]
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            header = headers.get('content-length')
+            length = _content_length(header)
+            if header is None and method == 'POST':
+                status = 411  # chunked bodies are not accepted
+            elif length is None:
+                status = 400
+            elif length > MAX_BODY_BYTES:
+                status = 413
+            else:
+                status = self._deliver(method, path, await reader.readexactly(length))
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            status = 400  # truncated or malformed request head
+        writer.write(
+            f"HTTP/1.1 {status} {http.HTTPStatus(status).phrase}\r\n"
+            "Content-Length: 0\r\nConnection: close\r\n\r\n".encode('ascii')
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
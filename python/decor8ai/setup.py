@@ -34,4 +34,11 @@ setup(
     install_requires=[
         'requests>=2.25.0',
     ],
+    entry_points={
+        'console_scripts': ['decor8ai=decor8ai.cli:main'],
+    },
+    extras_require={
+        'async': ['httpx>=0.24.0'],
+        'images': ['Pillow>=9.1.0'],
+    },
 )
@@ -1,25 +1,27 @@
+from decor8ai import Decor8AI, Pipeline, Stage
+import os
 
-from decor8ai.client import remove_objects_from_room, upscale_image, generate_designs
-import base64, os, uuid
-
-# Remove objects and upscale
-empty_room_url = remove_objects_from_room(
-    input_image_url='https://prod-files.decor8.ai/test-images/sdk_test_remove_objects_familyroom_2.jpg'
-)["info"]["image"]["url"]
-upscaled_data = base64.b64decode(
-    upscale_image(empty_room_url, scale_factor=2)["info"]["upscaled_image"]
-)
-
-# Generate and save designs
-os.makedirs("output-data", exist_ok=True)
-for i, img in enumerate(
-    generate_designs(
-        upscaled_data,
+# Remove objects, upscale, then stage: each image flows through the three
+# stages while other images are being processed by the stages around it.
+pipeline = Pipeline(Decor8AI(), [
+    Stage('remove_objects_from_room', workers=4),
+    Stage('upscale_image', workers=2, scale_factor=2),
+    Stage(
+        'generate_designs',
+        workers=4,
         room_type='familyroom',
         design_style='rustic',
         num_images=4,
-        speciality_decor="SPECIALITY_DECOR_5"
-    )["info"]["images"]
-):
-    with open(f"output-data/generated_designs_{i}_{uuid.uuid4()}.jpg", "wb") as f:
-        f.write(base64.b64decode(img["data"]))
+        speciality_decor="SPECIALITY_DECOR_5",
+        output="output-data",
+    ),
+])
+
+os.makedirs("output-data", exist_ok=True)
+photos = ['https://prod-files.decor8.ai/test-images/sdk_test_remove_objects_familyroom_2.jpg']
+for result in pipeline.run(photos):
+    if result.ok:
+        for img in result.result["info"]["images"]:
+            print(f"Saved {img['data'].path}")
+    else:
+        print(f"{result.input} failed at {result.stage}: {result.error}")
@@ -0,0 +1,109 @@
+"""Unit tests for the Decor8 AI asyncio client.
+
+These tests use httpx.MockTransport to avoid making actual API calls.
+Run with: pytest test_async_client.py -v
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import AsyncDecor8AI, RetryPolicy
+
+
+def make_client(handler):
+    """Create an async client whose requests are answered by handler."""
+    client = AsyncDecor8AI(api_key="test-key")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncDecor8AI:
+    """Test AsyncDecor8AI endpoint methods."""
+
+    def test_generate_designs_for_room(self):
+        """Test that JSON endpoints send the same payload as the sync client."""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={"error": "", "info": {"images": []}})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.generate_designs_for_room(
+                    input_image_url="https://example.com/room.jpg",
+                    room_type="livingroom",
+                    design_style="modern",
+                    seed=42,
+                )
+
+        result = asyncio.run(run())
+
+        assert result == {"error": "", "info": {"images": []}}
+        request = requests_seen[0]
+        assert request.url.path == "/generate_designs_for_room"
+        assert request.headers['Authorization'] == "Bearer test-key"
+        payload = json.loads(request.content)
+        assert payload == {
+            'input_image_url': "https://example.com/room.jpg",
+            'room_type': "livingroom",
+            'design_style': "modern",
+            'num_images': 1,
+            'seed': 42,
+        }
+
+    def test_upscale_image_downloads_url_input(self):
+        """Test that URL inputs are fetched asynchronously and uploaded as multipart."""
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, content=b"image-bytes")
+            assert request.url.path == "/upscale_image"
+            assert b"image-bytes" in request.content
+            assert b'name="scale_factor"' in request.content
+            return httpx.Response(200, json={"error": "", "info": {"upscaled_image": "abc"}})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.upscale_image("https://example.com/room.jpg", scale_factor=4)
+
+        result = asyncio.run(run())
+        assert result['info']['upscaled_image'] == "abc"
+
+    def test_many_requests_in_flight(self):
+        """Test that concurrent calls share the client without serializing."""
+        def handler(request):
+            return httpx.Response(200, json={"error": "", "path": request.url.path})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await asyncio.gather(*[
+                    client.replace_sky_behind_house("https://example.com/house.jpg", "dusk")
+                    for _ in range(50)
+                ])
+
+        results = asyncio.run(run())
+        assert len(results) == 50
+        assert all(r['path'] == "/replace_sky_behind_house" for r in results)
+
+    def test_retries_transient_status(self):
+        """Test that 503 responses are retried before returning the result."""
+        statuses = iter([503, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses), json={"error": ""})
+
+        async def run():
+            client = make_client(handler)
+            client.retry_policy = RetryPolicy(backoff_base=0)
+            async with client:
+                return await client.prime_walls_for_room("https://example.com/room.jpg")
+
+        assert asyncio.run(run()) == {"error": ""}
@@ -0,0 +1,106 @@
+"""Unit tests for Decor8AI batch execution (map/batch).
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_batch.py -v
+"""
+
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI
+from decor8ai.batch import run_batch
+
+
+class TestRunBatch:
+    """Test the run_batch helper."""
+
+    def test_ordered_results(self):
+        """Test that ordered mode yields results in input order."""
+        def func(delay, value):
+            time.sleep(delay)
+            return value
+
+        items = [{'delay': 0.03 - i * 0.01, 'value': i} for i in range(3)]
+        results = list(run_batch(func, items, concurrency=3, ordered=True))
+        assert [r.result for r in results] == [0, 1, 2]
+        assert [r.index for r in results] == [0, 1, 2]
+
+    def test_completion_order(self):
+        """Test that unordered mode yields fast items first."""
+        def func(delay, value):
+            time.sleep(delay)
+            return value
+
+        items = [{'delay': 0.2, 'value': 'slow'}, {'delay': 0.0, 'value': 'fast'}]
+        results = list(run_batch(func, items, concurrency=2, ordered=False))
+        assert [r.result for r in results] == ['fast', 'slow']
+
+    def test_errors_are_captured(self):
+        """Test that a failing item does not abort the batch."""
+        def func(value):
+            if value == 1:
+                raise RuntimeError("boom")
+            return value
+
+        results = list(run_batch(func, [{'value': i} for i in range(3)], concurrency=2))
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, RuntimeError)
+        assert results[1].kwargs == {'value': 1}
+
+    def test_concurrency_limit(self):
+        """Test that no more than `concurrency` calls run at once."""
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def func():
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.01)
+            with lock:
+                state['active'] -= 1
+
+        list(run_batch(func, ({} for _ in range(20)), concurrency=3))
+        assert state['peak'] <= 3
+
+    def test_invalid_concurrency(self):
+        """Test that concurrency below 1 is rejected."""
+        with pytest.raises(ValueError):
+            list(run_batch(lambda: None, [{}], concurrency=0))
+
+
+class TestClientBatch:
+    """Test Decor8AI.map() and Decor8AI.batch()."""
+
+    @pytest.fixture
+    def client(self):
+        return Decor8AI(api_key="test-key")
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_batch_calls_endpoint(self, mock_post, client):
+        """Test that batch() dispatches each item to the named endpoint."""
+        mock_post.return_value.json.return_value = {"error": "", "info": {"images": []}}
+
+        items = [
+            {'input_image_url': f"https://example.com/{i}.jpg", 'room_type': "livingroom", 'design_style': "modern"}
+            for i in range(5)
+        ]
+        results = client.batch('generate_designs_for_room', items, concurrency=2)
+
+        assert len(results) == 5
+        assert all(r.ok for r in results)
+        assert mock_post.call_count == 5
+        urls = sorted(call[1]['json']['input_image_url'] for call in mock_post.call_args_list)
+        assert urls == [f"https://example.com/{i}.jpg" for i in range(5)]
+
+    def test_unknown_endpoint(self, client):
+        """Test that endpoint names must come from constants.ENDPOINTS."""
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            client.map('close', [{}])
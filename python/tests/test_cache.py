@@ -0,0 +1,224 @@
+"""Unit tests for the response and input image caches.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_cache.py -v
+"""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, ImageCache, ResponseCache
+from decor8ai.cache import DiskCache, MemoryCache, make_cache_key
+from decor8ai.client import _load_image_bytes
+
+
+OK_RESPONSE = {"error": "", "info": {"images": [{"url": "https://example.com/result.jpg"}]}}
+
+
+class TestCacheKey:
+    """Test canonical cache keys."""
+
+    def test_key_ignores_dict_order(self):
+        """Test that payload ordering does not change the key."""
+        assert make_cache_key('e', {'a': 1, 'b': 2}) == make_cache_key('e', {'b': 2, 'a': 1})
+
+    def test_key_depends_on_endpoint_and_payload(self):
+        """Test that different endpoints or payloads produce different keys."""
+        assert make_cache_key('e1', {'a': 1}) != make_cache_key('e2', {'a': 1})
+        assert make_cache_key('e', {'a': 1}) != make_cache_key('e', {'a': 2})
+
+
+class TestMemoryCache:
+    """Test the in-memory LRU tier."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = MemoryCache(maxsize=2)
+        cache.set('a', '1')
+        cache.set('b', '2')
+        cache.get('a')
+        cache.set('c', '3')
+        assert cache.get('a') == '1'
+        assert cache.get('b') is None
+        assert cache.get('c') == '3'
+
+    def test_ttl(self):
+        """Test that expired entries are not returned."""
+        cache = MemoryCache(ttl=10)
+        cache.set('a', '1', stored_at=time.time() - 20)
+        assert cache.get('a') is None
+
+
+class TestDiskCache:
+    """Test the persistent tier."""
+
+    def test_roundtrip_and_persistence(self, tmp_path):
+        """Test that entries survive a new DiskCache instance on the same directory."""
+        DiskCache(str(tmp_path)).set('key', '{"a":1}')
+        entry = DiskCache(str(tmp_path)).get('key')
+        assert entry is not None
+        assert entry[1] == '{"a":1}'
+
+    def test_size_cap_evicts_oldest(self, tmp_path):
+        """Test that the least recently used files are removed past max_bytes."""
+        cache = DiskCache(str(tmp_path), max_bytes=250)
+        for i in range(5):
+            cache.set(f'key{i}', 'x' * 50)
+            os.utime(cache._path(f'key{i}'), (i, i))
+        cache.set('key5', 'x' * 50)
+        assert cache.get('key0') is None
+        assert cache.get('key5') is not None
+        assert sum(os.path.getsize(e.path) for e in cache._entries()) <= 250
+
+    def test_ttl(self, tmp_path):
+        """Test that expired entries are dropped."""
+        cache = DiskCache(str(tmp_path), ttl=10)
+        cache.set('key', '{}')
+        with patch('decor8ai.cache.time.time', return_value=time.time() + 60):
+            assert cache.get('key') is None
+        assert not os.path.exists(cache._path('key'))
+
+
+class TestClientCache:
+    """Test the cache in the client request path."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        return Decor8AI(api_key="test-key", cache=ResponseCache(directory=str(tmp_path)))
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_seeded_request_cached(self, mock_post, client):
+        """Test that a repeated seeded request is served from the cache."""
+        mock_post.return_value.json.return_value = OK_RESPONSE
+        kwargs = dict(input_image_url="https://example.com/room.jpg", room_type="livingroom",
+                      design_style="modern", seed=7)
+
+        first = client.generate_designs_for_room(**kwargs)
+        second = client.generate_designs_for_room(**kwargs)
+
+        assert first == second == OK_RESPONSE
+        assert second is not first
+        assert mock_post.call_count == 1
+        assert client.cache.hits == 1
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_disk_tier_survives_restart(self, mock_post, client, tmp_path):
+        """Test that a new client on the same directory reuses persisted responses."""
+        mock_post.return_value.json.return_value = OK_RESPONSE
+        client.generate_inspirational_designs("livingroom", "modern", seed=1)
+
+        other = Decor8AI(api_key="test-key", cache=ResponseCache(directory=str(tmp_path)))
+        assert other.generate_inspirational_designs("livingroom", "modern", seed=1) == OK_RESPONSE
+        assert mock_post.call_count == 1
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_unseeded_and_errors_not_cached(self, mock_post, client):
+        """Test that unseeded requests and error responses always hit the API."""
+        mock_post.return_value.json.return_value = OK_RESPONSE
+        client.generate_designs_for_room("https://example.com/room.jpg", "livingroom", "modern")
+        client.generate_designs_for_room("https://example.com/room.jpg", "livingroom", "modern")
+
+        mock_post.return_value.json.return_value = {"error": "Failed", "message": "boom"}
+        client.generate_designs_for_room("https://example.com/room.jpg", "livingroom", "modern", seed=3)
+        client.generate_designs_for_room("https://example.com/room.jpg", "livingroom", "modern", seed=3)
+
+        assert mock_post.call_count == 4
+
+
+def make_get_response(status_code, content=b"", headers=None):
+    """Create a mock GET response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+class TestImageCache:
+    """Test the conditional-GET cache for input image downloads."""
+
+    URL = "https://example.com/listing.jpg"
+
+    def test_revalidates_with_etag(self, tmp_path):
+        """Test that a repeat load sends If-None-Match and reuses the body on 304."""
+        cache = ImageCache(str(tmp_path))
+        session = MagicMock()
+        session.get.side_effect = [
+            make_get_response(200, b"jpeg-bytes", {'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}),
+            make_get_response(304),
+        ]
+
+        assert _load_image_bytes(self.URL, session, cache) == b"jpeg-bytes"
+        assert _load_image_bytes(self.URL, session, cache) == b"jpeg-bytes"
+
+        second_headers = session.get.call_args_list[1][1]['headers']
+        assert second_headers['If-None-Match'] == '"v1"'
+        assert second_headers['If-Modified-Since'] == 'Wed, 21 Oct 2015 07:28:00 GMT'
+        assert cache.revalidated == 1
+
+    def test_content_addressed_storage(self, tmp_path):
+        """Test that identical bodies from different URLs are stored once."""
+        cache = ImageCache(str(tmp_path))
+        cache.store("https://a.example.com/1.jpg", b"same")
+        cache.store("https://b.example.com/2.jpg", b"same")
+        assert len(os.listdir(tmp_path / "blobs")) == 1
+
+    def test_evicted_blob_refetched(self, tmp_path):
+        """Test that a 304 for an evicted image falls back to an unconditional GET."""
+        cache = ImageCache(str(tmp_path), max_bytes=10)
+        cache.store(self.URL, b"x" * 8, etag='"v1"')
+        for name in os.listdir(tmp_path / "blobs"):
+            os.utime(tmp_path / "blobs" / name, (0, 0))
+        cache.store("https://example.com/other.jpg", b"y" * 8)
+        session = MagicMock()
+        session.get.return_value = make_get_response(200, b"x" * 8)
+
+        assert _load_image_bytes(self.URL, session, cache) == b"x" * 8
+        assert 'If-None-Match' not in session.get.call_args_list[0][1]['headers']
+
+    def test_eviction_removes_metadata(self, tmp_path):
+        """Test that evicting an image also deletes the metadata of the URLs pointing at it."""
+        cache = ImageCache(str(tmp_path), max_bytes=20)
+        for number in range(10):
+            cache.store(f"https://example.com/{number}.jpg", bytes([number]) * 8, etag=f'"v{number}"')
+        assert len(os.listdir(tmp_path / "blobs")) == 2
+        assert len(os.listdir(tmp_path / "meta")) == 2
+        assert cache.request_headers("https://example.com/9.jpg") == {'If-None-Match': '"v9"'}
+        assert cache.request_headers("https://example.com/0.jpg") == {}
+
+    def test_store_does_not_rescan(self, tmp_path):
+        """Test that the cache directory is scanned once, not on every store."""
+        ImageCache(str(tmp_path)).store("https://example.com/old.jpg", b"old")
+        cache = ImageCache(str(tmp_path), max_bytes=10)
+        with patch('decor8ai.cache.os.scandir', wraps=os.scandir) as scandir:
+            for number in range(20):
+                cache.store(f"https://example.com/{number}.jpg", bytes([number]) * 4)
+        assert scandir.call_count == 2  # blobs and meta, once
+        assert sum(os.path.getsize(tmp_path / "blobs" / name) for name in os.listdir(tmp_path / "blobs")) <= 10
+        assert cache.request_headers("https://example.com/old.jpg") == {}
+
+    @patch('decor8ai.client.requests.Session.post')
+    @patch('decor8ai.client.requests.Session.get')
+    def test_client_uses_image_cache(self, mock_get, mock_post, tmp_path):
+        """Test that multipart endpoints load URL inputs through the image cache."""
+        mock_get.side_effect = [make_get_response(200, b"jpeg", {'ETag': '"v1"'}), make_get_response(304)]
+        bodies = []
+
+        def post(url, **kwargs):
+            bodies.append(kwargs['data'].read())
+            return make_get_response(200)
+
+        mock_post.side_effect = post
+        client = Decor8AI(api_key="test-key", image_cache=ImageCache(str(tmp_path)))
+
+        client.upscale_image(self.URL)
+        client.prime_the_room_walls(self.URL)
+
+        assert all(b"\r\n\r\njpeg\r\n" in body for body in bodies)
+        assert client.image_cache.revalidated == 1
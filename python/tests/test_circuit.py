@@ -0,0 +1,192 @@
+"""Unit tests for per-endpoint circuit breakers.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_circuit.py -v
+"""
+
+import asyncio
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import CircuitBreaker, CircuitOpenError, Decor8AI, RetryPolicy
+from decor8ai.circuit import CLOSED, HALF_OPEN, OPEN
+
+
+ENDPOINT = 'upscale_image'
+
+
+def fail(breaker, times, endpoint=ENDPOINT, duration=0.1):
+    for _ in range(times):
+        admission = breaker.before_request(endpoint)
+        breaker.record(endpoint, True, duration, admission)
+
+
+class TestCircuitBreaker:
+    """Test state transitions."""
+
+    def test_opens_on_failure_rate(self):
+        """Test that the circuit opens once the failure rate is reached over min_requests."""
+        breaker = CircuitBreaker(failure_rate=0.5, min_requests=4)
+        fail(breaker, 3)
+        assert breaker.state(ENDPOINT) == CLOSED
+        admission = breaker.before_request(ENDPOINT)
+        breaker.record(ENDPOINT, False, 0.1, admission)
+        assert breaker.state(ENDPOINT) == OPEN
+        with pytest.raises(CircuitOpenError) as info:
+            breaker.before_request(ENDPOINT)
+        assert info.value.endpoint == ENDPOINT
+        assert info.value.retry_after > 0
+
+    def test_endpoints_isolated(self):
+        """Test that an open circuit does not affect other endpoints."""
+        breaker = CircuitBreaker(min_requests=2)
+        fail(breaker, 2)
+        breaker.before_request('remodel_kitchen')
+        assert breaker.state('remodel_kitchen') == CLOSED
+
+    def test_opens_on_slow_calls(self):
+        """Test the latency threshold."""
+        breaker = CircuitBreaker(min_requests=2, slow_call_duration=1.0, slow_call_rate=1.0)
+        for _ in range(2):
+            admission = breaker.before_request(ENDPOINT)
+            breaker.record(ENDPOINT, False, 5.0, admission)
+        assert breaker.state(ENDPOINT) == OPEN
+
+    def test_half_open_probe(self):
+        """Test that after open_duration one probe is admitted and its success closes the circuit."""
+        breaker = CircuitBreaker(min_requests=1, open_duration=10)
+        with patch('decor8ai.circuit.time.monotonic', return_value=100.0):
+            fail(breaker, 1)
+        with patch('decor8ai.circuit.time.monotonic', return_value=111.0):
+            assert breaker.state(ENDPOINT) == HALF_OPEN
+            admission = breaker.before_request(ENDPOINT)
+            with pytest.raises(CircuitOpenError):
+                breaker.before_request(ENDPOINT)
+            breaker.record(ENDPOINT, False, 0.1, admission)
+            assert breaker.state(ENDPOINT) == CLOSED
+
+    def test_stale_request_is_not_a_probe(self):
+        """Test that a request admitted while closed and finishing while half-open is ignored."""
+        breaker = CircuitBreaker(min_requests=1, open_duration=10)
+        with patch('decor8ai.circuit.time.monotonic', return_value=100.0):
+            stale = breaker.before_request(ENDPOINT)
+            fail(breaker, 1)
+        with patch('decor8ai.circuit.time.monotonic', return_value=111.0):
+            probe = breaker.before_request(ENDPOINT)
+            breaker.record(ENDPOINT, False, 0.1, stale)
+            assert breaker.state(ENDPOINT) == HALF_OPEN
+            with pytest.raises(CircuitOpenError):
+                breaker.before_request(ENDPOINT)
+            breaker.record(ENDPOINT, True, 0.1, probe)
+            assert breaker.state(ENDPOINT) == OPEN
+
+    def test_failed_probe_reopens(self):
+        """Test that a failing probe reopens the circuit."""
+        breaker = CircuitBreaker(min_requests=1, open_duration=10)
+        with patch('decor8ai.circuit.time.monotonic', return_value=100.0):
+            fail(breaker, 1)
+        with patch('decor8ai.circuit.time.monotonic', return_value=111.0):
+            fail(breaker, 1)
+            assert breaker.state(ENDPOINT) == OPEN
+
+    def test_unprotected_endpoint(self):
+        """Test that endpoints outside `endpoints` are never tripped."""
+        breaker = CircuitBreaker(min_requests=1, endpoints=['upscale_image'])
+        fail(breaker, 5, endpoint='remodel_kitchen')
+        assert breaker.state('remodel_kitchen') == CLOSED
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            CircuitBreaker(endpoints=['nope'])
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_rate=0)
+
+
+class TestClientCircuitBreaker:
+    """Test the breaker in the client request path."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_fails_fast_when_open(self, mock_post):
+        """Test that 5xx responses trip the circuit and later calls are not sent."""
+        mock_post.return_value = MagicMock(status_code=503, headers={})
+        mock_post.return_value.json.return_value = {"error": "Unavailable"}
+        client = Decor8AI(
+            api_key="test-key",
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=CircuitBreaker(min_requests=3),
+        )
+
+        for _ in range(3):
+            client.remodel_bathroom("https://example.com/b.jpg", "modern")
+        with pytest.raises(CircuitOpenError):
+            client.remodel_bathroom("https://example.com/b.jpg", "modern")
+        assert mock_post.call_count == 3
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_open_circuit_stops_retries(self, mock_post):
+        """Test that a circuit opening mid-retry ends the retry loop immediately."""
+        mock_post.side_effect = requests.ConnectionError("refused")
+        client = Decor8AI(
+            api_key="test-key",
+            retry_policy=RetryPolicy(max_attempts=5, backoff_base=0),
+            circuit_breaker=CircuitBreaker(min_requests=2),
+        )
+
+        with pytest.raises(CircuitOpenError):
+            client.remodel_bathroom("https://example.com/b.jpg", "modern")
+        assert mock_post.call_count == 2
+
+    def test_cancelled_async_probe_frees_its_slot(self):
+        """Test that cancelling a half-open probe lets the next call through as a new probe."""
+        httpx = pytest.importorskip("httpx")
+        from decor8ai import AsyncDecor8AI
+
+        stall = []
+
+        async def handler(request):
+            if not stall:
+                stall.append(1)
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={"error": ""})
+
+        breaker = CircuitBreaker(min_requests=1, open_duration=0.01)
+        fail(breaker, 1, endpoint='remodel_bathroom')
+
+        async def run():
+            await asyncio.sleep(0.02)
+            client = AsyncDecor8AI(api_key="test-key", circuit_breaker=breaker)
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                probe = asyncio.ensure_future(client.remodel_bathroom("https://example.com/b.jpg", "modern"))
+                await asyncio.sleep(0.05)
+                probe.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await probe
+                return await client.remodel_bathroom("https://example.com/b.jpg", "modern")
+
+        assert asyncio.run(run()) == {"error": ""}
+        assert breaker.state('remodel_bathroom') == CLOSED
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_probe_released_when_rate_limiter_raises(self, mock_post):
+        """Test that an attempt interrupted before it is sent does not keep its probe slot."""
+        mock_post.return_value = MagicMock(status_code=200, headers={})
+        mock_post.return_value.json.return_value = {"error": ""}
+        breaker = CircuitBreaker(min_requests=1, open_duration=10)
+        limiter = MagicMock()
+        limiter.acquire.side_effect = [KeyboardInterrupt, None]
+        client = Decor8AI(api_key="test-key", circuit_breaker=breaker, rate_limiter=limiter)
+        with patch('decor8ai.circuit.time.monotonic', return_value=100.0):
+            fail(breaker, 1, endpoint='remodel_bathroom')
+
+        with patch('decor8ai.circuit.time.monotonic', return_value=111.0):
+            with pytest.raises(KeyboardInterrupt):
+                client.remodel_bathroom("https://example.com/b.jpg", "modern")
+            client.remodel_bathroom("https://example.com/b.jpg", "modern")
+            assert breaker.state('remodel_bathroom') == CLOSED
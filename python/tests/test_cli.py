@@ -0,0 +1,129 @@
+"""Unit tests for the decor8ai command-line batch runner.
+
+These tests run against the offline mock API server.
+Run with: pytest test_cli.py -v
+"""
+
+import io
+import json
+import os
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI
+from decor8ai.cli import coerce_params, completed_rows, count_rows, main, read_manifest
+from decor8ai.testing import MockAPIServer
+
+
+@pytest.fixture
+def server():
+    with MockAPIServer(image_bytes=512) as server:
+        yield server
+
+
+def read_results(path):
+    with open(path) as f:
+        return sorted((json.loads(line) for line in f), key=lambda record: record['row'])
+
+
+def write(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+    return str(path)
+
+
+CSV_MANIFEST = """endpoint,input_image_url,room_type,design_style,num_images
+generate_designs_for_room,https://example.com/a.jpg,livingroom,modern,2
+remodel_kitchen,https://example.com/k.jpg,,modern,
+unknown_endpoint,,,,
+remodel_bathroom,https://example.com/b.jpg,,rustic,many
+"""
+
+
+class TestManifest:
+    """Test manifest parsing helpers."""
+
+    def test_csv_rows(self):
+        rows = list(read_manifest(io.StringIO(CSV_MANIFEST), 'csv'))
+        assert len(rows) == 4
+        assert rows[1] == {'endpoint': 'remodel_kitchen', 'input_image_url': 'https://example.com/k.jpg', 'design_style': 'modern'}
+
+    def test_invalid_jsonl_row(self):
+        rows = list(read_manifest(io.StringIO('{"endpoint": "upscale_image"}\nnot json\n\n[1]\n'), 'jsonl'))
+        assert rows[0] == {'endpoint': 'upscale_image'}
+        assert '__error__' in rows[1] and '__error__' in rows[2]
+        assert len(rows) == 3
+
+    def test_count_rows(self, tmp_path):
+        assert count_rows(write(tmp_path / 'm.csv', CSV_MANIFEST), 'csv') == 4
+        assert count_rows(write(tmp_path / 'm.jsonl', '{}\n{}'), 'jsonl') == 2
+
+    def test_coerce_params(self):
+        client = Decor8AI(api_key="test-key")
+        params = coerce_params(client.generate_designs_for_room, {'num_images': '3', 'seed': '42', 'room_type': '7'})
+        assert params == {'num_images': 3, 'seed': 42, 'room_type': '7'}
+        with pytest.raises(ValueError, match="num_images"):
+            coerce_params(client.remodel_kitchen, {'num_images': 'many'})
+
+
+class TestBatchCommand:
+    """Test decor8ai batch end to end."""
+
+    def run(self, server, *args):
+        return main(['batch', *args, '--base-url', server.url, '--quiet'])
+
+    def test_csv_batch(self, server, tmp_path):
+        """Test that every row is recorded, with failures captured per row."""
+        output = tmp_path / 'results.jsonl'
+        code = self.run(server, write(tmp_path / 'm.csv', CSV_MANIFEST), '-o', str(output), '-c', '2')
+
+        results = read_results(output)
+        assert code == 1
+        assert [record['ok'] for record in results] == [True, True, False, False]
+        assert len(results[0]['response']['info']['images']) == 2
+        assert results[2]['error'] == 'ValueError'
+        assert 'num_images' in results[3]['message']
+
+    def test_existing_output_requires_resume(self, server, tmp_path):
+        output = write(tmp_path / 'results.jsonl', '{"row": 0, "ok": true}\n')
+        assert self.run(server, write(tmp_path / 'm.csv', CSV_MANIFEST), '-o', output) == 2
+
+    def test_resume(self, server, tmp_path):
+        """Test that --resume skips successful rows and drops a partial last line."""
+        manifest = write(tmp_path / 'm.jsonl', ''.join(
+            json.dumps({'input_image_url': f'https://example.com/{i}.jpg', 'design_style': 'modern'}) + '\n'
+            for i in range(5)
+        ))
+        output = write(
+            tmp_path / 'results.jsonl',
+            '{"row": 0, "ok": true}\n{"row": 1, "ok": false}\n{"row": 3, "ok": true}\n{"row": 4, "o',
+        )
+        assert completed_rows(output) == bytearray([0b1001])
+
+        code = self.run(server, manifest, '-o', output, '-e', 'remodel_kitchen', '--resume')
+
+        assert code == 0
+        assert sorted(record['row'] for record in read_results(output) if 'response' in record) == [1, 2, 4]
+        assert server.stats()['requests'] == 3
+
+    def test_downloads(self, server, tmp_path):
+        """Test that URL results are downloaded and inline images decoded under DIR/<row>."""
+        image = tmp_path / 'room.jpg'
+        image.write_bytes(b'\xff\xd8\xff\xe0room')
+        manifest = write(tmp_path / 'm.jsonl', '\n'.join([
+            json.dumps({'endpoint': 'remodel_kitchen', 'input_image_url': 'https://example.com/k.jpg', 'design_style': 'modern'}),
+            json.dumps({'endpoint': 'upscale_image', 'input_image': str(image), 'scale_factor': 2}),
+        ]))
+        downloads = tmp_path / 'images'
+
+        assert self.run(server, manifest, '-o', str(tmp_path / 'out.jsonl'), '-d', str(downloads)) == 0
+
+        results = read_results(tmp_path / 'out.jsonl')
+        assert len(results[0]['files']) == 1
+        assert os.path.getsize(results[0]['files'][0]) == 512
+        saved = results[1]['response']['info']['upscaled_image']
+        assert os.path.dirname(saved['path']) == str(downloads / '1')
+        assert saved['size'] == 512
@@ -5,7 +5,7 @@ Run with: pytest test_client.py -v
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import os
 
 # Set a dummy API key for testing
@@ -34,6 +34,30 @@ class TestDecor8AIClient:
         client = Decor8AI(api_key="test-key", base_url="https://custom.api.com/")
         assert client.base_url == "https://custom.api.com"  # trailing slash stripped
 
+    def test_pool_configuration(self):
+        """Test that the session adapters use the configured pool sizes."""
+        client = Decor8AI(api_key="test-key", pool_connections=4, pool_maxsize=32)
+        adapter = client._session.get_adapter("https://api.decor8.ai")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the session."""
+        with patch('decor8ai.client.requests.Session.close') as mock_close:
+            with Decor8AI(api_key="test-key") as client:
+                assert isinstance(client, Decor8AI)
+            mock_close.assert_called_once()
+
+    def test_idle_connections_recycled(self):
+        """Test that pools idle past keepalive_timeout are recycled."""
+        client = Decor8AI(api_key="test-key", keepalive_timeout=5)
+        with patch.object(client._session, 'close') as mock_close:
+            client._get_session()
+            mock_close.assert_not_called()
+            client._last_used -= 10
+            assert client._get_session() is client._session
+            mock_close.assert_called_once()
+
     def test_init_without_api_key_raises(self):
         """Test that missing API key raises ValueError."""
         with patch.dict(os.environ, {}, clear=True):
@@ -61,7 +85,7 @@ class TestGenerateDesignsForRoom:
             }
         }
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_basic_call(self, mock_post, client, mock_response):
         """Test basic generate_designs_for_room call."""
         mock_post.return_value.json.return_value = mock_response
@@ -80,7 +104,7 @@ class TestGenerateDesignsForRoom:
         assert call_kwargs[1]['json']['design_style'] == "modern"
         assert call_kwargs[1]['json']['num_images'] == 1
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_with_all_optional_params(self, mock_post, client, mock_response):
         """Test with all optional parameters."""
         mock_post.return_value.json.return_value = mock_response
@@ -117,7 +141,7 @@ class TestChangeWallColor:
     def client(self):
         return Decor8AI(api_key="test-key")
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_basic_call(self, mock_post, client):
         """Test basic wall color change."""
         mock_response = {"error": "", "info": {"images": [{"url": "https://example.com/result.jpg"}]}}
@@ -140,7 +164,7 @@ class TestChangeKitchenCabinetsColor:
     def client(self):
         return Decor8AI(api_key="test-key")
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_basic_call(self, mock_post, client):
         """Test basic cabinet color change."""
         mock_response = {"error": "", "info": {"images": [{"url": "https://example.com/result.jpg"}]}}
@@ -163,7 +187,7 @@ class TestRemodelKitchen:
     def client(self):
         return Decor8AI(api_key="test-key")
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_basic_call(self, mock_post, client):
         """Test basic kitchen remodel."""
         mock_response = {"error": "", "info": {"images": [{"url": "https://example.com/result.jpg"}]}}
@@ -178,7 +202,7 @@ class TestRemodelKitchen:
         assert "/remodel_kitchen" in call_kwargs[0][0]
         assert call_kwargs[1]['json']['design_style'] == "modern"
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_with_options(self, mock_post, client):
         """Test kitchen remodel with options."""
         mock_response = {"error": "", "info": {"images": []}}
@@ -203,7 +227,7 @@ class TestRemodelBathroom:
     def client(self):
         return Decor8AI(api_key="test-key")
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_basic_call(self, mock_post, client):
         """Test basic bathroom remodel."""
         mock_response = {"error": "", "info": {"images": []}}
@@ -225,7 +249,7 @@ class TestGenerateLandscapingDesigns:
     def client(self):
         return Decor8AI(api_key="test-key")
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_basic_call(self, mock_post, client):
         """Test basic landscaping design."""
         mock_response = {"error": "", "info": {"images": []}}
@@ -251,7 +275,7 @@ class TestSketchTo3DRender:
     def client(self):
         return Decor8AI(api_key="test-key")
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_basic_call(self, mock_post, client):
         """Test basic sketch to 3D render."""
         mock_response = {"error": "", "info": {"images": []}}
@@ -265,7 +289,7 @@ class TestSketchTo3DRender:
         call_kwargs = mock_post.call_args
         assert "/sketch_to_3d_render" in call_kwargs[0][0]
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_with_render_type(self, mock_post, client):
         """Test with render type option."""
         mock_response = {"error": "", "info": {"images": []}}
@@ -288,7 +312,7 @@ class TestReplaceSkyBehindHouse:
     def client(self):
         return Decor8AI(api_key="test-key")
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_basic_call(self, mock_post, client):
         """Test basic sky replacement."""
         mock_response = {"error": "", "info": {"images": []}}
@@ -311,7 +335,7 @@ class TestRemoveObjectsFromRoom:
     def client(self):
         return Decor8AI(api_key="test-key")
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_basic_call(self, mock_post, client):
         """Test basic object removal."""
         mock_response = {"error": "", "info": {"images": []}}
@@ -324,7 +348,7 @@ class TestRemoveObjectsFromRoom:
         call_kwargs = mock_post.call_args
         assert "/remove_objects_from_room" in call_kwargs[0][0]
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_with_mask(self, mock_post, client):
         """Test object removal with mask."""
         mock_response = {"error": "", "info": {"images": []}}
@@ -375,7 +399,7 @@ class TestConstants:
 class TestModuleLevelFunctions:
     """Test backward-compatible module-level functions."""
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_change_wall_color_function(self, mock_post):
         """Test module-level change_wall_color function."""
         from decor8ai import change_wall_color
@@ -387,7 +411,7 @@ class TestModuleLevelFunctions:
 
         assert mock_post.called
 
-    @patch('decor8ai.client.requests.post')
+    @patch('decor8ai.client.requests.Session.post')
     def test_remodel_kitchen_function(self, mock_post):
         """Test module-level remodel_kitchen function."""
         from decor8ai import remodel_kitchen
@@ -398,3 +422,13 @@ class TestModuleLevelFunctions:
         remodel_kitchen("https://example.com/kitchen.jpg", "modern")
 
         assert mock_post.called
+
+    def test_default_client_is_shared(self):
+        """Test that module-level functions share one pooled client."""
+        from decor8ai.client import _get_default_client, close_default_client
+
+        close_default_client()
+        client = _get_default_client()
+        assert _get_default_client() is client
+        close_default_client()
+        assert _get_default_client() is not client
@@ -0,0 +1,95 @@
+"""Unit tests for data-URL encoding of local images.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_dataurl.py -v
+"""
+
+import base64
+import io
+import os
+from unittest.mock import MagicMock, patch
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import DataURLEncoder, Decor8AI
+from decor8ai.dataurl import encode_data_url, is_remote, sniff_mime_type
+
+
+JPEG = b'\xff\xd8\xff\xe0' + b'jpeg-body' * 10
+PNG = b'\x89PNG\r\n\x1a\n' + b'png-body'
+
+
+def make_response(body):
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = body
+    return response
+
+
+class TestEncoding:
+    """Test the encoding helpers."""
+
+    def test_encode_data_url(self):
+        assert encode_data_url(PNG) == "data:image/png;base64," + base64.b64encode(PNG).decode()
+        assert sniff_mime_type(JPEG) == 'image/jpeg'
+        assert sniff_mime_type(b'RIFF\0\0\0\0WEBPVP8 ') == 'image/webp'
+
+    def test_is_remote(self):
+        assert is_remote("https://example.com/a.jpg")
+        assert is_remote("data:image/png;base64,AAAA")
+        assert not is_remote("photos/a.jpg")
+        assert not is_remote(b"https://example.com/a.jpg")
+
+    def test_memoized_by_content(self, tmp_path):
+        """Test that the same content is encoded once, whatever form it is passed in."""
+        path = tmp_path / 'room.jpg'
+        path.write_bytes(JPEG)
+        transform = MagicMock(side_effect=lambda data: data)
+        encoder = DataURLEncoder(transform=transform)
+
+        urls = {encoder.encode(str(path)), encoder.encode(path), encoder.encode(JPEG),
+                encoder.encode(io.BytesIO(JPEG)), encoder.encode(memoryview(JPEG))}
+
+        assert urls == {encode_data_url(JPEG)}
+        assert transform.call_count == 1
+        assert encoder.stats()['hits'] == 4
+
+    def test_memo_bounded(self):
+        """Test that least recently used entries are evicted past max_bytes."""
+        encoder = DataURLEncoder(max_bytes=len(encode_data_url(JPEG)) + 10)
+        encoder.encode(JPEG)
+        encoder.encode(PNG)
+        stats = encoder.stats()
+        assert stats['entries'] == 1
+        assert stats['bytes'] <= encoder.max_bytes
+
+
+class TestClientDataURLs:
+    """Test local images passed to JSON endpoints."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_local_path_sent_as_data_url(self, mock_post, tmp_path):
+        """Test that a local path in input_image_url and mask_image_url is sent inline."""
+        mock_post.return_value = make_response({"error": ""})
+        path = tmp_path / 'room.jpg'
+        path.write_bytes(JPEG)
+        client = Decor8AI(api_key="test-key")
+
+        client.remove_objects_from_room(str(path), mask_image_url=PNG)
+
+        payload = mock_post.call_args[1]['json']
+        assert payload['input_image_url'] == encode_data_url(JPEG)
+        assert payload['mask_image_url'] == encode_data_url(PNG)
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_urls_untouched(self, mock_post):
+        mock_post.return_value = make_response({"error": ""})
+        client = Decor8AI(api_key="test-key")
+
+        client.generate_designs_for_room("https://example.com/r.jpg", "livingroom", "modern",
+                                         design_style_image_url="data:image/png;base64,AAAA")
+
+        payload = mock_post.call_args[1]['json']
+        assert payload['input_image_url'] == "https://example.com/r.jpg"
+        assert payload['design_style_image_url'] == "data:image/png;base64,AAAA"
+        assert client.data_urls.stats()['misses'] == 0
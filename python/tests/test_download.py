@@ -0,0 +1,123 @@
+"""Unit tests for downloading result images.
+
+These tests serve images from a local HTTP server instead of the API.
+Run with: pytest test_download.py -v
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, DownloadError
+from decor8ai.download import result_image_urls
+
+
+IMAGES = {f'/img{i}.jpg': bytes([i]) * (100_000 + i) for i in range(6)}
+
+
+class _ImageHandler(BaseHTTPRequestHandler):
+    """Serves IMAGES; /page.html is HTML and /short.jpg advertises more bytes than it sends."""
+
+    def do_GET(self):
+        if self.path == '/page.html':
+            body, content_type, length = b'<html></html>', 'text/html', None
+        elif self.path == '/short.jpg':
+            body, content_type, length = b'x' * 10, 'image/jpeg', 20
+        elif self.path in IMAGES:
+            body, content_type, length = IMAGES[self.path], 'image/jpeg', None
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(length or len(body)))
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def base_url():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _ImageHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client():
+    with Decor8AI(api_key="test-key") as client:
+        yield client
+
+
+def make_response(base_url, paths):
+    return {"error": "", "info": {"images": [{"uuid": f"u{i}", "url": base_url + p} for i, p in enumerate(paths)]}}
+
+
+class TestResultImageUrls:
+    """Test URL extraction from responses."""
+
+    def test_single_image_shape(self):
+        """Test that info.image responses are handled and named after the URL when there is no uuid."""
+        response = {"info": {"image": {"url": "https://cdn.example.com/a/8ec7.jpg"}}}
+        assert result_image_urls(response) == [("8ec7", "https://cdn.example.com/a/8ec7.jpg")]
+
+    def test_error_response(self):
+        """Test that responses without images yield nothing."""
+        assert result_image_urls({"error": "Failed", "message": "boom"}) == []
+
+
+class TestDownloadResults:
+    """Test Decor8AI.download_results()."""
+
+    def test_downloads_all_in_order(self, client, base_url, tmp_path):
+        """Test that every image is written under its uuid, in response order."""
+        response = make_response(base_url, list(IMAGES))
+
+        paths = client.download_results(response, str(tmp_path / "out"), concurrency=4)
+
+        assert paths == [str(tmp_path / "out" / f"u{i}.jpg") for i in range(len(IMAGES))]
+        for path, expected in zip(paths, IMAGES.values()):
+            with open(path, 'rb') as f:
+                assert f.read() == expected
+        assert sorted(os.listdir(tmp_path / "out")) == sorted(os.path.basename(p) for p in paths)
+
+    def test_multiple_responses(self, client, base_url, tmp_path):
+        """Test that a list of responses (e.g. from batch()) is downloaded together."""
+        responses = [make_response(base_url, ['/img0.jpg']), {"error": "Failed"}, make_response(base_url, ['/img1.jpg'])]
+        assert len(client.download_results(responses, str(tmp_path))) == 2
+
+    def test_verify_content_type(self, client, base_url, tmp_path):
+        """Test that a non-image response fails verification and leaves no file."""
+        response = make_response(base_url, ['/img0.jpg', '/page.html'])
+        with pytest.raises(DownloadError, match="Content-Type"):
+            client.download_results(response, str(tmp_path))
+        assert os.listdir(tmp_path) == ['u0.jpg']
+
+    def test_truncated_body_not_renamed(self, client, base_url, tmp_path):
+        """Test that a short read never appears under the final name."""
+        response = make_response(base_url, ['/short.jpg'])
+        with pytest.raises((DownloadError, requests.RequestException)):
+            client.download_results(response, str(tmp_path))
+        assert os.listdir(tmp_path) == []
+
+    def test_http_error(self, client, base_url, tmp_path):
+        """Test that HTTP errors are raised."""
+        with pytest.raises(requests.HTTPError):
+            client.download_results(make_response(base_url, ['/missing.jpg']), str(tmp_path))
+
+    def test_invalid_concurrency(self, client, tmp_path):
+        """Test that concurrency must be positive."""
+        with pytest.raises(ValueError):
+            client.download_results({"info": {}}, str(tmp_path), concurrency=0)
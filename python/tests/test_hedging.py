@@ -0,0 +1,235 @@
+"""Unit tests for hedged requests.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_hedging.py -v
+"""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, HedgingPolicy
+from decor8ai.hedging import HedgeCancelled, LatencyTracker, hedged_call
+
+
+class TestHedgingPolicy:
+    """Test delay selection and the in-flight cap."""
+
+    def test_percentile(self):
+        """Test the percentile over the sliding window."""
+        tracker = LatencyTracker(window=100)
+        for i in range(1, 101):
+            tracker.record(i / 100)
+        assert tracker.percentile(50) == pytest.approx(0.5, abs=0.02)
+        assert tracker.percentile(95) == pytest.approx(0.95, abs=0.01)
+
+    def test_delay_needs_samples(self):
+        """Test that endpoints are not hedged until enough latencies are recorded."""
+        policy = HedgingPolicy(min_samples=3)
+        policy.record('generate_designs_for_room', 1.0)
+        assert policy.delay('generate_designs_for_room') is None
+        policy.record('generate_designs_for_room', 2.0)
+        policy.record('generate_designs_for_room', 3.0)
+        assert policy.delay('generate_designs_for_room') == 3.0
+
+    def test_delay_bounds(self):
+        """Test initial_delay and the min/max clamps."""
+        policy = HedgingPolicy(initial_delay=10.0, max_delay=2.0, min_delay=0.5)
+        assert policy.delay('generate_designs_for_room') == 2.0
+        policy = HedgingPolicy(min_samples=1, min_delay=0.5)
+        policy.record('generate_designs_for_room', 0.1)
+        assert policy.delay('generate_designs_for_room') == 0.5
+
+    def test_applies(self):
+        """Test that only seeded requests to hedged endpoints qualify."""
+        policy = HedgingPolicy()
+        assert policy.applies('generate_designs_for_room', {'seed': 1})
+        assert not policy.applies('generate_designs_for_room', {})
+        assert not policy.applies('remodel_kitchen', {'seed': 1})
+
+    def test_cap(self):
+        """Test that duplicates beyond max_extra_in_flight are refused."""
+        policy = HedgingPolicy(max_extra_in_flight=1)
+        assert policy.try_acquire()
+        assert not policy.try_acquire()
+        policy.release()
+        assert policy.try_acquire()
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=0)
+        with pytest.raises(ValueError):
+            HedgingPolicy(max_extra_in_flight=-1)
+        with pytest.raises(ValueError):
+            HedgingPolicy(max_workers=-1)
+
+
+class TestHedgedCall:
+    """Test the race between the primary and the duplicate."""
+
+    def test_fast_primary_not_hedged(self):
+        """Test that a request finishing before the delay is not duplicated."""
+        policy = HedgingPolicy(initial_delay=1.0)
+        calls = []
+        assert hedged_call(policy, 'e', lambda event: calls.append(1) or "ok") == "ok"
+        assert len(calls) == 1 and policy.hedged == 0
+
+    def test_slow_primary_hedged_and_cancelled(self):
+        """Test that the duplicate wins over a stalled primary and the primary is signalled."""
+        policy = HedgingPolicy(initial_delay=0.05)
+        events = []
+
+        def request(event):
+            events.append(event)
+            if len(events) == 1:
+                event.wait(5)
+                raise HedgeCancelled()
+            return "hedge"
+
+        started = time.monotonic()
+        assert hedged_call(policy, 'e', request) == "hedge"
+        assert time.monotonic() - started < 1
+        assert events[0].is_set()
+        assert policy.hedged == 1 and policy.hedge_wins == 1
+
+    def test_primary_failure_falls_back_to_hedge(self):
+        """Test that a failing request does not hide a successful duplicate."""
+        policy = HedgingPolicy(initial_delay=0.01)
+        gate = threading.Event()
+
+        def request(event):
+            if not gate.is_set():
+                gate.set()
+                time.sleep(0.1)
+                raise ConnectionError("primary failed")
+            time.sleep(0.2)
+            return "hedge"
+
+        assert hedged_call(policy, 'e', request) == "hedge"
+
+    def test_primary_error_response_falls_back_to_hedge(self):
+        """Test that a response holding an error counts as a failure, not a win."""
+        policy = HedgingPolicy(initial_delay=0.01)
+        calls = []
+
+        def request(event):
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.1)
+                return {"error": "upstream failed"}
+            time.sleep(0.2)
+            return {"error": "", "which": "hedge"}
+
+        assert hedged_call(policy, 'e', request)['which'] == "hedge"
+        assert policy.hedge_wins == 1
+
+    def test_hedge_error_response_does_not_win(self):
+        """Test that a duplicate returning an error does not beat a slower successful primary."""
+        policy = HedgingPolicy(initial_delay=0.01)
+        calls = []
+
+        def request(event):
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                return {"error": "", "which": "primary"}
+            return {"error": "upstream failed"}
+
+        assert hedged_call(policy, 'e', request)['which'] == "primary"
+        assert policy.hedged == 1 and policy.hedge_wins == 0
+
+    def test_returns_when_duplicate_wins(self):
+        """Test that the call returns in about the duplicate's time, not the stalled primary's."""
+        policy = HedgingPolicy(initial_delay=0.05)
+        calls = []
+
+        def request(event):
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(2.0)  # a blocking read that the cancel event cannot interrupt
+                return {"error": "", "which": "primary"}
+            time.sleep(0.3)
+            return {"error": "", "which": "hedge"}
+
+        started = time.monotonic()
+        assert hedged_call(policy, 'e', request)['which'] == "hedge"
+        assert time.monotonic() - started < 1.0
+        assert policy.hedge_wins == 1
+
+    def test_busy_pool_runs_inline(self):
+        """Test that calls beyond max_workers run in the calling thread without hedging."""
+        policy = HedgingPolicy(initial_delay=0.0, max_workers=0)
+        threads = []
+        hedged_call(policy, 'e', lambda event: threads.append(threading.current_thread()))
+        assert threads == [threading.current_thread()]
+        assert policy.hedged == 0
+
+    def test_both_fail_raises_primary_error(self):
+        """Test that the primary's exception is raised when both requests fail."""
+        policy = HedgingPolicy(initial_delay=0.01)
+        count = []
+
+        def request(event):
+            count.append(1)
+            number = len(count)
+            time.sleep(0.05)
+            raise ValueError(f"failure {number}")
+
+        with pytest.raises(ValueError, match="failure 1"):
+            hedged_call(policy, 'e', request)
+
+    def test_cap_reached_waits_for_primary(self):
+        """Test that no duplicate is sent when the cap is reached."""
+        policy = HedgingPolicy(initial_delay=0.01, max_extra_in_flight=0)
+        calls = []
+
+        def request(event):
+            calls.append(1)
+            time.sleep(0.05)
+            return "primary"
+
+        assert hedged_call(policy, 'e', request) == "primary"
+        assert len(calls) == 1
+
+
+class TestClientHedging:
+    """Test hedging in the client request path."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_seeded_request_hedged(self, mock_post):
+        """Test that a slow seeded request is duplicated and the faster response returned."""
+        responses = iter([(0.5, {"error": "", "which": "primary"}), (0.0, {"error": "", "which": "hedge"})])
+        lock = threading.Lock()
+
+        def post(url, **kwargs):
+            with lock:
+                delay, body = next(responses)
+            time.sleep(delay)
+            response = MagicMock(status_code=200, headers={})
+            response.json.return_value = body
+            return response
+
+        mock_post.side_effect = post
+        client = Decor8AI(api_key="test-key", hedging=HedgingPolicy(initial_delay=0.05))
+
+        result = client.generate_designs_for_room("https://example.com/room.jpg", "livingroom", "modern", seed=5)
+
+        assert result['which'] == "hedge"
+        assert mock_post.call_count == 2
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_unseeded_request_not_hedged(self, mock_post):
+        """Test that unseeded requests are never duplicated."""
+        mock_post.return_value = MagicMock(status_code=200, headers={})
+        mock_post.return_value.json.return_value = {"error": ""}
+        client = Decor8AI(api_key="test-key", hedging=HedgingPolicy(initial_delay=0.0))
+
+        client.generate_designs_for_room("https://example.com/room.jpg", "livingroom", "modern")
+
+        assert mock_post.call_count == 1
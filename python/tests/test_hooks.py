@@ -0,0 +1,149 @@
+"""Unit tests for request lifecycle hooks.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_hooks.py -v
+"""
+
+import asyncio
+import datetime
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, Hooks, RetryPolicy
+
+
+BODY = b'{"error": "", "info": {"images": []}}'
+
+
+def make_response(status_code=200, body=BODY, elapsed=0.0):
+    response = MagicMock(status_code=status_code, headers={}, content=body)
+    response.elapsed = datetime.timedelta(seconds=elapsed)
+    response.json.return_value = json.loads(body)
+    return response
+
+
+def recorder():
+    events = []
+    hooks = Hooks(
+        on_request_start=lambda t: events.append(('start', t.attempt)),
+        on_response=lambda t: events.append(('response', t)),
+        on_retry=lambda t: events.append(('retry', t.attempt, t.status_code, t.retry_delay)),
+        on_error=lambda t: events.append(('error', t.error)),
+    )
+    return hooks, events
+
+
+class TestHooks:
+    """Test hook registration."""
+
+    def test_add_remove_and_bool(self):
+        hooks = Hooks()
+        assert not hooks
+        callback = hooks.on('on_response')(lambda trace: None)
+        assert hooks
+        hooks.remove('on_response', callback)
+        assert not hooks
+
+    def test_unknown_event(self):
+        with pytest.raises(ValueError, match="Unknown event"):
+            Hooks().add('on_nothing', print)
+
+
+class TestClientHooks:
+    """Test events fired by the client request path."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_response_trace(self, mock_post):
+        """Test timings, sizes and status reported for a successful call."""
+        mock_post.return_value = make_response()
+        hooks, events = recorder()
+        client = Decor8AI(api_key="test-key", hooks=hooks)
+
+        client.generate_designs_for_room("https://example.com/r.jpg", "livingroom", "modern")
+
+        assert [e[0] for e in events] == ['start', 'response']
+        trace = events[1][1]
+        assert trace.endpoint == 'generate_designs_for_room'
+        assert trace.status_code == 200
+        assert trace.response_bytes == len(BODY)
+        assert trace.request_bytes == len(json.dumps(mock_post.call_args[1]['json']))
+        assert set(trace.timings) == {'queue', 'headers', 'body', 'decode', 'total'}
+        assert all(value >= 0 for value in trace.timings.values())
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_retry_then_response(self, mock_post):
+        """Test that a retried 503 fires on_retry before the final on_response."""
+        mock_post.side_effect = [make_response(503), make_response()]
+        hooks, events = recorder()
+        client = Decor8AI(api_key="test-key", hooks=hooks, retry_policy=RetryPolicy(backoff_base=0))
+
+        client.remodel_bathroom("https://example.com/b.jpg", "modern")
+
+        assert [e[0] for e in events] == ['start', 'retry', 'start', 'response']
+        assert events[1][1:3] == (1, 503)
+        assert events[2] == ('start', 2)
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_error(self, mock_post):
+        """Test that an exception leaving the call fires on_error."""
+        mock_post.side_effect = requests.ConnectionError("refused")
+        hooks, events = recorder()
+        client = Decor8AI(api_key="test-key", hooks=hooks, retry_policy=RetryPolicy(max_attempts=2, backoff_base=0))
+
+        with pytest.raises(requests.ConnectionError):
+            client.remodel_bathroom("https://example.com/b.jpg", "modern")
+
+        assert [e[0] for e in events] == ['start', 'retry', 'start', 'error']
+        assert isinstance(events[-1][1], requests.ConnectionError)
+
+    def test_async_trace(self):
+        httpx = pytest.importorskip("httpx")
+        from decor8ai import AsyncDecor8AI
+
+        def handler(request):
+            return httpx.Response(200, content=BODY)
+
+        hooks, events = recorder()
+
+        async def run():
+            client = AsyncDecor8AI(api_key="test-key", hooks=hooks)
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                return await client.upscale_image(b'image-bytes')
+
+        assert asyncio.run(run())['error'] == ""
+        trace = events[-1][1]
+        assert trace.status_code == 200
+        assert trace.response_bytes == len(BODY)
+        assert trace.request_bytes > len(b'image-bytes')
+
+    def test_async_cancelled_request_ends_trace(self):
+        """Test that a cancelled request fires on_error, so every start has a matching end."""
+        httpx = pytest.importorskip("httpx")
+        from decor8ai import AsyncDecor8AI
+
+        async def handler(request):
+            await asyncio.sleep(10)
+
+        hooks, events = recorder()
+
+        async def run():
+            client = AsyncDecor8AI(api_key="test-key", hooks=hooks)
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                task = asyncio.ensure_future(client.remodel_bathroom("https://example.com/b.jpg", "modern"))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(run())
+        assert [e[0] for e in events] == ['start', 'error']
+        assert isinstance(events[-1][1], asyncio.CancelledError)
@@ -0,0 +1,57 @@
+"""Unit tests for the lazy loading of the decor8ai package.
+
+Each test starts a fresh interpreter so earlier imports do not interfere.
+Run with: pytest test_imports.py -v
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+import decor8ai
+
+
+def loaded_modules(statement):
+    """Run statement in a fresh interpreter and return the modules it left imported."""
+    output = subprocess.run(
+        [sys.executable, '-c', f"{statement}\nimport sys\nprint(' '.join(sys.modules))"],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports:
+    """Test that heavy dependencies load only when used."""
+
+    def test_import_package(self):
+        modules = loaded_modules('import decor8ai')
+        for name in ('requests', 'httpx', 'PIL', 'asyncio', 'decor8ai.client'):
+            assert name not in modules
+
+    def test_import_client_class(self):
+        """Test that requests is imported with the first client, not with the class."""
+        modules = loaded_modules('from decor8ai import Decor8AI')
+        assert 'decor8ai.client' in modules
+        for name in ('requests', 'PIL', 'asyncio', 'http.server'):
+            assert name not in modules
+        assert 'requests' in loaded_modules("from decor8ai import Decor8AI; Decor8AI(api_key='k')")
+
+    def test_exports_resolve(self):
+        for name in decor8ai.__all__:
+            assert getattr(decor8ai, name) is not None
+        assert set(decor8ai.__all__) <= set(dir(decor8ai))
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            decor8ai.NotAThing
+
+    def test_client_requests_attribute(self):
+        """Test that decor8ai.client.requests still resolves for patching."""
+        import requests
+        import decor8ai.client
+        assert decor8ai.client.requests is requests
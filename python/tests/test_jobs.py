@@ -0,0 +1,160 @@
+"""Unit tests for the SQLite-journaled JobRunner.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_jobs.py -v
+"""
+
+import os
+import signal
+import sqlite3
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, JobJournal, JobRunner, RetryPolicy
+
+
+ENDPOINT = 'generate_designs_for_room'
+OK = {"error": "", "info": {"images": [{"uuid": "a1", "url": "https://cdn.example.com/a1.jpg"}]}}
+
+
+def make_response(body, status_code=200):
+    response = MagicMock(status_code=status_code, headers={})
+    response.json.return_value = body
+    return response
+
+
+def items(n):
+    return [
+        {'input_image_url': f"https://example.com/{i}.jpg", 'room_type': 'livingroom', 'design_style': 'modern'}
+        for i in range(n)
+    ]
+
+
+class TestJobJournal:
+    """Test the journal itself."""
+
+    def test_wal_and_idempotent_add(self, tmp_path):
+        """Test that the journal uses WAL and re-adding the same items is a no-op."""
+        path = str(tmp_path / 'job.db')
+        journal = JobJournal(path, ENDPOINT)
+        assert journal.add(items(5)) == 5
+        assert journal.add(items(7)) == 2
+        assert journal.counts()['pending'] == 7
+        mode = sqlite3.connect(path).execute('PRAGMA journal_mode').fetchone()[0]
+        assert mode == 'wal'
+
+    def test_recover_in_flight(self, tmp_path):
+        """Test that items left in flight by a crashed process become pending again."""
+        path = str(tmp_path / 'job.db')
+        journal = JobJournal(path, ENDPOINT)
+        journal.add(items(3))
+        journal.start(1)
+        journal.close()
+
+        journal = JobJournal(path, ENDPOINT)
+        assert journal.counts()['in_flight'] == 1
+        assert journal.recover() == 1
+        assert journal.counts()['pending'] == 3
+        assert journal.attempts(1) == 1
+
+    def test_endpoint_mismatch(self, tmp_path):
+        path = str(tmp_path / 'job.db')
+        JobJournal(path, ENDPOINT).close()
+        with pytest.raises(ValueError, match="belongs to endpoint"):
+            JobJournal(path, 'upscale_image')
+
+
+class TestJobRunner:
+    """Test running, resuming and draining jobs."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_run_records_responses(self, mock_post, tmp_path):
+        """Test that every item is run once and its response journaled."""
+        mock_post.return_value = make_response(OK)
+        runner = JobRunner(Decor8AI(api_key="test-key"), str(tmp_path / 'job.db'), ENDPOINT, concurrency=4)
+        runner.add(items(10))
+
+        counts = runner.run()
+
+        assert counts == {'pending': 0, 'in_flight': 0, 'done': 10, 'failed': 0}
+        assert mock_post.call_count == 10
+        results = list(runner.journal.results())
+        assert [r[0] for r in results] == list(range(10))
+        assert results[3][1]['input_image_url'] == "https://example.com/3.jpg"
+        assert results[3][2] == OK
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_resume_skips_done(self, mock_post, tmp_path):
+        """Test that a second run only processes what the first one left."""
+        mock_post.return_value = make_response(OK)
+        path = str(tmp_path / 'job.db')
+        journal = JobJournal(path, ENDPOINT)
+        journal.add(items(6))
+        for item_id in (0, 1, 2):
+            journal.start(item_id)
+            journal.finish(item_id, 'done', response=OK)
+        journal.start(3)  # crashed while in flight
+        journal.close()
+
+        runner = JobRunner(Decor8AI(api_key="test-key"), path, ENDPOINT)
+        runner.add(items(6))
+        counts = runner.run()
+
+        assert counts['done'] == 6
+        sent = [call[1]['json']['input_image_url'] for call in mock_post.call_args_list]
+        assert sorted(sent) == [f"https://example.com/{i}.jpg" for i in (3, 4, 5)]
+        assert runner.journal.attempts(3) == 2
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_failures_retried_up_to_max_attempts(self, mock_post, tmp_path):
+        """Test that error responses are retried by the runner and then left failed."""
+        mock_post.return_value = make_response({"error": "InvalidInput", "message": "bad"})
+        client = Decor8AI(api_key="test-key", retry_policy=RetryPolicy(max_attempts=1))
+        runner = JobRunner(client, str(tmp_path / 'job.db'), ENDPOINT, max_attempts=3)
+        runner.add(items(2))
+
+        counts = runner.run()
+
+        assert counts['failed'] == 2
+        assert mock_post.call_count == 6
+        failed = list(runner.journal.results('failed'))
+        assert failed[0][3] == "InvalidInput: bad"
+
+    def test_drain_on_sigterm(self, tmp_path):
+        """Test that SIGTERM stops new work, finishes in-flight items and leaves the rest pending."""
+        started = threading.Event()
+        release = threading.Event()
+        client = MagicMock()
+
+        def call(**kwargs):
+            started.set()
+            release.wait(5)
+            return OK
+
+        client.generate_designs_for_room.side_effect = call
+        runner = JobRunner(client, str(tmp_path / 'job.db'), ENDPOINT, concurrency=2)
+        runner.add(items(20))
+
+        def terminate():
+            started.wait(5)
+            os.kill(os.getpid(), signal.SIGTERM)
+            release.set()
+
+        previous = signal.getsignal(signal.SIGTERM)
+        threading.Thread(target=terminate).start()
+        counts = runner.run()
+
+        assert runner.stopping
+        assert signal.getsignal(signal.SIGTERM) is previous
+        assert counts['in_flight'] == 0
+        assert 1 <= counts['done'] <= 4
+        assert counts['pending'] == 20 - counts['done']
+
+    def test_unknown_endpoint(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            JobRunner(MagicMock(), str(tmp_path / 'job.db'), 'nope')
@@ -0,0 +1,184 @@
+"""Unit tests for request metrics and latency histograms.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_metrics.py -v
+"""
+
+import asyncio
+import os
+import random
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, Hooks, Metrics, RetryPolicy
+from decor8ai.metrics import bucket_index, bucket_upper_bound
+
+
+def make_response(status_code=200, body=None):
+    response = MagicMock(status_code=status_code, headers={})
+    response.json.return_value = body or {"error": ""}
+    return response
+
+
+def observe(metrics, endpoint, seconds, status_code=200):
+    """Feed one completed attempt through the hooks."""
+    hooks = Hooks()
+    metrics.attach(hooks)
+    trace = hooks.start(endpoint, 1, None, 0.0)
+    trace.status_code = status_code
+    trace.timings['total'] = seconds
+    hooks.emit('on_response', trace)
+
+
+class TestHistogram:
+    """Test the log-linear buckets."""
+
+    def test_relative_error(self):
+        for value in (0.001, 0.0173, 0.5, 1.0, 7.3, 42.0, 600.0):
+            bound = bucket_upper_bound(bucket_index(value))
+            assert value <= bound <= value * 1.07
+
+    def test_clamped(self):
+        assert bucket_index(0) == 0
+        assert bucket_index(1e-9) == 0
+        assert bucket_index(1e9) == bucket_index(1e8)
+
+
+class TestMetrics:
+    """Test aggregation and output formats."""
+
+    def test_percentiles(self):
+        metrics = Metrics()
+        for value in range(1, 101):
+            observe(metrics, 'upscale_image', value / 10.0)
+        latency = metrics.snapshot()['upscale_image']['latency']
+        assert latency['count'] == 100
+        assert latency['p50'] == pytest.approx(5.0, rel=0.07)
+        assert latency['p90'] == pytest.approx(9.0, rel=0.07)
+        assert latency['p99'] == pytest.approx(9.9, rel=0.07)
+        assert latency['max'] == 10.0
+        assert latency['sum'] == pytest.approx(505.0)
+
+    def test_threads_merge(self):
+        """Test that shards written by many threads add up."""
+        metrics = Metrics()
+        hooks = Hooks()
+        metrics.attach(hooks)
+
+        def work():
+            for _ in range(500):
+                trace = hooks.start('remodel_kitchen', 1, None, 0.0)
+                trace.status_code = 200
+                trace.timings['total'] = random.random()
+                hooks.emit('on_response', trace)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = metrics.snapshot()['remodel_kitchen']
+        assert snapshot['requests'] == 4000
+        assert snapshot['latency']['count'] == 4000
+        assert snapshot['in_flight'] == 0
+
+    def test_exited_threads_are_folded(self):
+        """Test that shards of finished threads are retired without losing counts."""
+        metrics = Metrics()
+        for _ in range(2000):
+            thread = threading.Thread(target=observe, args=(metrics, 'upscale_image', 0.5))
+            thread.start()
+            thread.join()
+        observe(metrics, 'upscale_image', 2.0)
+
+        latency = metrics.snapshot()['upscale_image']['latency']
+        assert len(metrics._shards) <= 2
+        assert latency['count'] == 2001
+        assert latency['sum'] == pytest.approx(1002.0)
+        assert latency['max'] == 2.0
+
+    def test_prometheus(self):
+        metrics = Metrics()
+        observe(metrics, 'upscale_image', 0.25)
+        text = metrics.prometheus()
+        assert '# TYPE decor8ai_request_duration_seconds summary' in text
+        assert 'decor8ai_requests_total{endpoint="upscale_image"} 1' in text
+        assert 'decor8ai_request_duration_seconds{endpoint="upscale_image",quantile="0.99"}' in text
+        assert 'decor8ai_request_duration_seconds_count{endpoint="upscale_image"} 1' in text
+
+    def test_invalid_quantile(self):
+        with pytest.raises(ValueError):
+            Metrics(quantiles=[1.5])
+
+
+class TestClientMetrics:
+    """Test metrics recorded by the client request path."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_counts_retries_and_errors(self, mock_post):
+        """Test that a 503 followed by a connection error is counted per class."""
+        mock_post.side_effect = [make_response(503), requests.ConnectionError("refused"), make_response()]
+        metrics = Metrics()
+        client = Decor8AI(api_key="test-key", metrics=metrics, retry_policy=RetryPolicy(backoff_base=0))
+
+        client.remodel_bathroom("https://example.com/b.jpg", "modern")
+
+        snapshot = metrics.snapshot()['remodel_bathroom']
+        assert snapshot['requests'] == 3
+        assert snapshot['retries'] == 2
+        assert snapshot['errors'] == {'5xx': 1, 'ConnectionError': 1}
+        assert snapshot['in_flight'] == 0
+        assert snapshot['latency']['count'] == 2
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_in_flight_gauge(self, mock_post):
+        """Test that requests waiting on the API show as in flight."""
+        release = threading.Event()
+        metrics = Metrics()
+
+        def post(*args, **kwargs):
+            release.wait(5)
+            return make_response()
+
+        mock_post.side_effect = post
+        client = Decor8AI(api_key="test-key", metrics=metrics)
+        thread = threading.Thread(target=client.remodel_bathroom, args=("https://example.com/b.jpg", "modern"))
+        thread.start()
+        while not metrics.snapshot():
+            threading.Event().wait(0.01)
+        assert metrics.snapshot()['remodel_bathroom']['in_flight'] == 1
+        release.set()
+        thread.join()
+        assert metrics.snapshot()['remodel_bathroom']['in_flight'] == 0
+
+    def test_cancelled_async_request_leaves_no_in_flight(self):
+        """Test that a cancelled request is counted as finished (with an error)."""
+        httpx = pytest.importorskip("httpx")
+        from decor8ai import AsyncDecor8AI
+
+        async def handler(request):
+            await asyncio.sleep(10)
+
+        metrics = Metrics()
+
+        async def run():
+            client = AsyncDecor8AI(api_key="test-key", metrics=metrics)
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                task = asyncio.ensure_future(client.remodel_bathroom("https://example.com/b.jpg", "modern"))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(run())
+        snapshot = metrics.snapshot()['remodel_bathroom']
+        assert snapshot['in_flight'] == 0
+        assert snapshot['errors'] == {'CancelledError': 1}
@@ -0,0 +1,183 @@
+"""Unit tests for the streaming multipart encoder.
+
+Run with: pytest test_multipart.py -v
+"""
+
+import asyncio
+import email.parser
+import json
+import mmap
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, RetryPolicy
+from decor8ai.multipart import MultipartEncoder
+
+
+IMAGE = bytes(range(256)) * 1024  # 256 KiB, spans several chunks
+
+
+def parse_multipart(content_type, body):
+    """Parse a multipart body into {field name: payload bytes}."""
+    message = email.parser.BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return {part.get_param('name', header='content-disposition'): part.get_payload(decode=True)
+            for part in message.get_payload()}
+
+
+class TestMultipartEncoder:
+    """Test encoding from the supported sources."""
+
+    @pytest.fixture
+    def image_path(self, tmp_path):
+        path = tmp_path / "room.jpg"
+        path.write_bytes(IMAGE)
+        return path
+
+    @pytest.mark.parametrize("kind", ["bytes", "bytearray", "memoryview", "path", "pathlike", "file", "mmap"])
+    def test_sources(self, kind, image_path):
+        """Test that every source type encodes to the same well-formed body."""
+        file = open(image_path, 'rb')
+        try:
+            source = {
+                "bytes": IMAGE,
+                "bytearray": bytearray(IMAGE),
+                "memoryview": memoryview(IMAGE),
+                "path": str(image_path),
+                "pathlike": image_path,
+                "file": file,
+                "mmap": mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ),
+            }[kind]
+            encoder = MultipartEncoder({'scale_factor': 2}, {'input_image': ('input_image.jpg', source)})
+            body = encoder.read()
+            encoder.close()
+        finally:
+            file.close()
+
+        assert len(body) == encoder.content_length
+        parts = parse_multipart(encoder.content_type, body)
+        assert parts['scale_factor'] == b"2"
+        assert parts['input_image'] == IMAGE
+
+    def test_chunked_reads_and_reset(self, image_path):
+        """Test that reading in small chunks matches a full read, including after reset()."""
+        encoder = MultipartEncoder({'a': 'b'}, {'input_image': ('x.jpg', str(image_path))})
+        chunks = list(encoder)
+        assert max(len(c) for c in chunks) <= 64 * 1024
+        assert encoder.reset()
+        assert b"".join(chunks) == encoder.read()
+        encoder.close()
+
+    def test_file_object_keeps_start_position(self, image_path):
+        """Test that a file object is read from its current position and rewound there."""
+        with open(image_path, 'rb') as f:
+            f.seek(1024)
+            encoder = MultipartEncoder(files={'input_image': ('x.jpg', f)})
+            first = encoder.read()
+            assert encoder.reset()
+            assert encoder.read() == first
+            assert parse_multipart(encoder.content_type, first)['input_image'] == IMAGE[1024:]
+
+    def test_unseekable_stream(self):
+        """Test that pipes have unknown length and cannot be rewound."""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"pipe-bytes")
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as pipe:
+            encoder = MultipartEncoder(files={'input_image': ('x.jpg', pipe)})
+            assert encoder.content_length is None
+            with pytest.raises(TypeError):
+                len(encoder)
+            assert parse_multipart(encoder.content_type, encoder.read())['input_image'] == b"pipe-bytes"
+            assert not encoder.reset()
+
+    def test_async_chunks_read_off_the_event_loop(self, image_path):
+        """Test that aiter_chunks() reads files in worker threads, not on the loop's thread."""
+        encoder = MultipartEncoder({'a': 'b'}, {'input_image': ('x.jpg', str(image_path))})
+        readers = set()
+        read = encoder.read
+
+        def tracking_read(size=-1):
+            readers.add(threading.get_ident())
+            return read(size)
+
+        encoder.read = tracking_read
+
+        async def collect():
+            return b"".join([chunk async for chunk in encoder.aiter_chunks()]), threading.get_ident()
+
+        body, loop_thread = asyncio.run(collect())
+        encoder.close()
+
+        assert parse_multipart(encoder.content_type, body)['input_image'] == IMAGE
+        assert readers and loop_thread not in readers
+
+    def test_unsupported_source(self):
+        """Test that unsupported sources are rejected."""
+        with pytest.raises(TypeError):
+            MultipartEncoder(files={'input_image': ('x.jpg', 12345)})
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    """Records uploads and fails the first request with a 503."""
+
+    received = []
+    fail_first = False
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        type(self).received.append((self.headers['Content-Type'], body))
+        if type(self).fail_first and len(type(self).received) == 1:
+            self.send_response(503)
+            payload = b'{"error": "busy"}'
+        else:
+            self.send_response(200)
+            payload = json.dumps({"error": "", "info": {"upscaled_image": "abc"}}).encode()
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestStreamingUpload:
+    """Test uploads through requests against a local server."""
+
+    @pytest.fixture
+    def server(self):
+        _UploadHandler.received = []
+        httpd = ThreadingHTTPServer(('127.0.0.1', 0), _UploadHandler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield httpd
+        httpd.shutdown()
+        httpd.server_close()
+
+    def test_upload_from_path_with_retry(self, server, tmp_path):
+        """Test that a file upload is streamed with Content-Length and replayed on retry."""
+        path = tmp_path / "room.jpg"
+        path.write_bytes(IMAGE)
+        _UploadHandler.fail_first = True
+        client = Decor8AI(
+            api_key="test-key",
+            base_url=f"http://127.0.0.1:{server.server_port}",
+            retry_policy=RetryPolicy(backoff_base=0),
+        )
+
+        result = client.upscale_image(str(path), scale_factor=4)
+
+        assert result['info']['upscaled_image'] == "abc"
+        assert len(_UploadHandler.received) == 2
+        for content_type, body in _UploadHandler.received:
+            parts = parse_multipart(content_type, body)
+            assert parts['input_image'] == IMAGE
+            assert parts['scale_factor'] == b"4"
@@ -0,0 +1,185 @@
+"""Unit tests for multi-stage pipelines.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_pipeline.py -v
+"""
+
+import base64
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, Pipeline, Stage, StageError
+
+
+UPSCALED = b'upscaled-bytes'
+
+
+def make_response(body):
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = body
+    return response
+
+
+def fake_api(url, json=None, data=None, **kwargs):
+    """Answer like the API for the endpoints used by the tests."""
+    if url.endswith('/remove_objects_from_room'):
+        name = json['input_image_url'].rsplit('/', 1)[-1]
+        return make_response({"error": "", "info": {"image": {"url": f"https://cdn.example.com/empty-{name}"}}})
+    if url.endswith('/upscale_image'):
+        return make_response({"error": "", "info": {"upscaled_image": base64.b64encode(UPSCALED).decode()}})
+    if url.endswith('/generate_designs'):
+        return make_response({"error": "", "info": {"images": [{"uuid": "d1", "data": "ZGF0YQ=="}]}})
+    if url.endswith('/generate_designs_for_room'):
+        return make_response({"error": "", "info": {"images": [{"uuid": "d1", "url": "https://cdn.example.com/d1.jpg"}]}})
+    raise AssertionError(f"unexpected call to {url}")
+
+
+class TestPipeline:
+    """Test chaining, concurrency and failure handling."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_urls_passed_between_stages(self, mock_post):
+        """Test that a returned URL becomes the next stage's input_image_url."""
+        mock_post.side_effect = fake_api
+        pipeline = Pipeline(Decor8AI(api_key="test-key"), [
+            Stage('remove_objects_from_room'),
+            Stage('generate_designs_for_room', room_type='livingroom', design_style='modern'),
+        ])
+
+        results = sorted(pipeline.run([f"https://example.com/{i}.jpg" for i in range(5)]), key=lambda r: r.index)
+
+        assert [r.ok for r in results] == [True] * 5
+        assert len(results[2].responses) == 2
+        staged = [call[1]['json']['input_image_url'] for call in mock_post.call_args_list
+                  if call[0][0].endswith('/generate_designs_for_room')]
+        assert sorted(staged) == sorted(f"https://cdn.example.com/empty-{i}.jpg" for i in range(5))
+        assert all(call[1]['json']['design_style'] == 'modern' for call in mock_post.call_args_list
+                   if call[0][0].endswith('/generate_designs_for_room'))
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_image_data_uploaded_to_next_stage(self, mock_post):
+        """Test that inline image data is passed as bytes to an upload endpoint."""
+        uploads = []
+
+        def api(url, data=None, **kwargs):
+            uploads.append(data.read())
+            return fake_api(url, data=data, **kwargs)
+
+        mock_post.side_effect = api
+        pipeline = Pipeline(Decor8AI(api_key="test-key"), [
+            Stage('upscale_image', scale_factor=2),
+            Stage('generate_designs', room_type='familyroom', design_style='rustic'),
+        ])
+
+        [result] = list(pipeline.run([b'original']))
+
+        assert result.ok
+        assert b'original' in uploads[0]
+        assert UPSCALED in uploads[1] and b'rustic' in uploads[1]
+
+    def test_stages_overlap(self):
+        """Test that different items occupy different stages at the same time."""
+        active = {'a': 0, 'b': 0}
+        overlap = threading.Event()
+        lock = threading.Lock()
+
+        class Client:
+            def _step(self, name, value):
+                with lock:
+                    active[name] += 1
+                    if active['a'] and active['b']:
+                        overlap.set()
+                time.sleep(0.02)
+                with lock:
+                    active[name] -= 1
+                return {"error": "", "info": {"image": {"url": value + '+'}}}
+
+            def remove_objects_from_room(self, input_image_url, mask_image_url=None):
+                return self._step('a', input_image_url)
+
+            def replace_sky_behind_house(self, input_image_url, sky_type):
+                return self._step('b', input_image_url)
+
+        pipeline = Pipeline(Client(), [
+            Stage('remove_objects_from_room', workers=1),
+            Stage('replace_sky_behind_house', workers=1, sky_type='dusk'),
+        ])
+
+        results = list(pipeline.run(f"https://example.com/{i}.jpg" for i in range(6)))
+
+        assert len(results) == 6
+        assert overlap.is_set()
+        assert results[0].result['info']['image']['url'].endswith('.jpg++')
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_failure_recorded_and_others_continue(self, mock_post):
+        """Test that an error response stops only that item and names the stage."""
+        def api(url, json=None, **kwargs):
+            if url.endswith('/remove_objects_from_room') and json['input_image_url'].endswith('/bad.jpg'):
+                return make_response({"error": "InvalidInput", "message": "bad image"})
+            return fake_api(url, json=json, **kwargs)
+
+        mock_post.side_effect = api
+        pipeline = Pipeline(Decor8AI(api_key="test-key"), [
+            Stage('remove_objects_from_room'),
+            Stage('generate_designs_for_room', room_type='livingroom', design_style='modern'),
+        ])
+
+        results = {r.input: r for r in pipeline.run(["https://example.com/ok.jpg", "https://example.com/bad.jpg"])}
+
+        assert results["https://example.com/ok.jpg"].ok
+        bad = results["https://example.com/bad.jpg"]
+        assert bad.stage == 'remove_objects_from_room'
+        assert isinstance(bad.error, StageError)
+        assert bad.error.error == "InvalidInput"
+        assert bad.responses == []
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_inline_data_to_url_endpoint(self, mock_post):
+        """Test that inline image data reaches a URL-only endpoint as a data URL."""
+        def api(url, json=None, data=None, **kwargs):
+            if url.endswith('/remodel_bathroom'):
+                return make_response({"error": "", "info": {"images": [{"url": "https://cdn.example.com/b.jpg"}]}})
+            return fake_api(url, json=json, data=data, **kwargs)
+
+        mock_post.side_effect = api
+        pipeline = Pipeline(Decor8AI(api_key="test-key"), [
+            Stage('upscale_image'),
+            Stage('remodel_bathroom', design_style='modern'),
+        ])
+
+        [result] = list(pipeline.run([b'x']))
+
+        assert result.ok
+        sent = mock_post.call_args_list[-1][1]['json']['input_image_url']
+        assert sent == "data:image/jpeg;base64," + base64.b64encode(UPSCALED).decode()
+
+    def test_stage_without_image(self):
+        """Test that a response without images fails the item at that stage."""
+        class Client:
+            def remove_objects_from_room(self, input_image_url, mask_image_url=None):
+                return {"error": "", "info": {}}
+
+            def remodel_bathroom(self, input_image_url, design_style):
+                raise AssertionError("not reached")
+
+        pipeline = Pipeline(Client(), [Stage('remove_objects_from_room'), Stage('remodel_bathroom', design_style='modern')])
+        [result] = list(pipeline.run(["https://example.com/r.jpg"]))
+        assert result.stage == 'remove_objects_from_room'
+        assert result.error.error == 'NoImage'
+
+    def test_invalid_stages(self):
+        client = Decor8AI(api_key="test-key")
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            Stage('nope')
+        with pytest.raises(ValueError, match="at least one stage"):
+            Pipeline(client, [])
+        with pytest.raises(ValueError, match="takes no input image"):
+            Pipeline(client, [Stage('upscale_image'), Stage('generate_inspirational_designs')])
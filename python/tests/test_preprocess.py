@@ -0,0 +1,140 @@
+"""Unit tests for client-side image preprocessing.
+
+Requires Pillow (pip install decor8ai[images]); skipped otherwise.
+Run with: pytest test_preprocess.py -v
+"""
+
+import asyncio
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+Image = pytest.importorskip("PIL.Image")
+
+from decor8ai import Decor8AI, ImagePreprocessor
+
+
+def make_jpeg(size=(400, 300), orientation=None, noise=False):
+    image = Image.new('RGB', size, (200, 120, 40))
+    if noise:
+        image = Image.frombytes('RGB', size, os.urandom(size[0] * size[1] * 3))
+    exif = Image.Exif()
+    if orientation is not None:
+        exif[0x0112] = orientation
+    exif[0x010F] = "PhoneMaker"
+    buffer = io.BytesIO()
+    image.save(buffer, 'JPEG', quality=95, exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+def open_image(data):
+    return Image.open(io.BytesIO(data))
+
+
+class TestImagePreprocessor:
+    """Test orientation, stripping, resizing and the byte budget."""
+
+    def test_orients_and_strips_exif(self):
+        """Test that EXIF rotation is applied and no EXIF remains."""
+        out = ImagePreprocessor().process(make_jpeg((400, 300), orientation=6))
+        image = open_image(out)
+        assert image.size == (300, 400)
+        assert not image.info.get('exif')
+
+    def test_resizes_to_max_dimension(self):
+        out = ImagePreprocessor(max_dimension=100).process(make_jpeg((400, 300)))
+        assert open_image(out).size == (100, 75)
+
+    def test_meets_byte_budget(self):
+        """Test that noisy images are recompressed and then shrunk until they fit."""
+        original = make_jpeg((600, 600), noise=True)
+        out = ImagePreprocessor(max_dimension=None, max_bytes=50_000).process(original)
+        assert len(out) <= 50_000 < len(original)
+
+    def test_passthrough(self):
+        """Test that small images without EXIF are not recompressed."""
+        buffer = io.BytesIO()
+        Image.new('RGB', (64, 64)).save(buffer, 'PNG')
+        assert ImagePreprocessor().process(buffer.getvalue()) == buffer.getvalue()
+
+    def test_metadata_other_than_exif_not_passed_through(self):
+        """Test that XMP, ICC profiles and comments are stripped even without EXIF."""
+        for extra in ({'xmp': b'<x:xmpmeta/>'}, {'icc_profile': b'\0' * 128}, {'comment': b'taken at home'}):
+            buffer = io.BytesIO()
+            Image.new('RGB', (64, 64)).save(buffer, 'JPEG', **extra)
+            out = ImagePreprocessor().process(buffer.getvalue())
+            assert out != buffer.getvalue()
+            assert not set(open_image(out).info) & {'xmp', 'icc_profile', 'comment'}
+
+    def test_transparency_flattened(self):
+        buffer = io.BytesIO()
+        Image.new('RGBA', (3000, 10), (0, 0, 0, 0)).save(buffer, 'PNG')
+        image = open_image(ImagePreprocessor().process(buffer.getvalue()))
+        assert image.format == 'JPEG'
+        assert image.getpixel((0, 0)) == (255, 255, 255)
+
+    def test_submit_and_executor(self):
+        """Test the thread pool paths."""
+        preprocessor = ImagePreprocessor(max_dimension=50)
+        assert open_image(preprocessor.submit(make_jpeg()).result(timeout=5)).size == (50, 38)
+        preprocessor.close()
+        with ThreadPoolExecutor(1) as pool:
+            assert open_image(ImagePreprocessor(max_dimension=50, executor=pool).run(make_jpeg())).size == (50, 38)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ImagePreprocessor(quality=50, min_quality=70)
+        with pytest.raises(ValueError):
+            ImagePreprocessor(format='GIF')
+
+
+class TestClientPreprocessing:
+    """Test preprocessing in the upload path."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_upload_is_preprocessed(self, mock_post, tmp_path):
+        """Test that file inputs are preprocessed before the multipart upload."""
+        bodies = []
+
+        def post(url, data=None, **kwargs):
+            bodies.append(data.read())
+            response = MagicMock(status_code=200, headers={})
+            response.json.return_value = {"error": "", "info": {"upscaled_image": ""}}
+            return response
+
+        mock_post.side_effect = post
+        path = tmp_path / 'photo.jpg'
+        original = make_jpeg((400, 300), orientation=6)
+        path.write_bytes(original)
+        client = Decor8AI(api_key="test-key", preprocessor=ImagePreprocessor(max_dimension=200))
+
+        client.upscale_image(str(path))
+
+        expected = ImagePreprocessor(max_dimension=200).process(original)
+        assert expected in bodies[0]
+        assert b'PhoneMaker' not in bodies[0]
+
+    def test_async_upload_is_preprocessed(self):
+        httpx = pytest.importorskip("httpx")
+        from decor8ai import AsyncDecor8AI
+
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.read())
+            return httpx.Response(200, json={"error": "", "info": {"upscaled_image": ""}})
+
+        async def run():
+            client = AsyncDecor8AI(api_key="test-key", preprocessor=ImagePreprocessor(max_dimension=200))
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                await client.upscale_image(make_jpeg((400, 300)))
+
+        asyncio.run(run())
+        assert ImagePreprocessor(max_dimension=200).process(make_jpeg((400, 300))) in bodies[0]
@@ -0,0 +1,127 @@
+"""Unit tests for client-side rate limiting.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_ratelimit.py -v
+"""
+
+import multiprocessing
+import os
+import queue
+from unittest.mock import patch
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, RateLimiter
+from decor8ai.ratelimit import FileTokenBucket, TokenBucket
+
+_FORK = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+
+
+def _reserve_many(bucket, count, results):
+    results.put([bucket.reserve() for _ in range(count)])
+
+
+class TestTokenBucket:
+    """Test the in-process token bucket."""
+
+    def test_burst_then_wait(self):
+        """Test that the burst is free and further tokens are scheduled at `rate`."""
+        bucket = TokenBucket(rate=10, burst=2)
+        with patch('decor8ai.ratelimit.time.monotonic', return_value=100.0):
+            bucket._updated = 100.0
+            waits = [bucket.reserve() for _ in range(4)]
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1)
+        assert waits[3] == pytest.approx(0.2)
+
+    def test_refill(self):
+        """Test that tokens refill over time up to the burst size."""
+        bucket = TokenBucket(rate=1, burst=1)
+        with patch('decor8ai.ratelimit.time.monotonic') as clock:
+            clock.return_value = 0.0
+            bucket._updated = 0.0
+            assert bucket.reserve() == 0.0
+            clock.return_value = 5.0
+            assert bucket.reserve() == 0.0
+            assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_invalid_rate(self):
+        """Test that rate must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+@pytest.mark.skipif(_FORK is None, reason="requires fork")
+class TestFileTokenBucket:
+    """Test the file-backed, cross-process token bucket."""
+
+    def test_budget_shared_between_processes(self, tmp_path):
+        """Test that forked processes draw from one budget."""
+        bucket = FileTokenBucket(str(tmp_path / "global.bucket"), rate=0.001, burst=10)
+        results = _FORK.Queue()
+        workers = [_FORK.Process(target=_reserve_many, args=(bucket, 5, results)) for _ in range(4)]
+        try:
+            for worker in workers:
+                worker.start()
+            waits = [wait for _ in workers for wait in results.get(timeout=10)]
+            for worker in workers:
+                worker.join(10)
+        finally:
+            bucket.close()
+        assert len(waits) == 20
+        assert waits.count(0.0) == 10
+
+    def test_forked_child_is_excluded_by_parent_lock(self, tmp_path):
+        """Test that a child blocks while the parent holds the file lock."""
+        bucket = FileTokenBucket(str(tmp_path / "global.bucket"), rate=1, burst=1)
+        results = _FORK.Queue()
+        worker = _FORK.Process(target=_reserve_many, args=(bucket, 1, results))
+        bucket._lock_file()
+        try:
+            worker.start()
+            with pytest.raises(queue.Empty):
+                results.get(timeout=0.5)
+        finally:
+            bucket._unlock_file()
+        try:
+            assert results.get(timeout=10) == [0.0]
+            worker.join(10)
+        finally:
+            bucket.close()
+
+
+class TestRateLimiter:
+    """Test RateLimiter and its use by the client."""
+
+    def test_per_endpoint_budget(self):
+        """Test that endpoint budgets only apply to their endpoint."""
+        limiter = RateLimiter(per_endpoint={'upscale_image': (0.001, 1)})
+        assert limiter.reserve('upscale_image') == 0.0
+        assert limiter.reserve('upscale_image') > 0
+        assert limiter.reserve('generate_designs_for_room') == 0.0
+
+    def test_unknown_endpoint(self):
+        """Test that per-endpoint budgets must name known endpoints."""
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            RateLimiter(per_endpoint={'not_an_endpoint': (1, 1)})
+
+    def test_shared_dir(self, tmp_path):
+        """Test that shared_dir creates file-backed buckets."""
+        limiter = RateLimiter(rate=1, burst=1, shared_dir=str(tmp_path))
+        assert isinstance(limiter._global, FileTokenBucket)
+        assert (tmp_path / "global.bucket").exists()
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_client_acquires_per_request(self, mock_post):
+        """Test that the client acquires a token for the endpoint before sending."""
+        mock_post.return_value.json.return_value = {"error": ""}
+        limiter = RateLimiter(rate=100)
+        client = Decor8AI(api_key="test-key", rate_limiter=limiter)
+
+        with patch.object(limiter, 'acquire') as mock_acquire:
+            client.remodel_bathroom("https://example.com/bathroom.jpg", "modern")
+
+        mock_acquire.assert_called_once_with('remodel_bathroom')
@@ -0,0 +1,126 @@
+"""Unit tests for typed response objects.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_results.py -v
+"""
+
+import base64
+import os
+from unittest.mock import patch
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, DesignResult, ResultImage, SavedImage
+from decor8ai.download import result_image_urls
+
+
+URL_RESPONSE = {
+    "error": "",
+    "message": "Successfully generated designs.",
+    "info": {
+        "images": [
+            {"uuid": "a1", "url": "https://cdn.example.com/a1.jpg", "width": 768, "height": 512},
+            {"uuid": "b2", "url": "https://cdn.example.com/b2.jpg", "width": 768, "height": 512},
+        ],
+        "captions": ["A modern living room"],
+    },
+}
+
+
+class TestDesignResult:
+    """Test the typed view."""
+
+    def test_typed_access(self):
+        """Test error/message/images/captions properties."""
+        result = DesignResult(URL_RESPONSE)
+        assert result.ok and result.error == ""
+        assert result.message == "Successfully generated designs."
+        assert [image.uuid for image in result.images] == ["a1", "b2"]
+        assert result.image.url == "https://cdn.example.com/a1.jpg"
+        assert result.image.width == 768
+        assert result.images[0].data is None
+        assert result.captions == ["A modern living room"]
+
+    def test_mapping_compatibility(self):
+        """Test that dict-style access to the response keeps working."""
+        result = DesignResult(URL_RESPONSE)
+        assert result['info']['images'][1]['uuid'] == "b2"
+        assert result.get('missing') is None
+        assert result == URL_RESPONSE
+        assert dict(result) == URL_RESPONSE
+        assert result_image_urls(result)[0] == ("a1", "https://cdn.example.com/a1.jpg")
+
+    def test_error_response(self):
+        """Test that error responses expose error and message uniformly."""
+        result = DesignResult({"error": "InvalidInput", "message": "Bad room type"})
+        assert not result.ok
+        assert result.error == "InvalidInput" and result.message == "Bad room type"
+        assert result.images == ()
+        assert result.image is None
+
+    def test_slots(self):
+        """Test that results carry no per-instance __dict__."""
+        result = DesignResult(URL_RESPONSE)
+        assert not hasattr(result, '__dict__')
+        assert not hasattr(result.image, '__dict__')
+
+    def test_images_built_once(self):
+        """Test that the image list is built lazily and then reused."""
+        result = DesignResult(URL_RESPONSE)
+        assert result._images is None
+        assert result.images is result.images
+
+
+class TestResultImage:
+    """Test lazy decoding of image data."""
+
+    def test_decodes_once(self):
+        """Test that base64 data is decoded on first access only and not kept alongside the bytes."""
+        raw = {"uuid": "x", "data": base64.b64encode(b"jpeg-bytes").decode()}
+        image = ResultImage(raw)
+        with patch('decor8ai.results.base64.b64decode', wraps=base64.b64decode) as decode:
+            assert image.data == b"jpeg-bytes"
+            assert image.data == b"jpeg-bytes"
+        assert decode.call_count == 1
+        assert raw["data"] == b"jpeg-bytes"
+
+    def test_upscaled_image(self):
+        """Test that upscale responses expose their image like any other."""
+        result = DesignResult({"error": "", "info": {"upscaled_image": base64.b64encode(b"big").decode()}})
+        assert result.image.data == b"big"
+        assert result['info']['upscaled_image'] == b"big"
+
+    def test_saved_image(self, tmp_path):
+        """Test that images streamed to disk are read back from their file."""
+        path = tmp_path / "image.jpg"
+        path.write_bytes(b"on-disk")
+        saved = SavedImage(str(path), None, 7, 'image/jpeg')
+        image = DesignResult({"info": {"images": [{"data": saved}]}}).image
+        assert image.saved is saved
+        assert image.data == b"on-disk"
+
+
+class TestClientTypedResults:
+    """Test typed_results on the client."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_typed_results(self, mock_post):
+        """Test that typed_results=True wraps every response."""
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = URL_RESPONSE
+        client = Decor8AI(api_key="test-key", typed_results=True)
+
+        result = client.generate_designs_for_room("https://example.com/room.jpg", "livingroom", "modern")
+
+        assert isinstance(result, DesignResult)
+        assert result.image.uuid == "a1"
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_default_is_raw_dict(self, mock_post):
+        """Test that responses stay plain dicts by default."""
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = URL_RESPONSE
+        client = Decor8AI(api_key="test-key")
+
+        assert type(client.remodel_kitchen("https://example.com/k.jpg", "modern")) is dict
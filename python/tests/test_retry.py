@@ -0,0 +1,166 @@
+"""Unit tests for retry handling in the Decor8 AI SDK.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_retry.py -v
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import APIError, Decor8AI, RetryPolicy
+from decor8ai.retry import DEFAULT_RETRY_STATUSES, UNSAFE_RETRY_STATUSES, parse_retry_after
+
+
+def make_response(status_code, body=None, headers=None):
+    """Create a mock response with the given status, JSON body and headers."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    if body is None:
+        response.json.side_effect = ValueError("not json")
+        response.text = "<html>Bad Gateway</html>"
+    else:
+        response.json.return_value = body
+    return response
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy delay calculations."""
+
+    def test_backoff_is_capped(self):
+        """Test exponential growth up to backoff_cap without jitter."""
+        policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+        assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+    def test_full_jitter_range(self):
+        """Test that jittered delays stay within [0, exponential delay]."""
+        policy = RetryPolicy(backoff_base=1, backoff_cap=100)
+        delays = [policy.backoff(3) for _ in range(100)]
+        assert all(0 <= d <= 4 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_status_delay(self):
+        """Test which statuses are retried and when attempts run out."""
+        policy = RetryPolicy(max_attempts=2, jitter=False, backoff_base=1)
+        assert policy.status_delay(1, 503) == 1
+        assert policy.status_delay(1, 400) is None
+        assert policy.status_delay(2, 503) is None
+
+    def test_unsafe_statuses_are_opt_in(self):
+        """Test that 500/504 are only retried when explicitly requested."""
+        assert RetryPolicy().status_delay(1, 500) is None
+        assert RetryPolicy().status_delay(1, 504) is None
+        policy = RetryPolicy(retry_statuses=DEFAULT_RETRY_STATUSES | UNSAFE_RETRY_STATUSES)
+        assert policy.status_delay(1, 500) is not None
+
+    def test_retry_after(self):
+        """Test that Retry-After overrides backoff and is bounded by max_retry_after."""
+        policy = RetryPolicy(max_retry_after=10)
+        assert policy.status_delay(1, 429, "7") == 7
+        assert policy.status_delay(1, 429, "60") is None
+
+    def test_parse_retry_after_http_date(self):
+        """Test parsing Retry-After given as an HTTP date."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("garbage") is None
+
+    def test_invalid_max_attempts(self):
+        """Test that max_attempts must be positive."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestClientRetries:
+    """Test retries in the Decor8AI request path."""
+
+    @pytest.fixture
+    def client(self):
+        return Decor8AI(api_key="test-key", retry_policy=RetryPolicy(max_attempts=3, jitter=False))
+
+    @patch('decor8ai.client.time.sleep')
+    @patch('decor8ai.client.requests.Session.post')
+    def test_retries_transient_status(self, mock_post, mock_sleep, client):
+        """Test that 429/503 responses are retried, honouring Retry-After."""
+        ok = {"error": "", "info": {"images": []}}
+        mock_post.side_effect = [
+            make_response(429, {"error": "rate limited"}, {'Retry-After': '2'}),
+            make_response(503),
+            make_response(200, ok),
+        ]
+
+        result = client.replace_sky_behind_house("https://example.com/house.jpg", "dusk")
+
+        assert result == ok
+        assert mock_post.call_count == 3
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [2.0, 1.0]
+
+    @patch('decor8ai.client.time.sleep')
+    @patch('decor8ai.client.requests.Session.post')
+    def test_retries_connection_errors(self, mock_post, mock_sleep, client):
+        """Test that connection errors are retried for multipart endpoints too."""
+        ok = {"error": "", "info": {"upscaled_image": "abc"}}
+        mock_post.side_effect = [requests.ConnectionError("reset"), make_response(200, ok)]
+
+        assert client.upscale_image(b"image-bytes") == ok
+        assert mock_post.call_count == 2
+
+    @patch('decor8ai.client.time.sleep')
+    @patch('decor8ai.client.requests.Session.post')
+    def test_non_json_after_retries_raises(self, mock_post, mock_sleep, client):
+        """Test that a persistent non-JSON error raises APIError instead of ValueError."""
+        mock_post.return_value = make_response(502)
+
+        with pytest.raises(APIError) as excinfo:
+            client.prime_walls_for_room("https://example.com/room.jpg")
+
+        assert excinfo.value.status_code == 502
+        assert mock_post.call_count == 3
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_client_errors_not_retried(self, mock_post, client):
+        """Test that 4xx errors other than 429 are returned to the caller immediately."""
+        body = {"error": "InvalidInput", "message": "bad room_type"}
+        mock_post.return_value = make_response(400, body)
+
+        assert client.remodel_kitchen("https://example.com/kitchen.jpg", "modern") == body
+        assert mock_post.call_count == 1
+
+    @patch('decor8ai.client.time.sleep')
+    @patch('decor8ai.client.requests.Session.post')
+    def test_server_error_not_retried_by_default(self, mock_post, mock_sleep, client):
+        """Test that a 500 is not retried, as the design may already be charged."""
+        mock_post.return_value = make_response(500)
+
+        with pytest.raises(APIError):
+            client.prime_walls_for_room("https://example.com/room.jpg")
+
+        assert mock_post.call_count == 1
+
+    @patch('decor8ai.client.time.sleep')
+    @patch('decor8ai.client.requests.Session.post')
+    def test_read_timeout_not_retried_by_default(self, mock_post, mock_sleep, client):
+        """Test that a read timeout is raised without a retry unless opted in."""
+        mock_post.side_effect = requests.ReadTimeout("slow")
+
+        with pytest.raises(requests.ReadTimeout):
+            client.prime_walls_for_room("https://example.com/room.jpg")
+
+        assert mock_post.call_count == 1
+
+    @patch('decor8ai.client.time.sleep')
+    @patch('decor8ai.client.requests.Session.post')
+    def test_read_timeout_retried_when_opted_in(self, mock_post, mock_sleep):
+        """Test that retry_read_timeouts=True retries read timeouts."""
+        client = Decor8AI(api_key="test-key",
+                          retry_policy=RetryPolicy(max_attempts=3, jitter=False, retry_read_timeouts=True))
+        ok = {"error": "", "info": {"images": []}}
+        mock_post.side_effect = [requests.ReadTimeout("slow"), make_response(200, ok)]
+
+        assert client.prime_walls_for_room("https://example.com/room.jpg") == ok
+        assert mock_post.call_count == 2
@@ -0,0 +1,191 @@
+"""Unit tests for single-flight request collapsing.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_singleflight.py -v
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, RetryPolicy, SingleFlight
+
+
+RESULT = {"error": "", "info": {"images": [{"uuid": "a1", "url": "https://cdn.example.com/a1.jpg"}]}}
+
+
+def make_response(body):
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = body
+    return response
+
+
+def gated(release, calls, body=RESULT, error=None):
+    """Fake Session.post that blocks until release is set."""
+    def post(*args, **kwargs):
+        calls.append(kwargs.get('json'))
+        release.wait(5)
+        if error is not None:
+            raise error
+        return make_response(body)
+    return post
+
+
+def stage(client, seed=7, url="https://example.com/r.jpg"):
+    return client.generate_designs_for_room(url, "livingroom", "modern", seed=seed)
+
+
+class TestSingleFlight:
+    """Test the collapsing primitive."""
+
+    def test_key_for(self):
+        flights = SingleFlight(endpoints=['generate_designs_for_room'], require_seed=True)
+        assert flights.key_for('generate_designs_for_room', {'seed': 1}) is not None
+        assert flights.key_for('generate_designs_for_room', {}) is None
+        assert flights.key_for('upscale_image', {'seed': 1}) is None
+        assert flights.key_for('generate_designs_for_room', {'a': 1, 'seed': 2}) == \
+            flights.key_for('generate_designs_for_room', {'seed': 2, 'a': 1})
+
+    def test_unknown_endpoint(self):
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            SingleFlight(endpoints=['nope'])
+
+
+class TestClientSingleFlight:
+    """Test collapsing in the client request path."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_identical_requests_collapsed(self, mock_post):
+        """Test that concurrent identical requests make one API call and get equal, separate copies."""
+        release, calls = threading.Event(), []
+        mock_post.side_effect = gated(release, calls)
+        flights = SingleFlight()
+        client = Decor8AI(api_key="test-key", single_flight=flights)
+
+        with ThreadPoolExecutor(6) as pool:
+            futures = [pool.submit(stage, client) for _ in range(6)]
+            while flights.collapsed < 5:
+                threading.Event().wait(0.01)
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert len(calls) == 1
+        assert all(r == RESULT for r in results)
+        assert len({id(r) for r in results}) == 6
+        assert flights.stats() == {'calls': 1, 'collapsed': 5, 'in_flight': 0}
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_different_requests_not_collapsed(self, mock_post):
+        """Test that requests differing in any field are sent separately."""
+        mock_post.return_value = make_response(RESULT)
+        flights = SingleFlight()
+        client = Decor8AI(api_key="test-key", single_flight=flights)
+
+        stage(client, seed=1)
+        stage(client, seed=2)
+        stage(client, seed=2)  # sequential: the first has finished, so it is sent again
+
+        assert mock_post.call_count == 3
+        assert flights.collapsed == 0
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_leader_error_shared(self, mock_post):
+        """Test that followers see the leader's exception."""
+        release, calls = threading.Event(), []
+        mock_post.side_effect = gated(release, calls, error=requests.ConnectionError("refused"))
+        flights = SingleFlight()
+        client = Decor8AI(api_key="test-key", single_flight=flights, retry_policy=RetryPolicy(max_attempts=1))
+
+        with ThreadPoolExecutor(3) as pool:
+            futures = [pool.submit(stage, client) for _ in range(3)]
+            while flights.collapsed < 2:
+                threading.Event().wait(0.01)
+            release.set()
+
+            for future in futures:
+                with pytest.raises(requests.ConnectionError):
+                    future.result(timeout=5)
+        assert len(calls) == 1
+
+
+class TestAsyncSingleFlight:
+    """Test collapsing with the asyncio client."""
+
+    def test_collapses_tasks(self):
+        httpx = pytest.importorskip("httpx")
+        from decor8ai import AsyncDecor8AI
+
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=RESULT)
+
+        async def run():
+            flights = SingleFlight()
+            client = AsyncDecor8AI(api_key="test-key", single_flight=flights)
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                results = await asyncio.gather(*[stage(client) for _ in range(4)], stage(client, seed=8))
+            return flights, results
+
+        flights, results = asyncio.run(run())
+        assert len(calls) == 2
+        assert all(r == RESULT for r in results)
+        assert flights.stats() == {'calls': 2, 'collapsed': 3, 'in_flight': 0}
+
+    def test_cancelled_leader_hands_over(self):
+        """Test that cancelling the leader makes a follower take over instead of cancelling it."""
+        flights = SingleFlight()
+        calls = []
+
+        async def call(tag):
+            calls.append(tag)
+            await asyncio.sleep(0.05)
+            return {"from": tag}
+
+        async def run():
+            leader = asyncio.ensure_future(flights.do_async('k', lambda: call('leader')))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(flights.do_async('k', lambda i=i: call(f'follower{i}')))
+                         for i in range(3)]
+            await asyncio.sleep(0)
+            leader.cancel()
+            results = await asyncio.gather(*followers)
+            return leader, results
+
+        leader, results = asyncio.run(run())
+        assert leader.cancelled()
+        assert calls == ['leader', 'follower0']
+        assert results == [{"from": "follower0"}] * 3
+        assert flights.stats() == {'calls': 2, 'collapsed': 2, 'in_flight': 0}
+
+    def test_cancelled_follower_does_not_take_over(self):
+        """Test that a follower cancelled by its own caller is cancelled and the leader finishes."""
+        flights = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.05)
+            return RESULT
+
+        async def run():
+            leader = asyncio.ensure_future(flights.do_async('k', call))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flights.do_async('k', call))
+            await asyncio.sleep(0)
+            follower.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await follower
+            return await leader
+
+        assert asyncio.run(run()) == RESULT
+        assert flights.calls == 1
@@ -0,0 +1,196 @@
+"""Unit tests for streaming decode of inline base64 images.
+
+These tests use mocking to avoid making actual API calls.
+Run with: pytest test_streaming.py -v
+"""
+
+import asyncio
+import base64
+import io
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import APIError, Decor8AI, SavedImage
+from decor8ai.streaming import ImageResponseDecoder, JSONFieldStreamer, is_image_field
+
+
+JPEG = b'\xff\xd8\xff\xe0' + bytes(range(256)) * 100
+PNG = b'\x89PNG\r\n\x1a\n' + bytes(range(255, -1, -1)) * 100
+
+
+def encode(image):
+    return base64.b64encode(image).decode('ascii')
+
+
+def feed_in_pieces(decoder, body, size):
+    for i in range(0, len(body), size):
+        decoder.feed(body[i:i + size])
+
+
+class TestJSONFieldStreamer:
+    """Test the incremental scanner."""
+
+    class Sink:
+        def __init__(self):
+            self.data = b''
+
+        def write(self, chunk):
+            self.data += chunk
+
+        def finish(self):
+            return self.data
+
+        def abort(self):
+            pass
+
+    @pytest.mark.parametrize("piece_size", [1, 3, 7, 1000])
+    def test_diverts_selected_strings(self, piece_size):
+        """Test that selected strings go to sinks and the rest parses normally, for any chunking."""
+        document = {
+            "error": "",
+            "message": "Quote \" and \\ and é",
+            "info": {"images": [{"data": "abc\"/é", "uuid": "1"}, {"data": "xyz", "n": [1, 2.5, None, True]}]},
+        }
+        body = json.dumps(document).encode()
+        streamer = JSONFieldStreamer(is_image_field, lambda path: self.Sink())
+
+        feed_in_pieces(streamer, body, piece_size)
+        result = streamer.close()
+
+        assert result['message'] == document['message']
+        assert result['info']['images'][0] == {"data": "abc\"/é".encode(), "uuid": "1"}
+        assert result['info']['images'][1] == {"data": b"xyz", "n": [1, 2.5, None, True]}
+
+    def test_escaped_keys_and_non_string_targets(self):
+        """Test that escaped keys are matched and non-string values at a target path are left alone."""
+        body = b'{"info": {"upscaled\\u005fimage": "QQ==", "images": [{"data": null}]}}'
+        streamer = JSONFieldStreamer(is_image_field, lambda path: self.Sink())
+        streamer.feed(body)
+        assert streamer.close() == {"info": {"upscaled_image": b"QQ==", "images": [{"data": None}]}}
+
+    def test_truncated(self):
+        """Test that a truncated document is rejected."""
+        streamer = JSONFieldStreamer(is_image_field, lambda path: self.Sink())
+        streamer.feed(b'{"info": {"upscaled_image": "QUJD')
+        with pytest.raises(ValueError):
+            streamer.close()
+
+
+class TestImageResponseDecoder:
+    """Test decoding images to files and buffers."""
+
+    def test_writes_images_to_directory(self, tmp_path):
+        """Test that each image lands in its own file with a detected extension."""
+        body = json.dumps({"error": "", "info": {"images": [{"data": encode(JPEG)}, {"data": encode(PNG)}]}})
+        decoder = ImageResponseDecoder(str(tmp_path / "out"))
+        feed_in_pieces(decoder, body.encode(), 4099)
+        result = decoder.close()
+
+        first, second = [image['data'] for image in result['info']['images']]
+        assert isinstance(first, SavedImage)
+        assert first.path.endswith('.jpg') and first.content_type == 'image/jpeg'
+        assert second.path.endswith('.png') and second.size == len(PNG)
+        with open(first, 'rb') as f:
+            assert f.read() == JPEG
+        with open(second, 'rb') as f:
+            assert f.read() == PNG
+        assert not [name for name in os.listdir(tmp_path / "out") if name.endswith('.part')]
+
+    def test_line_wrapped_base64(self, tmp_path):
+        """Test that JSON-escaped newlines and slashes inside the base64 text are handled."""
+        text = base64.encodebytes(JPEG).decode('ascii')
+        body = json.dumps({"info": {"upscaled_image": text}}).replace('/', '\\/').encode()
+        buffer = io.BytesIO()
+        decoder = ImageResponseDecoder(buffer)
+        feed_in_pieces(decoder, body, 77)
+        image = decoder.close()['info']['upscaled_image']
+        assert buffer.getvalue() == JPEG
+        assert image.file is buffer and image.path is None
+
+    def test_buffer_rejects_multiple_images(self):
+        """Test that a single buffer cannot receive several images."""
+        body = json.dumps({"info": {"images": [{"data": "QQ=="}, {"data": "QQ=="}]}}).encode()
+        decoder = ImageResponseDecoder(io.BytesIO())
+        with pytest.raises(ValueError, match="directory"):
+            decoder.feed(body)
+
+    def test_invalid_body_removes_partial_files(self, tmp_path):
+        """Test that a truncated response leaves no files behind."""
+        decoder = ImageResponseDecoder(str(tmp_path))
+        decoder.feed(json.dumps({"info": {"upscaled_image": encode(JPEG)}}).encode()[:-10])
+        with pytest.raises(ValueError):
+            decoder.close()
+        assert os.listdir(tmp_path) == []
+
+
+def make_streamed_response(body, status_code=200):
+    """Create a mock requests response that yields body in chunks."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.iter_content.side_effect = lambda size: (body[i:i + size] for i in range(0, len(body), size))
+    return response
+
+
+class TestClientStreaming:
+    """Test output= on the upload endpoints."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_upscale_to_directory(self, mock_post, tmp_path):
+        """Test that upscale_image streams the response and returns a SavedImage."""
+        body = json.dumps({"error": "", "message": "ok", "info": {"upscaled_image": encode(JPEG)}}).encode()
+        mock_post.return_value = make_streamed_response(body)
+        client = Decor8AI(api_key="test-key")
+
+        result = client.upscale_image(b"input", scale_factor=2, output=str(tmp_path))
+
+        assert mock_post.call_args[1]['stream'] is True
+        assert result['message'] == "ok"
+        with open(result['info']['upscaled_image'], 'rb') as f:
+            assert f.read() == JPEG
+        mock_post.return_value.close.assert_called()
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_without_output_unchanged(self, mock_post):
+        """Test that responses are parsed as before when output is not given."""
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.headers = {}
+        mock_post.return_value.json.return_value = {"info": {"upscaled_image": "QQ=="}}
+        client = Decor8AI(api_key="test-key")
+
+        assert client.upscale_image(b"input")['info']['upscaled_image'] == "QQ=="
+        assert 'stream' not in mock_post.call_args[1]
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_invalid_body_raises_api_error(self, mock_post, tmp_path):
+        """Test that a non-JSON body raises APIError and leaves no files."""
+        mock_post.return_value = make_streamed_response(b"<html>Bad Gateway</html>", status_code=200)
+        client = Decor8AI(api_key="test-key")
+
+        with pytest.raises(APIError):
+            client.prime_the_room_walls(b"input", output=str(tmp_path))
+        assert os.listdir(tmp_path) == []
+
+    def test_async_client(self, tmp_path):
+        """Test that the asyncio client streams images the same way."""
+        httpx = pytest.importorskip("httpx")
+        from decor8ai import AsyncDecor8AI
+
+        body = json.dumps({"error": "", "info": {"images": [{"data": encode(PNG)}]}}).encode()
+
+        async def run():
+            client = AsyncDecor8AI(api_key="test-key")
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)))
+            async with client:
+                return await client.generate_designs(b"input", "livingroom", "modern", output=str(tmp_path))
+
+        image = asyncio.run(run())['info']['images'][0]['data']
+        assert image.content_type == 'image/png'
+        with open(image, 'rb') as f:
+            assert f.read() == PNG
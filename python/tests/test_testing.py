@@ -0,0 +1,108 @@
+"""Unit tests for the offline mock API server.
+
+These tests run against a local mock server instead of the live API.
+Run with: pytest test_testing.py -v
+"""
+
+import base64
+import os
+import random
+
+import pytest
+import requests
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import Decor8AI, RetryPolicy
+from decor8ai.constants import ENDPOINTS
+from decor8ai.testing import MULTIPART_ENDPOINTS, MockAPIProcess, MockAPIServer, lognormal, uniform
+
+
+@pytest.fixture
+def server():
+    with MockAPIServer(image_bytes=1024, seed=7) as server:
+        yield server
+
+
+class TestMockAPIServer:
+    """Test the response shapes and fault injection of MockAPIServer."""
+
+    @pytest.mark.parametrize('endpoint', [name for name in ENDPOINTS if name not in MULTIPART_ENDPOINTS])
+    def test_json_endpoints(self, server, endpoint):
+        """Test that every JSON endpoint returns hosted image URLs."""
+        response = requests.post(f"{server.url}{ENDPOINTS[endpoint]}", json={'num_images': 2})
+        assert response.status_code == 200
+        images = response.json()['info']['images']
+        assert len(images) == 2
+        assert requests.get(images[0]['url']).content == server.image
+
+    def test_multipart_endpoints(self, server):
+        """Test that the upload endpoints return base64 images through the client."""
+        client = Decor8AI(api_key="test-key", base_url=server.url)
+
+        designs = client.generate_designs(b'\xff\xd8room', 'livingroom', 'modern', num_images=3)
+        primed = client.prime_the_room_walls(b'\xff\xd8room')
+        upscaled = client.upscale_image(b'\xff\xd8room', scale_factor=2)
+
+        assert len(designs['info']['images']) == 3
+        assert base64.b64decode(primed['info']['images'][0]['data']) == server.image
+        assert base64.b64decode(upscaled['info']['upscaled_image']) == server.image
+
+    def test_missing_upload(self, server):
+        response = requests.post(f"{server.url}/upscale_image", files={'other': ('a.jpg', b'x')})
+        assert response.status_code == 400
+        assert response.json()['error'] == 'InvalidInput'
+
+    def test_unknown_path(self, server):
+        assert requests.post(f"{server.url}/nope", json={}).status_code == 404
+
+    def test_api_key(self):
+        with MockAPIServer(api_key='secret') as server:
+            assert requests.post(f"{server.url}/remodel_kitchen", json={}).status_code == 401
+            client = Decor8AI(api_key='secret', base_url=server.url)
+            assert client.remodel_kitchen('https://example.com/k.jpg', 'modern')['error'] == ''
+
+    def test_rate_limit_injection(self):
+        """Test that injected 429s carry Retry-After and are retried by the client."""
+        with MockAPIServer(rate_limit_rate=0.5, retry_after=0, seed=3) as server:
+            client = Decor8AI(
+                api_key="test-key", base_url=server.url, retry_policy=RetryPolicy(max_attempts=20, backoff_base=0)
+            )
+            for _ in range(10):
+                assert client.remodel_kitchen('https://example.com/k.jpg', 'modern')['error'] == ''
+            counts = server.stats()['endpoints']['remodel_kitchen']
+        assert counts[200] == 10
+        assert counts[429] > 0
+
+    def test_error_injection(self):
+        with MockAPIServer(error_rate=1.0) as server:
+            response = requests.post(f"{server.url}/remodel_kitchen", json={})
+        assert response.status_code == 500
+        assert response.json()['error'] == 'InternalError'
+
+    def test_latency(self):
+        with MockAPIServer(latency=0.05, endpoint_latency={'upscale_image': 0}) as server:
+            assert requests.post(f"{server.url}/remodel_kitchen", json={}).elapsed.total_seconds() >= 0.05
+
+    def test_distributions(self):
+        rng = random.Random(1)
+        assert all(0.1 <= uniform(0.1, 0.2)(rng) <= 0.2 for _ in range(100))
+        samples = sorted(lognormal(0.2)(rng) for _ in range(1001))
+        assert samples[500] == pytest.approx(0.2, rel=0.15)
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            MockAPIServer(endpoint_latency={'nope': 1})
+        with pytest.raises(ValueError):
+            MockAPIServer(error_rate=0.6, rate_limit_rate=0.6)
+
+
+class TestMockAPIProcess:
+    """Test running the mock server as a subprocess."""
+
+    def test_subprocess(self):
+        with MockAPIProcess(latency=(0.0, 0.01), image_bytes=100) as server:
+            client = Decor8AI(api_key="test-key", base_url=server.url)
+            response = client.upscale_image(b'\xff\xd8room')
+        assert len(base64.b64decode(response['info']['upscaled_image'])) == 100
@@ -0,0 +1,195 @@
+"""Unit tests for webhook receivers and submit_async().
+
+The API is mocked; callbacks are delivered to local receivers over HTTP.
+Run with: pytest test_webhooks.py -v
+"""
+
+import asyncio
+import json
+import os
+import socket
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+# Set a dummy API key for testing
+os.environ['DECOR8AI_API_KEY'] = 'test-api-key'
+
+from decor8ai import AsyncWebhookReceiver, Decor8AI, WebhookReceiver
+
+
+RESULT = {"error": "", "info": {"images": [{"uuid": "a1", "url": "https://cdn.example.com/a1.jpg"}]}}
+
+
+def post_raw(receiver, token, content_length):
+    """POST an empty body with a literal Content-Length header and return the status line."""
+    with socket.create_connection((receiver.host, receiver.port), timeout=5) as sock:
+        sock.sendall(f"POST {receiver.path}{token} HTTP/1.1\r\nHost: x\r\n"
+                     f"Content-Length: {content_length}\r\n\r\n".encode('ascii'))
+        return sock.makefile('rb').readline().decode('ascii').split(' ', 2)[1]
+
+
+def make_ack(body):
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = body
+    return response
+
+
+class TestWebhookReceiver:
+    """Test the threaded receiver."""
+
+    def test_callback_resolves_future(self):
+        """Test that a POST to the callback URL resolves the registered future."""
+        with WebhookReceiver() as receiver:
+            token, future = receiver.register()
+            assert json.loads(receiver.webhooks_data(token)) == {'url': receiver.callback_url(token)}
+
+            response = requests.post(receiver.callback_url(token), json=RESULT)
+
+            assert response.status_code == 200
+            assert future.result(timeout=5) == RESULT
+            assert receiver.pending == 0
+
+    def test_unknown_token_and_bad_body(self):
+        """Test that unknown tokens and non-JSON bodies are rejected without resolving anything."""
+        with WebhookReceiver() as receiver:
+            token, future = receiver.register()
+            assert requests.post(receiver.callback_url('forged'), json=RESULT).status_code == 404
+            assert requests.post(receiver.callback_url(token), data=b'not json').status_code == 400
+            assert requests.get(receiver.callback_url(token)).status_code == 405
+            assert not future.done()
+
+    def test_chunked_callback_rejected(self):
+        """Test that a callback without Content-Length is refused instead of resolving with {}."""
+        with WebhookReceiver() as receiver:
+            token, future = receiver.register()
+            response = requests.post(receiver.callback_url(token), data=iter([json.dumps(RESULT).encode()]))
+            assert response.status_code == 411
+            assert not future.done()
+            assert receiver.pending == 1
+
+    def test_malformed_content_length(self):
+        """Test that a non-numeric or negative Content-Length gets 400, not a handler crash."""
+        with WebhookReceiver() as receiver:
+            token, future = receiver.register()
+            assert post_raw(receiver, token, 'abc') == '400'
+            assert post_raw(receiver, token, '-1') == '400'
+            assert not future.done()
+
+    def test_overdue_callback_times_out(self):
+        """Test that a future fails with TimeoutError and is forgotten when no callback arrives."""
+        with WebhookReceiver(timeout=0.05) as receiver:
+            token, future = receiver.register()
+            with pytest.raises(TimeoutError):
+                future.result(timeout=5)
+            assert receiver.pending == 0
+            assert requests.post(receiver.callback_url(token), json=RESULT).status_code == 404
+
+    def test_public_url(self):
+        """Test that callback URLs use public_url when given."""
+        receiver = WebhookReceiver(public_url="https://hooks.example.com/")
+        assert receiver.callback_url("t") == "https://hooks.example.com/decor8ai/webhooks/t"
+
+
+class TestSubmitAsync:
+    """Test Decor8AI.submit_async()."""
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_many_outstanding(self, mock_post):
+        """Test that submissions return immediately and resolve as callbacks arrive."""
+        mock_post.return_value = make_ack({"error": "", "message": "Accepted"})
+        client = Decor8AI(api_key="test-key")
+
+        with WebhookReceiver() as receiver:
+            futures = [
+                client.submit_async('generate_designs_for_room', receiver, input_image_url=f"https://example.com/{i}.jpg",
+                                    room_type="livingroom", design_style="modern")
+                for i in range(20)
+            ]
+            assert receiver.pending == 20
+            assert not any(f.done() for f in futures)
+
+            for call in mock_post.call_args_list:
+                callback = json.loads(call[1]['json']['webhooks_data'])['url']
+                requests.post(callback, json=RESULT)
+
+            assert [f.result(timeout=5) for f in futures] == [RESULT] * 20
+
+    @patch('decor8ai.client.requests.Session.post')
+    def test_rejected_submission(self, mock_post):
+        """Test that an error response resolves the future immediately and frees the token."""
+        mock_post.return_value = make_ack({"error": "InvalidInput", "message": "bad"})
+        client = Decor8AI(api_key="test-key")
+        receiver = WebhookReceiver()
+
+        future = client.submit_async('generate_designs_for_room', receiver, input_image_url="https://example.com/r.jpg",
+                                     room_type="livingroom", design_style="modern")
+
+        assert future.result(timeout=0)['error'] == "InvalidInput"
+        assert receiver.pending == 0
+
+    def test_endpoint_without_webhooks(self):
+        """Test that endpoints without webhooks_data are rejected."""
+        client = Decor8AI(api_key="test-key")
+        with pytest.raises(ValueError, match="webhooks_data"):
+            client.submit_async('remodel_kitchen', WebhookReceiver(), input_image_url="x", design_style="modern")
+
+
+class TestAsyncWebhooks:
+    """Test the asyncio receiver with AsyncDecor8AI."""
+
+    def test_submit_and_receive(self):
+        httpx = pytest.importorskip("httpx")
+        from decor8ai import AsyncDecor8AI
+
+        sent = []
+
+        def handler(request):
+            sent.append(json.loads(request.content))
+            return httpx.Response(200, json={"error": "", "message": "Accepted"})
+
+        async def run():
+            client = AsyncDecor8AI(api_key="test-key")
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client, AsyncWebhookReceiver() as receiver:
+                future = await client.submit_async('generate_designs_for_room', receiver,
+                                                   input_image_url="https://example.com/r.jpg",
+                                                   room_type="livingroom", design_style="modern")
+                callback = json.loads(sent[0]['webhooks_data'])['url']
+                async with httpx.AsyncClient() as http:
+                    assert (await http.post(callback, json=RESULT)).status_code == 200
+                    assert (await http.post(callback, json=RESULT)).status_code == 404
+                return await asyncio.wait_for(future, 5)
+
+        assert asyncio.run(run()) == RESULT
+
+    def test_chunked_callback_rejected_and_timeout(self):
+        """Test that the asyncio receiver refuses chunked callbacks and expires overdue ones."""
+        httpx = pytest.importorskip("httpx")
+
+        async def chunks():
+            yield json.dumps(RESULT).encode()
+
+        async def run():
+            async with AsyncWebhookReceiver(timeout=0.05) as receiver:
+                token, future = receiver.register()
+                async with httpx.AsyncClient() as http:
+                    response = await http.post(receiver.callback_url(token), content=chunks())
+                assert response.status_code == 411
+                with pytest.raises(TimeoutError):
+                    await asyncio.wait_for(asyncio.wrap_future(future), 5)
+                return receiver.pending
+
+        assert asyncio.run(run()) == 0
+
+    def test_malformed_content_length(self):
+        """Test that the asyncio receiver answers a bad Content-Length with 400."""
+        async def run():
+            async with AsyncWebhookReceiver() as receiver:
+                token, future = receiver.register()
+                statuses = [await asyncio.to_thread(post_raw, receiver, token, value)
+                            for value in ('abc', '-1')]
+                return statuses, future.done()
+
+        assert asyncio.run(run()) == (['400', '400'], False)